@@ -1,3 +1,12 @@
 __all__ = ["validate_frame", "schema_text", "SCHEMA_VERSION"]
-from .validator import validate_frame, schema_text
-SCHEMA_VERSION = "1.0.0"
+from .validator import validate_frame
+SCHEMA_VERSION = "1.1.0"
+
+
+def __getattr__(name: str):
+    # schema_text is loaded lazily by the validator module on first access.
+    if name == "schema_text":
+        from . import validator
+
+        return validator.schema_text
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
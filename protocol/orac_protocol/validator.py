@@ -1,18 +1,88 @@
+from functools import lru_cache
 from importlib.resources import files
 import json
-from jsonschema import Draft202012Validator
+import fastjsonschema
 
-# Load the bundled schema text (keeps it inside the wheel)
-_schema_path = files("orac_protocol.resources.json_schema").joinpath("protocol.schema.json")
-schema_text = _schema_path.read_text(encoding="utf-8")
-_schema = json.loads(schema_text)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Schema loading and validator compilation are deferred to first use so that
+# importing orac_protocol stays cheap for tools that never validate a frame.
+
+
+@lru_cache(maxsize=1)
+def _get_schema_text() -> str:
+    """Load the bundled schema text (keeps it inside the wheel)."""
+    schema_path = files("orac_protocol.resources.json_schema").joinpath("protocol.schema.json")
+    return schema_path.read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=1)
+def _get_schema() -> dict:
+    """Parse the bundled schema, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(_get_schema_text())
+    return json.loads(_get_schema_text())
+
+
+@lru_cache(maxsize=1)
+def _get_fast_validator():
+    """Return the code-generated validator, or None if the schema cannot be compiled.
+
+    Formats are not asserted, matching the jsonschema default.
+    """
+    try:
+        return fastjsonschema.compile(_get_schema(), use_formats=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_registry():
+    """Return the shared referencing registry holding the bundled schema.
+
+    Further protocol schemas should be added here once, so every validator
+    built from the registry shares their parsed resources and $ref lookups.
+    """
+    from referencing import Registry, Resource
+
+    schema = _get_schema()
+    return Registry().with_resource(schema["$id"], Resource.from_contents(schema))
+
+
+@lru_cache(maxsize=1)
+def _get_validator():
+    """Return the interpretive fallback validator, bound to the shared registry."""
+    from jsonschema.validators import validator_for
+
+    schema = _get_schema()
+    return validator_for(schema)(schema, registry=_get_registry())
+
+
+def __getattr__(name: str):
+    if name == "schema_text":
+        return _get_schema_text()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-_validator = Draft202012Validator(_schema)
 
 def validate_frame(obj: dict) -> None:
     """Validate a message against the Orac protocol schema."""
-    errors = sorted(_validator.iter_errors(obj), key=lambda e: e.path)
-    if errors:
-        msgs = [f"{'/'.join(map(str, e.path))}: {e.message}" for e in errors]
-        raise ValueError("Protocol validation failed: " + "; ".join(msgs))
-
+    fast_validate = _get_fast_validator()
+    if fast_validate is not None:
+        try:
+            fast_validate(obj)
+        except fastjsonschema.JsonSchemaValueException as e:
+            # Drop the leading "data" root so paths match the jsonschema report.
+            path = "/".join(map(str, e.path[1:]))
+            raise ValueError(f"Protocol validation failed: {path}: {e.message}") from None
+        return
+    validator = _get_validator()
+    # Valid frames are the common case: stop at the first error (if any)
+    # before paying for the full, sorted error report.
+    if next(validator.iter_errors(obj), None) is None:
+        return
+    errors = sorted(validator.iter_errors(obj), key=lambda e: e.path)
+    msgs = [f"{'/'.join(map(str, e.path))}: {e.message}" for e in errors]
+    raise ValueError("Protocol validation failed: " + "; ".join(msgs))
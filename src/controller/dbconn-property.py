@@ -6,14 +6,10 @@ Retrieve a specific credential property from a stored connection entry.
 import argparse
 from pathlib import Path
 from lib.connection_mgr import ConnectMgr
-from lib.config_mgr import ConfigManager
-from lib.fsutils import project_home
+from lib.config_mgr import get_project_identifier
 from lib.icons import Icons
 
-APP_HOME = project_home()
-CONFIG_FILE_PATH = APP_HOME / 'resources' / 'config' / 'orac.ini'
-conf_manager = ConfigManager(config_file_path=CONFIG_FILE_PATH)
-project_identifier = conf_manager.config_value(section='global', key='project_identifier')
+project_identifier = get_project_identifier()
 
 
 def main():
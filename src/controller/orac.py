@@ -26,8 +26,10 @@ from zoneinfo import ZoneInfo
 import yaml
 
 from model.network import OracListener
-from model.llm_connector import LLMUsageMetadata
-from lib.config_mgr import ConfigManager
+from model.llm_connector import LLMConnector, LLMUsageMetadata
+from lib import event_loop
+from lib.config_mgr import DEFAULT_CONFIG_PATH, get_config_manager
+from lib.frame_codec import loads_frame
 from lib.fsutils import project_home
 from lib.icons import Icons
 from lib.logutil import Logger
@@ -134,6 +136,11 @@ DATE_FORMAT_VALUES = {
     "DD Mon YYYY HH24:MI",
 }
 DATE_FORMAT_DEFAULT = "DD-MON-YYYY HH24:MI"
+_THINK_OPEN_RE = re.compile(r"<think>", re.I)
+_THINK_CLOSE_RE = re.compile(r"</think>", re.I)
+_THINK_BLOCK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_DATE_TIME_QUERY_STRIP_RE = re.compile(r"[^a-z0-9'\s]")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
 RUNTIME_PREFERENCE_CONFIG_RULES: tuple[_PreferenceConfigRule, ...] = (
     _PreferenceConfigRule(
         pref_key="timezone",
@@ -195,16 +202,16 @@ RUNTIME_PREFERENCE_CONFIG_RULES: tuple[_PreferenceConfigRule, ...] = (
 
 
 # --- Paths / Config -----------------------------------------------------------
-LOG_DIR = project_home() / "logs"
 APP_HOME = project_home()
+LOG_DIR = APP_HOME / "logs"
 RESOURCES_DIR = APP_HOME / "resources"
 CONFIG_DIR = RESOURCES_DIR / "config"
-CONFIG_FILE_PATH = CONFIG_DIR / "orac.ini"
+CONFIG_FILE_PATH = DEFAULT_CONFIG_PATH
 SYSTEM_PROMPT_POLICY_FILE_PATH = CONFIG_DIR / "orac_system_prompt.yaml"
 ORACLE_HOME = os.environ.get("ORACLE_HOME")
 TNS_ADMIN = RESOURCES_DIR / "tns_admin"
 
-conf_manager = ConfigManager(config_file_path=CONFIG_FILE_PATH)
+conf_manager = get_config_manager(CONFIG_FILE_PATH)
 LOG_LEVEL = conf_manager.config_value(section="logging", key="log_level", default="INFO")
 logger = Logger(log_file=LOG_DIR / "orac.log", log_level=LOG_LEVEL)
 logger.log_info(f"TNS_ADMIN={TNS_ADMIN}")
@@ -221,19 +228,22 @@ except Exception as e:
         from jsonschema import Draft202012Validator
 
         local_schema_path = APP_HOME / "protocol/orac_protocol/resources/json_schema/protocol.schema.json"
-        with local_schema_path.open("rb") as fh:
-            raw = fh.read()
-            schema_text = raw.decode("utf-8-sig")
-            first = schema_text.find("{")
-            last = schema_text.rfind("}")
-            if first != -1 and last != -1 and last > first:
-                schema_text = schema_text[first:last + 1]
-            schema = _json_for_schema.loads(schema_text)
+        schema_text = local_schema_path.read_text(encoding="utf-8-sig")
+        first = schema_text.find("{")
+        last = schema_text.rfind("}")
+        if first != -1 and last != -1 and last > first:
+            schema_text = schema_text[first:last + 1]
+        schema = _json_for_schema.loads(schema_text)
 
         _validator = Draft202012Validator(schema)
 
         def validate_frame(env_obj: dict) -> None:
-            _validator.validate(env_obj)
+            # Mirror orac_protocol: valid frames return after a single pass,
+            # invalid ones raise ValueError rather than jsonschema's type.
+            error = next(_validator.iter_errors(env_obj), None)
+            if error is not None:
+                path = "/".join(map(str, error.path))
+                raise ValueError(f"Protocol validation failed: {path}: {error.message}")
 
         PROTOCOL_VERSION = schema.get("$id", "local-schema")
         logger.log_info(f"✅ Using local protocol schema at {local_schema_path}")
@@ -397,8 +407,8 @@ def answer_local_date_time_query(prompt: str, prefs: dict) -> str | None:
         A concise local date/time answer, or ``None`` when the prompt is not a
         direct local date/time query.
     """
-    text = re.sub(r"[^a-z0-9'\s]", " ", str(prompt or "").lower())
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _DATE_TIME_QUERY_STRIP_RE.sub(" ", str(prompt or "").lower())
+    text = _WHITESPACE_RUN_RE.sub(" ", text).strip()
     if not text:
         return None
 
@@ -447,8 +457,7 @@ def answer_local_date_time_query(prompt: str, prefs: dict) -> str | None:
 
 def _load_system_prompt_policy(policy_path: Path) -> dict[str, Any]:
     """Load the Orac system prompt policy from YAML."""
-    with policy_path.open("r", encoding="utf-8") as policy_file:
-        loaded = yaml.safe_load(policy_file) or {}
+    loaded = yaml.safe_load(policy_path.read_text(encoding="utf-8")) or {}
 
     if not isinstance(loaded, dict):
         raise ValueError(
@@ -935,7 +944,12 @@ class Orac:
     """
     Orac is the AI orchestrator that routes messages to the LLM and skills system.
     """
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        model_prepared: bool = False,
+        provider_registry: ProviderRegistry | None = None,
+    ):
         logger.log_info("Instantiating Orac...")
         self._tts_worker: TtsWorker | None = None
         self._voice_cancelled_turns: set[tuple[str, str]] = set()
@@ -945,11 +959,11 @@ class Orac:
         ] = {}
         self._voice_event_subscriber_lock = threading.Lock()
         try:
-            self.config_mgr = ConfigManager(config_file_path=CONFIG_FILE_PATH)
+            self.config_mgr = get_config_manager(CONFIG_FILE_PATH)
             self.llm_service_id = self.config_mgr.config_value("service", "llm_service_id")
             self.model_name = self.config_mgr.config_value("service", "default_model_name")
             self.service_url = self.config_mgr.config_value("service", "service_url")
-            self.provider_registry = ProviderRegistry(logger=logger)
+            self.provider_registry = provider_registry or ProviderRegistry(logger=logger)
             self.enable_prompt_dump = self.config_mgr.bool_config_value("context", "enable_prompt_dump", default=False)
             self._orac_run_dir = Path(os.environ.get("ORAC_RUN_DIR", "/run/orac"))
             self._dump_context_flag = self._orac_run_dir / "dump-context.once"
@@ -1071,7 +1085,8 @@ class Orac:
             self._history_budget_reserve = int(
                 self.config_mgr.config_value('context', 'history_budget_reserve', default='300'))
 
-            self._validate_or_pull_model()
+            if not model_prepared:
+                self._validate_or_pull_model()
             try:
                 self.llm = self.provider_registry.create_connector(
                     provider_id=self.llm_service_id,
@@ -1197,6 +1212,25 @@ class Orac:
             _log_exception("Fatal error during Orac initialization", e)
             raise
 
+    @classmethod
+    async def create(cls) -> "Orac":
+        """Prepare the configured model on the event loop, then build Orac.
+
+        Model validation (including any Ollama model pull) runs in a worker
+        thread here rather than as a blocking call inside ``__init__``.
+        It still happens before construction, so the model registry sync in
+        ``__init__`` sees a freshly pulled model. The registry used for
+        validation is handed on to the instance, so its HTTP session is
+        reused rather than abandoned.
+        """
+        provider_registry = ProviderRegistry(logger=logger)
+        await provider_registry.validate_or_prepare_model_async(
+            provider_id=conf_manager.config_value("service", "llm_service_id"),
+            service_url=conf_manager.config_value("service", "service_url"),
+            model_name=conf_manager.config_value("service", "default_model_name"),
+        )
+        return cls(model_prepared=True, provider_registry=provider_registry)
+
     def _init_voice_output(self) -> None:
         """Initialise optional local voice output from Orac configuration."""
         try:
@@ -3360,6 +3394,19 @@ class Orac:
             return result
         return await asyncio.to_thread(func, *args, **kwargs)
 
+    async def _send_prompt_with_meta(
+        self,
+        llm_connector: Any,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Run a non-streaming backend call off the event loop."""
+        if isinstance(llm_connector, LLMConnector):
+            return await llm_connector.asend_prompt_with_meta(**kwargs)
+        return await self._run_blocking_retrieval_call(
+            llm_connector.send_prompt_with_meta,
+            **kwargs,
+        )
+
     def _load_model_generation_preset(
         self,
         *,
@@ -3777,13 +3824,11 @@ class Orac:
         """
         if not isinstance(text, str):
             return ""
-        if re.search(r"<think>", text, flags=re.I) and not re.search(
-            r"</think>",
-            text,
-            flags=re.I,
-        ):
-            return re.split(r"<think>", text, maxsplit=1, flags=re.I)[0].strip()
-        return re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+        if "<" not in text:
+            return text.strip()
+        if _THINK_OPEN_RE.search(text) and not _THINK_CLOSE_RE.search(text):
+            return _THINK_OPEN_RE.split(text, maxsplit=1)[0].strip()
+        return _THINK_BLOCK_RE.sub("", text).strip()
 
     # --- Session / policy helpers --------------------------------------------
     def _derive_session_id(self, meta: dict, auth_user: str) -> str:
@@ -4533,7 +4578,7 @@ class Orac:
         voice_subscription: _VoicePlaybackSubscription | None = None
 
         try:
-            req_preview = json.loads(message)
+            req_preview = loads_frame(message)
         except Exception:
             req_preview = {}
         if isinstance(req_preview, dict):
@@ -4692,7 +4737,7 @@ class Orac:
         event_sink: StreamEventSink | None = None,
     ) -> str:
         try:
-            req_env = json.loads(message)  # strict JSON
+            req_env = loads_frame(message)  # strict JSON
         except Exception as e:
             _log_exception("Failed to parse request JSON", e)
             err_env = {
@@ -4736,11 +4781,12 @@ class Orac:
                 }
                 return json.dumps(err, ensure_ascii=False)
 
-            # Schema validation after auth
+            # Schema validation after auth, before any LLM or DB work.
+            # A rejected frame is a client error, so no stack trace is logged.
             try:
                 validate_frame(req_env)
-            except Exception as e:
-                _log_exception("Request failed protocol validation", e)
+            except ValueError as e:
+                logger.log_warning(f"{Icons.warn} Request failed protocol validation: {e}")
                 err = {
                     "v": 1, "type": "response", "id": new_id("res"),
                     "reply_to": req_env.get("id"), "ts": iso_now(),
@@ -6209,6 +6255,7 @@ class Orac:
             tokens_used: int | None = None
             stream_emitted_delta = False
             stream_cancelled = False
+            reasoning_stripped_in_stream = False
             voice_session_id = incoming_voice_session_id
             voice_turn_id = str(req_env.get("id") or "")
 
@@ -6234,6 +6281,7 @@ class Orac:
                 reasoning_filter = (
                     ReasoningTagStreamFilter() if strip_reasoning_tags else None
                 )
+                reasoning_stripped_in_stream = reasoning_filter is not None
 
                 def _capture_stream_usage(usage: LLMUsageMetadata) -> None:
                     """Capture final token metadata from a completed stream."""
@@ -6416,7 +6464,8 @@ class Orac:
             else:
                 # === Call backend (non-streaming path) ===
                 try:
-                    prompt_result = llm_connector.send_prompt_with_meta(
+                    prompt_result = await self._send_prompt_with_meta(
+                        llm_connector,
                         prompt_type="U",
                         prompt=final_prompt,
                         stream=False,
@@ -6446,7 +6495,9 @@ class Orac:
                 tokens_used = total_tokens or None
 
             # Apply local reasoning stripping according to resolved metadata.
-            if strip_reasoning_tags:
+            # Streamed text already went through ReasoningTagStreamFilter
+            # delta by delta, so it does not need a second full-text pass.
+            if strip_reasoning_tags and not reasoning_stripped_in_stream:
                 stripped = self._strip_reasoning_tags(raw)
                 content = stripped if stripped else raw
             else:
@@ -6619,7 +6670,7 @@ class Orac:
 async def main():
     orchestrator = None
     try:
-        orchestrator = Orac()
+        orchestrator = await Orac.create()
         listener = OracListener(orchestrator=orchestrator, host="127.0.0.1", port=8765)
         await listener.start_server()
     except Exception as e:
@@ -6640,7 +6691,7 @@ if __name__ == "__main__":
     sys.excepthook = _global_excepthook
 
     try:
-        loop = asyncio.new_event_loop()
+        loop = event_loop.new_event_loop()
         asyncio.set_event_loop(loop)
 
         def _asyncio_exception_handler(loop, context):
@@ -8,7 +8,7 @@ from __future__ import annotations
 import configparser
 from pathlib import Path
 
-from lib.user_security import decrypted_user_credential
+from lib.user_security import decrypted_machine_credential
 from lib.user_security import encrypted_user_credential
 
 
@@ -58,12 +58,15 @@ class ApiKeyStore:
 
     encrypted_value = config.get(section, "api_key")
     try:
-      return decrypted_user_credential(encrypted_value)
+      api_key, stale = decrypted_machine_credential(encrypted_value)
     except Exception as exc:
       raise ApiKeyStoreError(
         f"API key resource '{section}' exists but could not be decrypted on "
         "this machine."
       ) from exc
+    if stale:
+      self.set_api_key(section, api_key)
+    return api_key
 
   def set_api_key(self, resource_name: str, api_key: str) -> None:
     """Store an encrypted API key for a resource.
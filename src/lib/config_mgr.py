@@ -7,11 +7,14 @@ __description__ = "Manages configuration via configparser with env/db overrides.
 
 from pathlib import Path
 from configparser import ConfigParser, ExtendedInterpolation
-from typing import Iterable, Tuple, Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Callable, Iterable, Tuple, Optional, Dict, Any, List
 import os
 
 from lib.fsutils import project_home
 
+DEFAULT_CONFIG_PATH = project_home() / "resources" / "config" / "orac.ini"
+
 def _expand_path(p: str) -> str:
     return os.path.expandvars(os.path.expanduser(p))
 
@@ -27,6 +30,9 @@ class ConfigManager:
       - /etc/orac/orac.ini
     """
 
+    # path -> ((st_mtime_ns, st_size), raw INI text)
+    _text_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
     def __init__(
         self,
         config_file_path: Optional[Path] = None,
@@ -54,73 +60,130 @@ class ConfigManager:
         # Load. Keep ORAC_HOME available for ExtendedInterpolation so
         # config values such as ${ORAC_HOME}/var can still be expanded
         # through ConfigParser before normal path expansion.
-        self.config = ConfigParser(
-            defaults={
-                "ORAC_HOME": os.environ.get("ORAC_HOME", str(project_home())),
-            },
-            interpolation=ExtendedInterpolation(),
+        env_overrides = self._env_overrides()
+        self.config = self._load_config(
+            orac_home=os.environ.get("ORAC_HOME", str(project_home())),
+            force_interpolation=any("$" in v for _, _, v in env_overrides),
         )
-        with open(self.config_file_path, encoding="utf-8") as f:
-            self.config.read_file(f)
 
         # Apply environment overrides (ORAC__SECTION__KEY=value)
-        self._apply_env_overrides()
+        self._apply_env_overrides(env_overrides)
 
-        # Convenience: a flattened view (last one wins)
-        self.global_substitutions: Dict[str, str] = {}
+        # Convenience: a flattened view (last one wins), plus the memo of
+        # typed values the getters fill on first use.
+        self.global_substitutions: Dict[str, str]
+        self._typed_memo: Dict[Tuple[str, str, str], Any]
         self._hydrate_dictionary()
 
     # --------------------------- core helpers ---------------------------------
-    def _apply_env_overrides(self) -> None:
+    def _load_config(self, orac_home: str, force_interpolation: bool = False) -> ConfigParser:
+        """
+        Return a private ConfigParser for the INI file.
+
+        ExtendedInterpolation is only installed when the file (or an env
+        override) contains a "$"; otherwise every get() would pay for a no-op
+        interpolation pass. Values set later via apply_db_overrides are then
+        taken literally.
+
+        The file text is cached per path and re-read only when its mtime or
+        size changes; each instance still parses its own ConfigParser.
+        """
+        raw = self._read_config_text()
+        interpolate = force_interpolation or "$" in raw
+        parsed = ConfigParser(
+            defaults={"ORAC_HOME": orac_home},
+            interpolation=ExtendedInterpolation() if interpolate else None,
+        )
+        parsed.read_string(raw, source=str(self.config_file_path))
+        return parsed
+
+    def _read_config_text(self) -> str:
+        """Return the INI text, skipping the read when the file is unchanged."""
+        st = self.config_file_path.stat()
+        cache_key = str(self.config_file_path)
+        signature = (st.st_mtime_ns, st.st_size)
+        entry = ConfigManager._text_cache.get(cache_key)
+        if entry is None or entry[0] != signature:
+            entry = (signature, self.config_file_path.read_text(encoding="utf-8"))
+            ConfigManager._text_cache[cache_key] = entry
+        return entry[1]
+
+    def _env_overrides(self) -> List[Tuple[str, str, str]]:
+        """Return (section, key, value) for each ORAC__SECTION__KEY variable."""
         prefix = self.env_prefix
-        for k, v in os.environ.items():
-            if not k.startswith(prefix):
-                continue
-            try:
-                _, section, key = k.split("__", 2)
-            except ValueError:
-                # ignore badly-formed keys
-                continue
-            section = section.lower()
-            key = key.lower()
+        # Snapshot the environment once, then filter on prefix and shape so
+        # the split below always succeeds; badly-formed keys are skipped.
+        matches = [
+            (k, v) for k, v in list(os.environ.items())
+            if k.startswith(prefix) and k.count("__") >= 2
+        ]
+        overrides: List[Tuple[str, str, str]] = []
+        for k, v in matches:
+            _, section, key = k.split("__", 2)
+            overrides.append((section.lower(), key.lower(), v))
+        return overrides
+
+    def _apply_env_overrides(self, overrides: Iterable[Tuple[str, str, str]]) -> None:
+        for section, key, v in overrides:
             if not self.config.has_section(section):
                 self.config.add_section(section)
             self.config.set(section, key, v)
 
     def _hydrate_dictionary(self) -> None:
-        self.global_substitutions.clear()
-        for section in self.config.sections():
-            for key, val in self.config.items(section):
-                self.global_substitutions[key] = val  # note: simple flatten, last one wins
+        # Simple flatten, last one wins. Built in one pass; ConfigParser values
+        # are always str, so no per-item type checks are needed.
+        config = self.config
+        self.global_substitutions = {
+            key: val for section in config.sections() for key, val in config.items(section)
+        }
+        # Typed values are coerced lazily; forget any taken from old values.
+        self._typed_memo = {}
 
     # --------------------------- typed getters --------------------------------
+    def _raw_value(self, section: str, key: str) -> Optional[str]:
+        """Return the (interpolated) value, or None when section/key is absent."""
+        try:
+            return self.config[section][key]
+        except KeyError:
+            return None
+
+    def _missing_value(self, section: str, key: str, default: Any) -> Any:
+        if default is not None:
+            return default
+        raise KeyError(f"Missing config key {section}.{key} in {self.config_file_path}")
+
+    def _typed_value(
+        self, kind: str, convert: Callable[[str], Any], section: str, key: str, default: Any
+    ) -> Any:
+        """
+        Return a key's value converted by ``convert``, memoised on first use.
+
+        Only present keys that convert cleanly are memoised; absent keys fall
+        back to ``default`` and bad values raise the usual ValueError each time.
+        """
+        memo_key = (kind, section, self.config.optionxform(key))
+        try:
+            return self._typed_memo[memo_key]
+        except KeyError:
+            pass
+        val = self._raw_value(section, key)
+        if val is None:
+            return self._missing_value(section, key, default)
+        value = convert(val)
+        self._typed_memo[memo_key] = value
+        return value
+
     def config_value(self, section: str, key: str, default: Optional[str] = None) -> str:
-        if not self.config.has_section(section) or not self.config.has_option(section, key):
-            if default is not None:
-                return default
-            raise KeyError(f"Missing config key {section}.{key} in {self.config_file_path}")
-        return self.config.get(section, key)
+        return self._typed_value("str", str, section, key, default)
 
     def bool_config_value(self, section: str, key: str, default: Optional[bool] = None) -> bool:
-        if not self.config.has_section(section) or not self.config.has_option(section, key):
-            if default is not None:
-                return default
-            raise KeyError(f"Missing config key {section}.{key} in {self.config_file_path}")
-        return self.config.getboolean(section, key)
+        return self._typed_value("bool", self.config._convert_to_boolean, section, key, default)
 
     def int_config_value(self, section: str, key: str, default: Optional[int] = None) -> int:
-        if not self.config.has_section(section) or not self.config.has_option(section, key):
-            if default is not None:
-                return default
-            raise KeyError(f"Missing config key {section}.{key} in {self.config_file_path}")
-        return self.config.getint(section, key)
+        return self._typed_value("int", int, section, key, default)
 
     def float_config_value(self, section: str, key: str, default: Optional[float] = None) -> float:
-        if not self.config.has_section(section) or not self.config.has_option(section, key):
-            if default is not None:
-                return default
-            raise KeyError(f"Missing config key {section}.{key} in {self.config_file_path}")
-        return self.config.getfloat(section, key)
+        return self._typed_value("float", float, section, key, default)
 
     def path_config_value(
         self, section: str, key: str, default: Optional[str] = None, suppress_warnings: bool = False
@@ -177,6 +240,36 @@ class ConfigManager:
     def __repr__(self) -> str:
         return f"<ConfigManager(config_file_path='{self.config_file_path}')>"
 
+
+@lru_cache(maxsize=None)
+def _shared_config_manager(config_file_path: Path) -> ConfigManager:
+    return ConfigManager(config_file_path=config_file_path)
+
+
+def get_config_manager(config_file_path: Path | str) -> ConfigManager:
+    """
+    Return the process-wide ConfigManager for config_file_path.
+
+    Module-level consumers that only read settings share one instance per
+    file, so the INI is parsed and the environment scanned once per process.
+    Build a private ConfigManager instead when db overrides will be applied.
+    """
+    return _shared_config_manager(Path(config_file_path))
+
+
+def clear_config_managers() -> None:
+    """
+    Forget the shared ConfigManagers so the next get_config_manager() call
+    re-reads its INI file. Instances already handed out keep their values.
+    """
+    _shared_config_manager.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def get_project_identifier() -> str:
+    """Return global.project_identifier from the default orac.ini (read once)."""
+    return get_config_manager(DEFAULT_CONFIG_PATH).config_value("global", "project_identifier")
+
 if __name__ == "__main__":
 
     # Example: load from default search paths
@@ -4,21 +4,28 @@ __description__ = ("Module for managing database and application connection entr
                    "variations of file are maintained. One for DSNs and another for URLs. These are auto-created (if "
                    "required) and maintained based on the resource_type initialisation parameter.")
 
-import configparser
+from contextlib import contextmanager
 import getpass
-import zipfile
-import json
-from datetime import datetime
+import os
 from pathlib import Path
+import sys
+from lib import fast_ini
 from lib.user_security import UserSecurity
 import lib.user_security as user_security
 
-MACHINE_ID = user_security.MACHINE_ID
 CRITICAL = '❌'
 INFO = 'ℹ️'
 ERROR = '❗'
 WARNING = '⚠️'
 
+# path -> ((st_mtime_ns, st_size), parsed sections)
+_PARSE_CACHE: dict[Path, tuple[tuple[int, int], dict[str, dict[str, str]]]] = {}
+
+
+def _copy_sections(sections: dict[str, dict[str, str]]) -> dict[str, dict[str, str]]:
+    return {name: dict(items) for name, items in sections.items()}
+
+
 class ConnectMgr:
     def __init__(self, project_identifier: str, resource_type: str):
         """
@@ -28,78 +35,110 @@ class ConnectMgr:
         config_pathname = Path.home() / f".{project_identifier}/{resource_type}_credentials.ini"
         self.config_pathname = config_pathname
         self.resource_type = resource_type
-        self.config = configparser.ConfigParser()
+        # Labels depend only on resource_type, so resolve them once here.
+        is_url = resource_type == 'url'
+        self._prompt_desc = 'website' if is_url else 'database'
+        self._list_type_desc = 'URL' if is_url else 'DSN/TNS'
+        self._create_type_desc = 'URL' if is_url else 'DSN'
+        self._edit_type_desc = 'website URL' if is_url else 'database DSN'
         self.user_security = UserSecurity.get(project_identifier=project_identifier, resource_type=resource_type)
-        self._ensure_config_file()
-        self.config.read(self.config_pathname)
+        created = self._ensure_config_file()
+        # Flat {section: {key: value}} view; the credential files never need
+        # configparser's interpolation or multi-line support. A file created
+        # just now is empty, so there is nothing to read back.
+        self._sections: dict[str, dict[str, str]] = {} if created else self._load_sections()
+        self._batching = False
+        self._dirty = False
 
-    def _ensure_config_file(self):
-        """Ensure the configuration file exists."""
-        if not self.config_pathname.parent.exists():
-            self.config_pathname.parent.mkdir(parents=True)
-        if not self.config_pathname.exists():
-            self.config_pathname.touch()
-            print(f"Created configuration file at {self.config_pathname}")
+    @staticmethod
+    def _file_signature(path: Path) -> tuple[int, int]:
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
 
-    def list_connections(self, inc_creds=False):
-        """List all connections."""
-        sections = self.config.sections()
-        if self.resource_type == 'url':
-            type_desc = 'website'
+    def _load_sections(self) -> dict[str, dict[str, str]]:
+        """
+        Return a private copy of the parsed credentials file, re-parsing only
+        when its mtime or size has changed since this process last saw it.
+        """
+        signature = self._file_signature(self.config_pathname)
+        cached = _PARSE_CACHE.get(self.config_pathname)
+        if cached is None or cached[0] != signature:
+            cached = (signature, fast_ini.load(self.config_pathname))
+            _PARSE_CACHE[self.config_pathname] = cached
+        return _copy_sections(cached[1])
+
+    @classmethod
+    def invalidate_cache(cls, path: Path | None = None) -> None:
+        """Forget the cached parse for path, or for every file when path is None."""
+        if path is None:
+            _PARSE_CACHE.clear()
         else:
-            type_desc = 'database'
+            _PARSE_CACHE.pop(Path(path), None)
 
-        if sections:
-            print(f"{type_desc.title()} connections:")
-            name = 'Name'
+    def _ensure_config_file(self) -> bool:
+        """
+        Ensure the configuration file exists (created owner-only, as it holds credentials).
 
-            if self.resource_type == 'url':
-                type_desc = 'URL'
+        :return: True if the (empty) file was created by this call.
+        """
+        self.config_pathname.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(self.config_pathname, os.O_CREAT | os.O_WRONLY | os.O_EXCL, 0o600)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        print(f"Created configuration file at {self.config_pathname}")
+        return True
+
+    def list_connections(self, inc_creds=False):
+        """List all connections."""
+        if not self._sections:
+            print(f"No {self._prompt_desc} connections found.")
+            return
+
+        name = 'Name'
+        under_name = "=" * 20
+        under_resource_ = "=" * 50
+        under_wallet = "=" * 60
+        # Build the whole listing and write it once, rather than a print per row.
+        lines = [
+            f"{self._prompt_desc.title()} connections:",
+            f"Pos {name:<20}  {self._list_type_desc:<50}  Wallet Pathname",
+            f"=== {under_name:<20}  {under_resource_:<20}  {under_wallet:<20}",
+        ]
+        missing_resource = f'No {self.resource_type} provided'
+        is_dsn = self.resource_type == 'dsn'
+        decrypt = self.user_security.decrypted_user_credential
+        for id, (section, items) in enumerate(self._sections.items(), start=1):
+            name = items.get('resource_id', missing_resource)
+            if inc_creds:
+                # The parsed section already holds the encrypted values, so
+                # decrypt them here rather than re-reading the file per key.
+                username = decrypt(encrypted_credential=items['username'])
+                password = decrypt(encrypted_credential=items['password'])
+                lines.append(f"  {id} {section:<20}  {name} [{username} / {password}]")
+            elif is_dsn:
+                wallet_zip_path = items.get('wallet_zip_path', 'No wallet')
+                lines.append(f"  {id} {section:<20}  {name:<50}  {wallet_zip_path}")
             else:
-                type_desc = 'DSN/TNS'
-
-            print(f"Pos {name:<20}  {type_desc:<50}  Wallet Pathname")
-            under_name = "=" * 20
-            under_resource_ = "=" * 50
-            under_wallet = "=" * 60
-            print(f"=== {under_name:<20}  {under_resource_:<20}  {under_wallet:<20}")
-            for id, section in enumerate(sections, start=1):
-
-                name = self.config[section].get('resource_id', f'No {self.resource_type} provided')
-                if inc_creds:
-                    username = self.user_security.user_credential(connection_name=section, credential_key="username")
-                    password = self.user_security.user_credential(connection_name=section, credential_key="password")
-                    print(f"  {id} {section:<20}  {name} [{username} / {password}]")
-                elif self.resource_type == 'dsn':
-                    wallet_zip_path = self.config[section].get('wallet_zip_path', 'No wallet')
-                    print(f"  {id} {section:<20}  {name:<50}  {wallet_zip_path}")
-                else:
-                    print(f"  {id} {section:<20}  {name}")
-        else:
-            print(f"No {type_desc} connections found.")
+                lines.append(f"  {id} {section:<20}  {name}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def create_connection(self, name: str):
         """Create a new connection."""
-        if self.config.has_section(name):
+        if name in self._sections:
             print(f"Connection '{name}' already exists.")
             return
 
-        if self.resource_type == 'url':
-            type_desc = 'URL'
-            prompt_desc = 'website'
-        else:
-            type_desc = 'DSN'
-            prompt_desc = 'database'
-
-        print(f"Creating {prompt_desc} saved connection '{name}'...")
+        print(f"Creating {self._prompt_desc} saved connection '{name}'...")
         username = input("Enter username: ")
         while True:
             password = getpass.getpass("Enter password: ")
             confirm_password = getpass.getpass("Re-enter password: ")
-            if password == confirm_password:
+            if user_security.secrets_match(password, confirm_password):
                 break
             print("Passwords do not match. Please try again.")
-        resource_id = input(f"Enter {type_desc}: ")
+        resource_id = input(f"Enter {self._create_type_desc}: ")
 
         wallet_zip_path = ""
         if self.resource_type == 'dsn':
@@ -124,30 +163,53 @@ class ConnectMgr:
 
         confirm = input(f"Save connection '{name}'? (y/n): ").lower()
         if confirm == 'y':
-            self.config.add_section(name)
+            self._sections[name] = {}
             self.user_security.update_named_connection(connection_dict=connection_parameters)
             print(f"Connection '{name}' created.")
         else:
             print("Creation cancelled.")
 
+    @contextmanager
+    def batch(self):
+        """
+        Defer saves until the block exits, so bulk edits rewrite the file once.
+
+        Usage:
+            with conn_mgr.batch():
+                for name in names:
+                    conn_mgr.delete_connection(name)
+        """
+        if self._batching:
+            yield self
+            return
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            if self._dirty:
+                self._save_config()
+
     def _save_config(self):
-        """Save the configuration to the file."""
-        with self.config_pathname.open('w') as config_file:
-            self.config.write(config_file)
+        """Save the configuration to the file (deferred while batching)."""
+        if self._batching:
+            self._dirty = True
+            return
+        self._dirty = False
+        fast_ini.dump(self._sections, self.config_pathname)
+        _PARSE_CACHE[self.config_pathname] = (
+            self._file_signature(self.config_pathname),
+            _copy_sections(self._sections),
+        )
 
     def delete_connection(self, connection_name: str):
         """Delete a connection."""
 
-        if self.resource_type == 'url':
-            prompt_desc = 'website'
-        else:
-            prompt_desc = 'database'
-
-        if self.config.has_section(connection_name):
+        if connection_name in self._sections:
             confirm = input(
-                f"Are you sure you want to delete the {prompt_desc} connection '{connection_name}'? (y/n): ").lower()
+                f"Are you sure you want to delete the {self._prompt_desc} connection '{connection_name}'? (y/n): ").lower()
             if confirm == 'y':
-                self.config.remove_section(connection_name)
+                del self._sections[connection_name]
                 self._save_config()
                 print(f"Connection '{connection_name}' deleted.")
             else:
@@ -157,7 +219,7 @@ class ConnectMgr:
 
     def edit_connection(self, name: str):
         """Edit an existing connection."""
-        if not self.config.has_section(name):
+        if name not in self._sections:
             print(f"Connection '{name}' does not exist.")
             return
 
@@ -167,16 +229,11 @@ class ConnectMgr:
         username = input(f"Enter username [{db_username}]: ") or db_username
         password = getpass.getpass("Enter new password (leave blank to keep current): ") or db_password
 
-        if self.resource_type == 'url':
-            type_desc = 'website URL'
-        else:
-            type_desc = 'database DSN'
-
-        resource_id = input(f"Enter {type_desc} [{self.config[name]['resource_id']}]: ") or resource_id
+        resource_id = input(f"Enter {self._edit_type_desc} [{self._sections[name]['resource_id']}]: ") or resource_id
 
         wallet_zip_path = ""
         if self.resource_type == 'dsn':
-            existing_wallet = self.config[name].get('wallet_zip_path', '')
+            existing_wallet = self._sections[name].get('wallet_zip_path', '')
             while True:
                 raw_wallet_path = input(
                     f"Enter wallet ZIP path [{existing_wallet}] (leave blank to keep current): ").strip()
@@ -204,7 +261,7 @@ class ConnectMgr:
         if confirm == 'y':
             self.user_security.update_named_connection(connection_dict=connection_parameters)
             if self.resource_type == 'dsn':
-                self.config.set(name, 'wallet_zip_path', wallet_zip_path)
+                self._sections[name]['wallet_zip_path'] = wallet_zip_path
             self._save_config()
             print(f"Connection '{name}' updated.")
         else:
@@ -222,8 +279,14 @@ class ConnectMgr:
         :param zip_password: The password to protect the ZIP file.
         :param zip_filepath: Pathname to export the zip file to.
         """
+        # Only the export path needs these; keep them off the CLI start-up path.
+        from datetime import datetime
+        import io
+        import json
+        import zipfile
+
         # Fetch the connection credentials
-        credentials_list = self.get_connection_credentials(connection_name, encryption_key=MACHINE_ID)
+        credentials_list = self.get_connection_credentials(connection_name)
         wallet_zip_path = self.user_security.connection_property(connection_name=connection_name,
                                                                  property_key='wallet_zip_path', default_value='')
 
@@ -240,35 +303,37 @@ class ConnectMgr:
             "connections": credentials_list
         }
 
-        # Convert the structured data to JSON
-        credentials_json = json.dumps(export_data, indent=4)
-
-        # Write to ZIP file.
+        # Stream the JSON straight into the ZIP member, rather than building
+        # the whole document as a string and copying it in.
         with zipfile.ZipFile(zip_filepath, mode='w', compression=zipfile.ZIP_DEFLATED) as zipf:
-            zipf.writestr(f"{zip_filepath.stem}.json", credentials_json)  # Write JSON content to the ZIP file
+            with zipf.open(f"{zip_filepath.stem}.json", mode='w') as member, \
+                    io.TextIOWrapper(member, encoding='utf-8') as json_file:
+                json.dump(export_data, json_file, indent=4)
 
         print(f"Credentials exported and saved to {zip_filepath}.")
 
-    def get_connection_credentials(self, connection_name: str, encryption_key=MACHINE_ID) -> list:
+    def get_connection_credentials(self, connection_name: str, encryption_key: str = None) -> list:
         """
         Fetch and decrypt credentials for the given connection name or for all connections.
 
         :param connection_name: The name of the connection, or '*' to get all connections.
-        :param encryption_key: The password to encrypt credentials.
+        :param encryption_key: The password to encrypt credentials (defaults to the machine id).
         :return: A list of dictionaries with the connection credentials.
         """
         credentials_list = []
+        # Derive the export key once; every credential below is encrypted with it.
+        export_key = user_security.derived_encryption_key(encryption_password=encryption_key)
+        encrypt = user_security.encrypted_user_credential_with_key
+        decrypt = self.user_security.decrypted_user_credential
 
         # If '*' is specified, fetch credentials for all connections
         if connection_name == '*':
-            sections = self.config.sections()  # Get all sections from the config file
-            for section in sections:
-                username, password, resource_id = self.user_security.named_connection_creds(connection_name=section)
-
-                username = user_security.encrypted_user_credential(credential=username,
-                                                                   encryption_password=encryption_key)
-                password = user_security.encrypted_user_credential(credential=password,
-                                                                   encryption_password=encryption_key)
+            # Decrypt from the sections already parsed, rather than re-reading
+            # the credentials file once per connection.
+            for section, items in self._sections.items():
+                username = encrypt(decrypt(encrypted_credential=items['username']), export_key)
+                password = encrypt(decrypt(encrypted_credential=items['password']), export_key)
+                resource_id = items['resource_id']
 
                 credentials = {
                     "connection_name": section,
@@ -280,8 +345,8 @@ class ConnectMgr:
         else:
             # Fetch credentials for the specific connection
             username, password, resource_id = self.user_security.named_connection_creds(connection_name=connection_name)
-            username = user_security.encrypted_user_credential(credential=username, encryption_password=encryption_key)
-            password = user_security.encrypted_user_credential(credential=password, encryption_password=encryption_key)
+            username = encrypt(username, export_key)
+            password = encrypt(password, export_key)
             credentials = {
                 "connection_name": connection_name,
                 "username": username,
@@ -298,11 +363,14 @@ class ConnectMgr:
         if not path_str:
             return ""
 
-        wallet_path = Path(path_str).expanduser().resolve()
-        if not wallet_path.exists():
-            print(f"⚠ Wallet path '{wallet_path}' does not exist.")
-            return ""
+        # The suffix test is a pure string check, so reject before touching the filesystem.
+        wallet_path = Path(path_str).expanduser()
         if wallet_path.suffix.lower() != ".zip":
             print(f"⚠ Wallet path '{wallet_path}' is not a ZIP file.")
             return ""
-        return str(wallet_path)
+        # A strict resolve checks existence and canonicalises in one step.
+        try:
+            return str(wallet_path.resolve(strict=True))
+        except OSError:
+            print(f"⚠ Wallet path '{wallet_path}' does not exist.")
+            return ""
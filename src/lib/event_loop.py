@@ -0,0 +1,36 @@
+"""Event loop factory with an optional uvloop fast path."""
+# Author: Clive Bostock
+# Date: 2026-10-16
+# Description: Builds asyncio event loops on uvloop when it is installed.
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+import sys
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - depends on the installed extras
+    uvloop = None
+
+
+_T = TypeVar("_T")
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Return a new event loop, preferring uvloop where it is available.
+
+    uvloop does not support Windows, so the standard loop is used there
+    and whenever the ``fast-loop`` extra is not installed.
+    """
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run(main: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion, as ``asyncio.run`` does, on :func:`new_event_loop`."""
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        return runner.run(main)
@@ -0,0 +1,79 @@
+"""Minimal INI reader/writer for flat credential files."""
+# Author: Clive Bostock
+# Date: 2026-10-16
+# Description: Loads and saves section/key/value INI files without configparser.
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import re
+import shutil
+import tempfile
+
+
+# A section header, and a "key = value" (or "key: value") line. Comment and
+# blank lines match neither, so they drop out without a per-line branch.
+_SECTION_RE = re.compile(r"^\[([^\]\n]+)\][ \t]*$", re.M)
+_KV_RE = re.compile(r"^([^=:;#\s\[][^=:\n]*?)[ \t]*[=:][ \t]*(.*?)[ \t]*$", re.M)
+
+
+def loads(text: str) -> dict[str, dict[str, str]]:
+    """Parse INI text into ``{section: {key: value}}``.
+
+    Only the subset written by Orac is supported: sections of single-line
+    key/value pairs, with no interpolation or continuation lines. Keys are
+    lower-cased, as configparser does; lines before the first section are
+    ignored.
+
+    Args:
+        text: The INI document.
+
+    Returns:
+        dict[str, dict[str, str]]: Sections in file order, each mapping keys
+        to values.
+    """
+    headers = list(_SECTION_RE.finditer(text))
+    sections: dict[str, dict[str, str]] = {}
+    for index, header in enumerate(headers):
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+        body = text[header.end():end]
+        section = sections.setdefault(header.group(1), {})
+        section.update((key.lower(), value) for key, value in _KV_RE.findall(body))
+    return sections
+
+
+def load(path: Path) -> dict[str, dict[str, str]]:
+    """Read and parse an INI file; see :func:`loads`."""
+    return loads(Path(path).read_text(encoding="utf-8"))
+
+
+def dumps(sections: dict[str, dict[str, str]]) -> str:
+    """Render sections in the layout configparser writes."""
+    return "".join(
+        f"[{name}]\n" + "".join(f"{key} = {value}\n" for key, value in items.items()) + "\n"
+        for name, items in sections.items()
+    )
+
+
+def dump(sections: dict[str, dict[str, str]], path: Path) -> None:
+    """Atomically replace an INI file with the rendered sections.
+
+    The text is written and fsync'd to a temporary file in the same
+    directory and moved into place, so a crash mid-write never leaves a
+    truncated file. The existing file's permissions are kept.
+    """
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as handle:
+        handle.write(dumps(sections))
+        handle.flush()
+        os.fsync(handle.fileno())
+    try:
+        if path.exists():
+            shutil.copymode(path, handle.name)
+        os.replace(handle.name, path)
+    except BaseException:
+        os.unlink(handle.name)
+        raise
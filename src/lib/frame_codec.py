@@ -0,0 +1,61 @@
+"""Protocol frame JSON coding with an optional orjson fast path."""
+# Author: Clive Bostock
+# Date: 2026-10-16
+# Description: Encodes and decodes NDJSON protocol frames with orjson when it
+#   is installed.
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+
+# StreamReader buffer limit for one NDJSON frame. asyncio's 64 KiB default
+# makes readline() fail on long completions, so peers raise it to this.
+FRAME_READ_LIMIT = 16 * 1024 * 1024
+# Transport write buffer high-water mark; drain() only waits above it.
+FRAME_WRITE_HIGH_WATER = 1024 * 1024
+
+
+def loads_frame(data: str | bytes) -> Any:
+    """Decode one JSON protocol frame.
+
+    Args:
+        data: Raw frame text or UTF-8 bytes.
+
+    Returns:
+        Any: The decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the frame is not valid JSON. The orjson
+        error type subclasses it, so callers need only one except clause.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_frame(value: Any) -> bytes:
+    """Encode one JSON protocol frame as UTF-8 bytes, without a newline.
+
+    orjson writes the bytes directly; values it cannot represent (such as
+    integers wider than 64 bits) fall back to the standard library, which
+    emits the same JSON with ``ensure_ascii=False``.
+
+    Args:
+        value: The JSON-serialisable frame.
+
+    Returns:
+        bytes: The encoded frame.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
@@ -3,6 +3,8 @@ __author__ = "Clive Bostock"
 __date__ = "2025-10-07"
 __description__ = "Icon library, implemented as a Mnemonics class"
 
+from types import MappingProxyType
+
 class Icons:
     """
     Mnemonics for emoji and icon usage throughout the project.
@@ -48,9 +50,12 @@ class Icons:
 
     @classmethod
     def list_all(cls):
-        """Return a dictionary of all icons."""
-        return {
-            k: v for k, v in cls.__dict__.items()
-            if not k.startswith("__") and not callable(v)
-        }
+        """Return a read-only mapping of all icons (built once, below the class)."""
+        return cls._ALL
+
 
+# The icon set is fixed once the class body has run, so collect it a single time.
+Icons._ALL = MappingProxyType({
+    k: v for k, v in vars(Icons).items()
+    if not k.startswith("_") and isinstance(v, str)
+})
@@ -9,7 +9,7 @@ from typing import Callable, Any, Optional
 from loguru import logger as logr
 from sys import stderr
 
-from lib.config_mgr import ConfigManager
+from lib.config_mgr import get_config_manager
 from lib.fsutils import project_home
 from lib.icons import Icons
 
@@ -22,7 +22,31 @@ CONFIG_DIR = APP_HOME / "resources" / "config"
 CONFIG_FILE = CONFIG_DIR / "orac.ini"
 DEFAULT_LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
-config_manager = ConfigManager(config_file_path=CONFIG_FILE)
+config_manager = get_config_manager(CONFIG_FILE)
+
+# Icons used on every log call, bound as module globals once rather than
+# looked up on the Icons class per message.
+_INFO_ICON = Icons.info
+_IDEA_ICON = Icons.idea
+_WARN_ICON = Icons.warn
+_ERROR_ICON = Icons.error
+_CRITICAL_ICON = Icons.critical
+_BULLET_ICON = Icons.bullet
+
+# Level name -> (Loguru severity number, icon prefix) for Logger.log.
+_LEVEL_DISPATCH = {
+    "DEBUG": (logr.level("DEBUG").no, _IDEA_ICON),
+    "INFO": (logr.level("INFO").no, _INFO_ICON),
+    "WARNING": (logr.level("WARNING").no, _WARN_ICON),
+    "ERROR": (logr.level("ERROR").no, _ERROR_ICON),
+    "CRITICAL": (logr.level("CRITICAL").no, _CRITICAL_ICON),
+}
+
+# Read once at import; log_stamp runs for every stamped file name.
+_LOG_STAMPING = config_manager.bool_config_value("logging", "log_stamping", default=False)
+# When set, sinks hand records to a background writer thread, so callers on
+# the event loop never block on file or console I/O.
+_SINK_ENQUEUE = config_manager.bool_config_value("logging", "enqueue", default=False)
 
 # ----------------------------
 # Process-global config guards
@@ -90,12 +114,15 @@ class RunIDManager:
     """
     _instance: Optional["RunIDManager"] = None
     _run_id: Optional[int] = None
+    _formatted_run_id: Optional[str] = None
 
     def __new__(cls):
         """Ensures a single instance of the manager is created (Singleton pattern)."""
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._run_id = int(time.time())
+            # The Run ID never changes, so format (and validate) it just once.
+            cls._formatted_run_id = cls.format_epoch_id(str(cls._run_id))
         return cls._instance
 
     @property
@@ -105,7 +132,7 @@ class RunIDManager:
         Returns:
             str: The formatted Run ID (e.g., '25-0919-1630').
         """
-        return self.format_epoch_id(str(self._run_id))
+        return self._formatted_run_id
 
     @staticmethod
     def format_epoch_id(epoch_id: str) -> str:
@@ -141,18 +168,33 @@ def log_stamp(post_underscore: bool = True, pref_underscore: bool = False) -> st
     Returns:
         str: The timestamp string (e.g., "1632000000000_") or an empty string.
     """
-    log_stamping = config_manager.bool_config_value("logging", "log_stamping", default=False)
-    _ls = str(int(round(time.time() * 1000)))
-    if post_underscore:
-        _ls += "_"
-    if pref_underscore:
-        _ls = "_" + _ls
-    return _ls if log_stamping else ""
+    # Disabled is the common case: return before any clock or string work.
+    if not _LOG_STAMPING:
+        return ""
+    millis = time.time_ns() // 1_000_000
+    return f"{'_' if pref_underscore else ''}{millis}{'_' if post_underscore else ''}"
+
+
+def set_log_stamping(enabled: bool) -> None:
+    """Overrides the logging.log_stamping setting read at import.
+
+    Args:
+        enabled: Whether log_stamp should return timestamps.
+    """
+    global _LOG_STAMPING
+    _LOG_STAMPING = bool(enabled)
 
 
 # ---------------
 # Logger wrapper
 # ---------------
+# Shared by every sink. Include {process} to help spot cross-process writers.
+_SINK_FORMAT = (
+    "<green>{time:DD/MM/YYYY HH:mm:ss}</green> | {process} | "
+    "<level>{level:<8}</level> | <level>{message}</level>"
+)
+
+
 class Logger:
     """Process-wide singleton around Loguru configuration.
 
@@ -207,11 +249,7 @@ class Logger:
         Returns:
             str: The format string including timestamp, process ID, level, and message.
         """
-        # Include {process} to help spot cross-process writers.
-        return (
-            "<green>{time:DD/MM/YYYY HH:mm:ss}</green> | {process} | "
-            "<level>{level:<8}</level> | <level>{message}</level>"
-        )
+        return _SINK_FORMAT
 
     def _ensure_configured(self) -> None:
         """Performs the thread-safe, process-wide configuration of Loguru sinks.
@@ -244,7 +282,8 @@ class Logger:
                 Logger._file_sink_id = logr.add(
                     sink=self.log_file,
                     level=self.log_level,
-                    format=self._fmt(),
+                    format=_SINK_FORMAT,
+                    enqueue=_SINK_ENQUEUE,
                 )
                 _set_file_path(self.log_file)
                 _set_state("configured")  # important: flip early to block late joiners
@@ -262,7 +301,8 @@ class Logger:
                     Logger._stderr_sink_id = logr.add(
                         sink=stderr,
                         level=self.log_level,
-                        format=self._fmt(),
+                        format=_SINK_FORMAT,
+                        enqueue=_SINK_ENQUEUE,
                     )
                     logr.debug(f"{Icons.info} Console logging ENABLED (stderr sink active)")
                 else:
@@ -274,13 +314,41 @@ class Logger:
                 raise
 
     # Convenience wrappers
+    def is_enabled_for(self, level: str) -> bool:
+        """Returns whether any sink currently accepts the given level.
+
+        Lets hot paths skip building a message that would be discarded.
+
+        Args:
+            level: One of 'DEBUG', 'INFO', 'WARNING', 'ERROR' or 'CRITICAL'.
+
+        Returns:
+            bool: True if a message at ``level`` would be written.
+        """
+        return _LEVEL_DISPATCH[level][0] >= logr._core.min_level
+
+    def log(self, level: str, message: str, *, depth: int = 1) -> None:
+        """Logs a message at the given level, prefixed with that level's icon.
+
+        Nothing is formatted when no sink accepts the level.
+
+        Args:
+            level: One of 'DEBUG', 'INFO', 'WARNING', 'ERROR' or 'CRITICAL'.
+            message: The message string to log.
+            depth: Stack frames to skip so Loguru records the real caller.
+        """
+        level_no, icon = _LEVEL_DISPATCH[level]
+        if level_no < logr._core.min_level:
+            return
+        logr.opt(depth=depth).log(level, "{} {}", icon, message)
+
     def log_info(self, message: str) -> None:
         """Logs an INFO level message using the configured logger.
 
         Args:
             message: The message string to log.
         """
-        logr.info(f"{Icons.info} {message}")
+        self.log("INFO", message, depth=2)
 
     def log_debug(self, message: str) -> None:
         """Logs a DEBUG level message using the configured logger.
@@ -288,7 +356,7 @@ class Logger:
         Args:
             message: The message string to log.
         """
-        logr.debug(f"{Icons.idea} {message}")
+        self.log("DEBUG", message, depth=2)
 
     def log_warning(self, message: str) -> None:
         """Logs a WARNING level message using the configured logger.
@@ -296,7 +364,7 @@ class Logger:
         Args:
             message: The message string to log.
         """
-        logr.warning(f"{Icons.warn} {message}")
+        self.log("WARNING", message, depth=2)
 
     def log_error(self, message: str) -> None:
         """Logs an ERROR level message using the configured logger.
@@ -304,7 +372,7 @@ class Logger:
         Args:
             message: The message string to log.
         """
-        logr.error(f"{Icons.error} {message}")
+        self.log("ERROR", message, depth=2)
 
     def log_critical(self, message: str) -> None:
         """Logs a CRITICAL level message using the configured logger.
@@ -312,7 +380,7 @@ class Logger:
         Args:
             message: The message string to log.
         """
-        logr.critical(f"{Icons.critical} {message}")
+        self.log("CRITICAL", message, depth=2)
 
     # Change level without multiplying sinks
     def set_level(self, level: str) -> None:
@@ -331,7 +399,8 @@ class Logger:
             Logger._file_sink_id = logr.add(
                 sink=self.log_file,
                 level=self.log_level,
-                format=self._fmt(),
+                format=_SINK_FORMAT,
+                enqueue=_SINK_ENQUEUE,
             )
             # Rebuild stderr sink if present
             if self.include_stderr:
@@ -340,20 +409,33 @@ class Logger:
                 Logger._stderr_sink_id = logr.add(
                     sink=stderr,
                     level=self.log_level,
-                    format=self._fmt(),
+                    format=_SINK_FORMAT,
+                    enqueue=_SINK_ENQUEUE,
                 )
 
 
 # -------------------------
 # Decorators / trace helper
 # -------------------------
+_TRACE_LEVEL_NO = logr.level("TRACE").no
+
+
+def _trace_enabled() -> bool:
+    """Returns whether any Loguru sink currently accepts TRACE records.
+
+    Reads Loguru's running minimum sink level, so it stays correct as sinks
+    are added, removed or re-levelled (see Logger.set_level).
+    """
+    return logr._core.min_level <= _TRACE_LEVEL_NO
+
+
 def _log_trace(debug_message: str) -> None:
     """Logs an internal trace message.
 
     Args:
         debug_message: The message content to be logged at the TRACE level.
     """
-    logr.trace(f"{Icons.bullet} {debug_message}")
+    logr.trace(f"{_BULLET_ICON} {debug_message}")
 
 def log_call(func: Callable[..., Any]) -> Callable[..., Any]:
     """A decorator to log the execution and duration of a function call at TRACE level.
@@ -368,6 +450,9 @@ def log_call(func: Callable[..., Any]) -> Callable[..., Any]:
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        # No sink takes TRACE records (the usual case): skip timing and formatting.
+        if not _trace_enabled():
+            return func(*args, **kwargs)
         start = time.perf_counter()
         res = func(*args, **kwargs)
         elapsed_ms = (time.perf_counter() - start) * 1000
@@ -7,76 +7,137 @@ __description__: User/Security module. This is responsible for managing develope
                  Passwords are located to the $HOME/<sanitised_project_name>/<typ>_credentials.ini file.
 
                  Typically, <resource-type> would be a URL or a DNS/TNS.
+
+                 Any comparison of a supplied secret with another secret should go through secrets_match(), which
+                 compares in constant time, rather than ==.
 """
 
 from base64 import b64encode, b64decode
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.backends import default_backend
 from lib.framework_errors import UnsupportedPlatform
 from lib.fsutils import sanitise_dir_name
+from lib import fast_ini
 from pathlib import Path
 from lib.logutil import log_call
 
-import configparser
+import atexit
+from functools import lru_cache
+import hashlib
+import hmac
 import os
 import subprocess
 import platform
+import re
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+_IOPLATFORM_UUID_RE = re.compile(r'"IOPlatformUUID"\s*=\s*"([^"]+)"')
+
+# Prefix marking credentials whose key was derived from the machine id with
+# HKDF (see _derive_machine_key). Base64 never contains ':', so untagged (PBKDF2) values stay readable.
+_MACHINE_KEY_TAG = 'v2:'
+
+# PBKDF2 work factor for user-supplied passwords; changing it orphans stored credentials.
+_PBKDF2_ITERATIONS = 100000
+
+# The macOS machine id used to come from an awk pipeline that always failed, so untagged credentials saved on a
+# Mac were encrypted with an empty machine id. They are still read with it, and re-encrypted on the way through.
+_LEGACY_DARWIN_MACHINE_ID = ''
+
+
+def machine_id() -> str:
+    """
+    Returns this machine's identifier, the default credential encryption password.
+
+    The OS lookup runs on the first call only (see _system_id).
+    """
+    return _system_id()
+
+
+def _system_id_darwin() -> str:
+    """macOS: Fetch the platform details with ioreg and pick out the IOPlatformUUID."""
+    ioreg_cmd = subprocess.run(["ioreg", "-d2", "-c", "IOPlatformExpertDevice"],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    match = _IOPLATFORM_UUID_RE.search(ioreg_cmd.stdout.decode())
+    return match.group(1) if match else ''
+
+
+def _system_id_windows() -> str:
+    """
+    Windows: Query the SMBIOS system UUID through PowerShell.
+
+    The registry MachineGuid would avoid the PowerShell start-up, but it is a different value, and credentials
+    already saved are encrypted with this one.
+    """
+    return subprocess.run(["powershell", "(Get-CimInstance -Class Win32_ComputerSystemProduct).UUID"],
+                          capture_output=True, text=True).stdout.strip()
 
 
+def _system_id_linux() -> str:
+    """
+    Linux: Read the machine-id file.
+
+    The trailing newline is kept, since existing credentials were encrypted with the id exactly as cat printed it.
+    """
+    try:
+        return Path('/etc/machine-id').read_text()
+    except OSError:
+        return ''
+
+
+_SYSTEM_ID_READERS = {
+    'Darwin': _system_id_darwin,
+    'Windows': _system_id_windows,
+    'Linux': _system_id_linux,
+}
+
+
+@lru_cache(maxsize=1)
 def _system_id():
     """
     Retrieves a unique system identifier based on the operating system.
 
-    This function detects the operating system and then executes appropriate
-    commands to fetch a unique identifier for the system. The method of fetching
-    the identifier varies based on whether the system is macOS (Darwin), Windows,
-    or Linux. If the operating system is not one of these, a default identifier
-    is returned.
+    The platform-specific reader is picked from _SYSTEM_ID_READERS: macOS (Darwin), Windows, or Linux.
 
     Returns:
-        str: A unique system identifier or a default string if the OS is unsupported.
+        str: A unique system identifier.
+
+    Raises:
+        UnsupportedPlatform: If the operating system is not one of these.
+
+    The identifier cannot change while the process runs, so it is looked up
+    once and cached; every credential encrypt/decrypt would otherwise spawn
+    the OS commands again.
     """
-    # Determine the operating system
     operating_system = platform.system()
-
-    if operating_system == 'Darwin':
-        # macOS: Use ioreg and awk to fetch the IOPlatformUUID
-        command = "ioreg -d2 -c IOPlatformExpertDevice"
-        # Run ioreg command to get platform details
-        ioreg_cmd = subprocess.run(["ioreg", "-d2", "-c", "IOPlatformExpertDevice"],
-                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        # Run awk command to extract the IOPlatformUUID
-        # Better?: awk_cmd = subprocess.run(["awk", '-F\"', "'/IOPlatformUUID/{print $(NF-1)}'"],
-        awk_cmd = subprocess.run(["awk", '-F\"', "'/IOPlatformUUID/{print $(NF-1)}'"],
-                                 input=ioreg_cmd.stdout, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        # Decode the output to get the system UID
-        system_uid = awk_cmd.stdout.decode()
-
-    elif operating_system == 'Windows':
-        # Windows: Use wmic to get the UUID
-        # Run PowerShell command to get the system UUID
-        system_uid = subprocess.run(["powershell", "(Get-CimInstance -Class Win32_ComputerSystemProduct).UUID"],
-                                    capture_output=True, text=True).stdout.strip()
-
-    elif operating_system == 'Linux':
-        # Linux: Read the machine-id file
-        # Run cat command to read the /etc/machine-id file
-        cat_cmd = subprocess.run(["cat", "/etc/machine-id"],
-                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        # Decode the output to get the system UID
-        system_uid = cat_cmd.stdout.decode()
-
-    else:
-        # Unsupported OS: Return a default identifier
+    reader = _SYSTEM_ID_READERS.get(operating_system)
+    if reader is None:
         raise UnsupportedPlatform(operating_system)
+    return reader()
 
-    return system_uid
+
+def secrets_match(supplied: str, expected: str) -> bool:
+    """
+    Compare two secrets in constant time.
+
+    A plain == returns as soon as the strings differ, so its timing can reveal how much of a secret was guessed
+    correctly; hmac.compare_digest does not.
+
+    Args:
+        supplied (str): The secret entered or received.
+        expected (str): The secret to check it against.
+
+    Returns:
+        bool: True if the secrets are identical.
+    """
+    return hmac.compare_digest(supplied.encode(), expected.encode())
 
 
 class UserSecurity:
     _instances: dict[tuple[str, str], "UserSecurity"] = {}
+    _instances_lock = threading.Lock()
 
     @classmethod
     @log_call
@@ -85,14 +146,18 @@ class UserSecurity:
         Singleton accessor for UserSecurity instances, keyed by (project_identifier, resource_type).
         This is provided for performance reasons, helping avoid multiple instances of the class within a run,
         and enforcing the sharing of cached credentials.
+
+        Creation is double-checked under a lock, so concurrent first calls still share one instance (and so one
+        decryption cache); later calls return without taking the lock.
         """
         key = (project_identifier, resource_type)
-        if not hasattr(cls, "_instances"):
-            cls._instances = {}
-
-        if key not in cls._instances:
-            cls._instances[key] = cls(project_identifier, resource_type)
-        return cls._instances[key]
+        instance = cls._instances.get(key)
+        if instance is None:
+            with cls._instances_lock:
+                instance = cls._instances.get(key)
+                if instance is None:
+                    instance = cls._instances[key] = cls(project_identifier, resource_type)
+        return instance
 
     def __init__(self, project_identifier: str, resource_type: str = "url"):
         """Initialise a UserSec object.
@@ -110,9 +175,47 @@ class UserSecurity:
         # Here we call get_user_config_file_path to construct our path to the config file.
         # Note that get_user_config_file_path will create the required directory, based on
         # the sanitised project name, under the user's home directory if required.
-        self.user_config_file_path = Path(self._get_user_config_file_path())
+        self.user_config_file_path = self._get_user_config_file_path()
+        # Parsed credentials file ({section: {key: value}}), reused until the file's mtime or size changes.
+        self._sections = None
+        self._sections_signature = None
         self._create_user_credentials_file()
-        self._decryption_cache = {}
+        # Decrypted credentials, keyed by (encrypted_credential, encryption_password). Bounded, so a long-lived
+        # process does not accumulate plaintext; clear_cache() drops it outright (e.g. on logout).
+        self._decrypt_cached = lru_cache(maxsize=128)(decrypted_user_credential)
+
+    def _file_signature(self) -> tuple[int, int] | None:
+        """Return the credentials file's (mtime_ns, size), or None if it does not exist."""
+        try:
+            st = self.user_config_file_path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load_sections(self) -> dict[str, dict[str, str]]:
+        """
+        Return the parsed credentials file, re-reading it only when it has changed on disk.
+
+        The file holds nothing but sections of single-line key/value pairs, so it is read with fast_ini rather than
+        configparser. A missing file yields no sections and leaves _sections_signature as None; callers that
+        require the file check that rather than stat-ing it again.
+        """
+        signature = self._file_signature()
+        if self._sections is None or signature != self._sections_signature:
+            self._sections = fast_ini.load(self.user_config_file_path) if signature is not None else {}
+            self._sections_signature = signature
+        return self._sections
+
+    def _save_sections(self, sections: dict[str, dict[str, str]]) -> None:
+        """
+        Write sections to the credentials file and keep them as the cached parse.
+
+        The file is replaced atomically and keeps its permissions (see fast_ini.dump); a new file is created owner
+        read/write only.
+        """
+        fast_ini.dump(sections, self.user_config_file_path)
+        self._sections = sections
+        self._sections_signature = self._file_signature()
 
     @log_call
     def connection_property(self, connection_name: str, property_key: str, default_value: str = None) -> str:
@@ -129,16 +232,8 @@ class UserSecurity:
                                  For a missing section, it will raise NoSectionError
                                  unless you explicitly check for section existence first.
         """
-        config = configparser.ConfigParser()
-        config.read(self.user_config_file_path)
-
-        # The most robust way, checking for section existence first
-        if config.has_section(connection_name):
-            # If the section exists, try to get the option with a fallback
-            return config.get(connection_name, property_key, fallback=default_value)
-        else:
-            # If the section does not exist, return the default_value directly
-            return default_value
+        # A missing section or option both fall back to default_value; keys are stored lower-cased.
+        return self._load_sections().get(connection_name, {}).get(property_key.lower(), default_value)
 
     @log_call
     def named_connection_creds(self, connection_name: str) -> tuple[str, str, str]:
@@ -150,19 +245,14 @@ class UserSecurity:
         :raises FileNotFoundError: If the credential configuration file does not exist.
         :raises KeyError: If the connection name does not exist in the credential configuration file.
         """
-        # Check if the configuration file exists
-        if not self.user_config_file_path.exists():
+        # Load the configuration file, checking that it exists
+        sections = self._load_sections()
+        if self._sections_signature is None:
             raise FileNotFoundError(f"Configuration file '{self.user_config_file_path}' not found.")
 
-        # Load the configuration file
-        config = configparser.ConfigParser()
-        config.read(self.user_config_file_path)
-
-        # Get all valid connection names (sections in the config)
-        valid_connection_names = config.sections()
-
         # Check if the connection name exists in the configuration
-        if connection_name not in valid_connection_names:
+        if connection_name not in sections:
+            valid_connection_names = list(sections)
             valid_keys_str = ", ".join(
                 valid_connection_names) if valid_connection_names else "No connection names have been saved."
             raise KeyError(
@@ -171,9 +261,10 @@ class UserSecurity:
             )
 
         # Retrieve and decrypt the username and password
-        encrypted_username = config.get(connection_name, "username")
-        encrypted_password = config.get(connection_name, "password")
-        resource_id = config.get(connection_name, "resource_id")
+        section = sections[connection_name]
+        encrypted_username = section["username"]
+        encrypted_password = section["password"]
+        resource_id = section["resource_id"]
 
         username = self.decrypted_user_credential(encrypted_credential=encrypted_username)
         password = self.decrypted_user_credential(encrypted_credential=encrypted_password)
@@ -208,19 +299,16 @@ class UserSecurity:
         password = connection_dict.get("password")
         resource_id = connection_dict.get("resource_id")
         wallet_zip_path = connection_dict.get("wallet_zip_path", "")
-        self._create_new_connection_section(connection_name=connection_name)
-        encrypted_username = encrypted_user_credential(credential=username)
-        encrypted_password = encrypted_user_credential(credential=password)
-        self._update_credential_entry(connection_name=connection_name, credential_key="username",
-                                      credential_value=encrypted_username)
-        self._update_credential_entry(connection_name=connection_name, credential_key="password",
-                                      credential_value=encrypted_password)
-        self._update_credential_entry(connection_name=connection_name, credential_key="resource_id",
-                                      credential_value=resource_id)
-
+        entries = {
+            "username": encrypted_user_credential(credential=username),
+            "password": encrypted_user_credential(credential=password),
+            "resource_id": resource_id,
+        }
         if resource_type.upper() == "DSN":
-            self._update_credential_entry(connection_name=connection_name, credential_key="wallet_zip_path",
-                                          credential_value=wallet_zip_path)
+            entries["wallet_zip_path"] = wallet_zip_path
+
+        # One read-modify-write for the whole connection, rather than one per entry.
+        self._write_entries(connection_name=connection_name, entries=entries)
 
     @log_call
     def _create_user_credentials_file(self, new_connection_name: str | None = None) -> None:
@@ -230,16 +318,10 @@ class UserSecurity:
 
         :param new_connection_name: Initial connection name to add to the credentials config file.
         """
-        if os.path.exists(self.user_config_file_path):
+        if self.user_config_file_path.exists():
             return
 
-        config = configparser.ConfigParser()
-        if new_connection_name:
-            config.add_section(new_connection_name)
-
-        with open(str(self.user_config_file_path), 'w', encoding='utf-8') as config_file:
-            config.write(config_file)
-            config_file.close()
+        self._save_sections({new_connection_name: {}} if new_connection_name else {})
 
     @log_call
     def _create_new_connection_section(self, connection_name: str) -> None:
@@ -248,16 +330,12 @@ class UserSecurity:
 
         :param connection_name: Section to add to the config file.
         """
-        config = configparser.ConfigParser()
-
-        if not os.path.exists(self.user_config_file_path):
+        sections = self._load_sections()
+        if self._sections_signature is None:
             raise FileNotFoundError(f"The config file {self.user_config_file_path} does not exist.")
-
-        config.read(self.user_config_file_path)
-        if not config.has_section(connection_name):
-            config.add_section(connection_name)
-            with open(self.user_config_file_path, 'w') as config_file:
-                config.write(config_file)
+        if connection_name not in sections:
+            sections[connection_name] = {}
+            self._save_sections(sections)
 
     @log_call
     def _get_user_config_file_path(self) -> Path:
@@ -265,11 +343,9 @@ class UserSecurity:
         Get the full path of the config file in the directory located in the user's home directory.
         if the config_directory path doesn't exist, then create it.
         """
-        home_dir = os.path.expanduser("~")
-        config_dir_path = os.path.join(home_dir, self.config_dir_name)
-        if not os.path.exists(config_dir_path):
-            os.makedirs(config_dir_path)
-        return Path(os.path.join(config_dir_path, self.config_file_name))
+        config_dir_path = Path.home() / self.config_dir_name
+        config_dir_path.mkdir(parents=True, exist_ok=True)
+        return config_dir_path / self.config_file_name
 
     @log_call
     def _update_credential_entry(self, connection_name: str, credential_key: str, credential_value: str) -> None:
@@ -280,27 +356,33 @@ class UserSecurity:
         :param credential_key: Key to add/update in the credential config file.
         :param credential_value: Value to associate with the key.
         """
-        config = configparser.ConfigParser()
+        self._write_entries(connection_name=connection_name, entries={credential_key: credential_value})
 
-        # Read the existing configuration (if the file exists)
-        if os.path.exists(self.user_config_file_path):
-            config.read(self.user_config_file_path)
+    @log_call
+    def _write_entries(self, connection_name: str, entries: dict[str, str]) -> None:
+        """
+        Write several key/value pairs to a section of the configparser file, with a single file write.
+        The section is created if required; a message is printed for each key created or updated.
 
-        if not os.path.exists(self.user_config_file_path):
+        :param connection_name: Config file section name.
+        :param entries: Keys to add/update in the credential config file, mapped to their values.
+        """
+        sections = self._load_sections()
+        if self._sections_signature is None:
             raise FileNotFoundError(f"The config file {self.user_config_file_path} does not exist.")
 
-        if not config.has_section(connection_name):
-            config.add_section(connection_name)
+        section = sections.setdefault(connection_name, {})
 
-        if config.has_option(connection_name, credential_key):
-            print(f"Updating existing user config value for: {credential_key}")
-        else:
-            print(f"Creating user config value for: {credential_key}")
+        for credential_key, credential_value in entries.items():
+            credential_key = credential_key.lower()
+            if credential_key in section:
+                print(f"Updating existing user config value for: {credential_key}")
+            else:
+                print(f"Creating user config value for: {credential_key}")
 
-        config.set(connection_name, credential_key, credential_value)
+            section[credential_key] = credential_value
 
-        with open(self.user_config_file_path, 'w') as config_file:
-            config.write(config_file)
+        self._save_sections(sections)
 
     @log_call
     def _user_credential_value(self, connection_name: str, credential_key: str,
@@ -314,20 +396,17 @@ class UserSecurity:
         :return: Value associated with the key.
         """
 
-        config = configparser.ConfigParser()
-
-        if not os.path.exists(self.user_config_file_path):
+        sections = self._load_sections()
+        if self._sections_signature is None:
             raise FileNotFoundError(f"The config file {self.user_config_file_path} does not exist.")
 
-        config.read(self.user_config_file_path)
-
-        if not config.has_option(connection_name, credential_key) and default is not None:
-            return default
-
-        if not config.has_section(connection_name) or not config.has_option(connection_name, credential_key):
+        value = sections.get(connection_name, {}).get(credential_key.lower())
+        if value is None:
+            if default is not None:
+                return default
             raise KeyError(f"The key {credential_key} does not exist in the config file.")
 
-        return config.get(connection_name, credential_key)
+        return value
 
     @log_call
     def user_credential(self, connection_name: str, credential_key: str = 'password'):
@@ -341,6 +420,14 @@ class UserSecurity:
 
         encrypted_credential = self._user_credential_value(connection_name=connection_name,
                                                            credential_key=credential_key)
+        if _may_use_legacy_machine_id(encrypted_credential):
+            decrypted_credential, stale = decrypted_machine_credential(encrypted_credential)
+            if stale:
+                # Re-encrypt under the real machine id, so the legacy fallback is only needed once.
+                sections = self._load_sections()
+                sections[connection_name][credential_key.lower()] = encrypted_user_credential(decrypted_credential)
+                self._save_sections(sections)
+            return decrypted_credential
         decrypted_credential = self.decrypted_user_credential(encrypted_credential=encrypted_credential)
         return decrypted_credential
 
@@ -387,21 +474,24 @@ class UserSecurity:
             :return:
             :rtype:
         """
-        if encrypted_credential in self._decryption_cache:
-            return self._decryption_cache[encrypted_credential]
-
-        decrypted_credential = decrypted_user_credential(encrypted_credential=encrypted_credential,
-                                                         encryption_password=encryption_password)
+        # Always called positionally, so each credential has a single cache key; None stands for the machine id,
+        # which is fixed for the life of the process.
+        return self._decrypt_cached(encrypted_credential, encryption_password)
 
-        self._decryption_cache[encrypted_credential] = decrypted_credential
-
-        return decrypted_credential
+    def clear_cache(self) -> None:
+        """Forget every credential decrypted by this instance."""
+        self._decrypt_cached.cache_clear()
 
 
 @log_call
+@lru_cache(maxsize=256)
 def _derive_key(encryption_password: str, salt: bytes) -> bytes:
     """
-    Derives a 256-bit key from the given password and salt using PBKDF2HMAC.
+    Derives a 256-bit key from the given password and salt using PBKDF2-HMAC-SHA256.
+
+    Derived keys are memoised per (password, salt), so decrypting the same
+    stored credential again skips the 100,000 PBKDF2 iterations. The trade-off
+    is that up to 256 derived keys stay in process memory.
 
     Args:
         encryption_password (str): The password to derive the key from.
@@ -410,17 +500,59 @@ def _derive_key(encryption_password: str, salt: bytes) -> bytes:
     Returns:
         bytes: The derived 256-bit key.
     """
-    # Initialize the key derivation function with the provided parameters
-    kdf = PBKDF2HMAC(
+    # hashlib hands the whole derivation to OpenSSL's PKCS5_PBKDF2_HMAC (CPython
+    # 3.12 has no pure-Python fallback), which prepares the HMAC inner/outer pads
+    # once and uses the CPU's SHA extensions where OpenSSL detects them.
+    return hashlib.pbkdf2_hmac('sha256', encryption_password.encode(), salt, _PBKDF2_ITERATIONS, 32)
+
+
+@lru_cache(maxsize=1)
+def _machine_master_key(machine_id: str) -> bytes:
+    """
+    Returns the master key for machine-id credentials: HKDF-Extract (RFC 5869) of the machine id.
+
+    The machine id is fixed for the life of the process, so this runs once; each credential then only pays for an
+    HKDF-Expand with its own salt.
+
+    Args:
+        machine_id (str): The machine identifier to derive the key from.
+
+    Returns:
+        bytes: The 256-bit pseudorandom master key.
+    """
+    # RFC 5869: with no extract salt, a block of HashLen zero bytes is used
+    return hmac.new(bytes(32), machine_id.encode(), hashlib.sha256).digest()
+
+
+@log_call
+@lru_cache(maxsize=256)
+def _derive_machine_key(machine_id: str, salt: bytes) -> bytes:
+    """
+    Derives a 256-bit per-credential key from the machine id and salt.
+
+    PBKDF2's iteration count only slows dictionary attacks on low-entropy,
+    human-chosen passwords; a machine UUID gains nothing from it. Instead the
+    machine id is extracted once into a master key, and each credential's key
+    is an HKDF-Expand of that master key with the record's salt in the info.
+
+    Args:
+        machine_id (str): The machine identifier to derive the key from.
+        salt (bytes): The per-credential salt stored with the encrypted value.
+
+    Returns:
+        bytes: The derived 256-bit key.
+    """
+    # cryptography (and its OpenSSL bindings) is imported on first use, keeping it off the import path of
+    # callers that never touch a credential.
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDFExpand
+
+    kdf = HKDFExpand(
         algorithm=hashes.SHA256(),
         length=32,  # 256 bits
-        salt=salt,
-        iterations=100000,
-        backend=default_backend()
+        info=b'orac-credential' + salt,
     )
-    # Derive the key from the password and salt
-    key = kdf.derive(encryption_password.encode())
-    return key
+    return kdf.derive(_machine_master_key(machine_id))
 
 
 # @log_call
@@ -428,6 +560,9 @@ def encrypted_user_credential(credential: str, encryption_password: str = None)
     """The encrypted_user_password function accepts a username, or password, and returns the encrypted form,
     which is locked in (encrypted) to the user's machine.
 
+    With no encryption_password the key is derived from the machine id with HKDF, and the result is tagged with
+    _MACHINE_KEY_TAG; an explicit password keeps PBKDF2 and the untagged format.
+
     Args:
         credential (str): The plaintext credential component (username, password...).
 
@@ -441,14 +576,46 @@ def encrypted_user_credential(credential: str, encryption_password: str = None)
         :rtype:
      """
     if encryption_password is None:
-        password = _system_id()
-    else:
-        password = encryption_password
+        encrypted_password = _data_encrypt(data_to_encrypt=credential, encryption_password=machine_id(),
+                                           key_derivation=_derive_machine_key)
+        return _MACHINE_KEY_TAG + encrypted_password
 
-    encrypted_password = _data_encrypt(data_to_encrypt=credential, encryption_password=password)
+    encrypted_password = _data_encrypt(data_to_encrypt=credential, encryption_password=encryption_password)
     return encrypted_password
 
 
+def derived_encryption_key(encryption_password: str = None) -> tuple[bytes, bytes]:
+    """Run the key derivation once, for encrypting several credentials in a batch.
+
+    Each encrypted value still carries its own random IV, and it embeds the
+    salt as usual, so values produced with the shared key decrypt through
+    decrypted_user_credential unchanged.
+
+    Args:
+        encryption_password (str): If not passed, the machine_id is assumed as the encryption key.
+
+    Returns:
+        tuple[bytes, bytes]: A fresh random salt and the key derived from it.
+    """
+    password = machine_id() if encryption_password is None else encryption_password
+    salt = os.urandom(16)
+    return salt, _derive_key(password, salt)
+
+
+def encrypted_user_credential_with_key(credential: str, derived_key: tuple[bytes, bytes]) -> str:
+    """Encrypt a credential with a (salt, key) pair from derived_encryption_key.
+
+    Args:
+        credential (str): The plaintext credential component (username, password...).
+        derived_key (tuple[bytes, bytes]): The salt and key to encrypt with.
+
+    Returns:
+        str: The base64-encoded encrypted credential, including the salt, IV, tag, and ciphertext.
+    """
+    salt, key = derived_key
+    return _encrypt_with_key(data_to_encrypt=credential, salt=salt, key=key)
+
+
 @log_call
 def decrypted_user_credential(encrypted_credential: str, encryption_password: str = None) -> str:
     """The decrypted_user_credential function, accepts an encrypted username or password, previously encrypted by the
@@ -467,85 +634,171 @@ def decrypted_user_credential(encrypted_credential: str, encryption_password: st
         :rtype:
     """
     if encryption_password is None:
-        password = _system_id()
-    else:
-        password = encryption_password
+        return decrypted_machine_credential(encrypted_credential)[0]
+    return _decrypt_credential(encrypted_credential, encryption_password)
 
-    system_identifier = _system_id()
-    decrypted_credential = _data_decrypt(encrypted_data=encrypted_credential, encryption_password=password)
-    return decrypted_credential
+
+def decrypted_machine_credential(encrypted_credential: str) -> tuple[str, bool]:
+    """Decrypt a credential encrypted with the machine id, reporting whether it should be re-encrypted.
+
+    On macOS an untagged value that fails to authenticate under the machine id is retried with the empty id that
+    older releases encrypted with (see _LEGACY_DARWIN_MACHINE_ID). Callers that own the stored value should then
+    replace it with encrypted_user_credential(plaintext).
+
+    Args:
+        encrypted_credential (str): The stored credential.
+
+    Returns:
+        tuple[str, bool]: The plaintext credential, and True if it was only readable with the legacy machine id.
+    """
+    from cryptography.exceptions import InvalidTag
+
+    try:
+        return _decrypt_credential(encrypted_credential, machine_id()), False
+    except InvalidTag:
+        if not _may_use_legacy_machine_id(encrypted_credential):
+            raise
+    return _decrypt_credential(encrypted_credential, _LEGACY_DARWIN_MACHINE_ID), True
+
+
+def _may_use_legacy_machine_id(encrypted_credential: str) -> bool:
+    """Return whether a credential could have been encrypted with the empty macOS machine id."""
+    return not encrypted_credential.startswith(_MACHINE_KEY_TAG) and platform.system() == 'Darwin'
+
+
+def _decrypt_credential(encrypted_credential: str, password: str) -> str:
+    """Decrypt a tagged (HKDF) or untagged (PBKDF2) credential with the given password."""
+    if encrypted_credential.startswith(_MACHINE_KEY_TAG):
+        return _data_decrypt(encrypted_data=encrypted_credential[len(_MACHINE_KEY_TAG):],
+                             encryption_password=password, key_derivation=_derive_machine_key)
+
+    return _data_decrypt(encrypted_data=encrypted_credential, encryption_password=password)
 
 
 @log_call
-def _data_encrypt(data_to_encrypt: str, encryption_password: str) -> str:
+def _data_encrypt(data_to_encrypt: str, encryption_password: str, key_derivation=None) -> str:
     """
     Encrypts the provided data using AES-256-GCM.
 
     Args:
         data_to_encrypt (str): The plaintext data to encrypt.
         encryption_password (str): The password to derive the encryption key from.
+        key_derivation: The key derivation function; PBKDF2 (_derive_key) when not passed.
 
     Returns:
         str: The base64-encoded encrypted data, including the salt, IV, tag, and ciphertext.
     """
-    # Generate a random salt and IV
+    # Generate a random salt, and derive the encryption key from it
     salt = os.urandom(16)
-    iv = os.urandom(12)
+    key = (key_derivation or _derive_key)(encryption_password, salt)
+    return _encrypt_with_key(data_to_encrypt=data_to_encrypt, salt=salt, key=key)
 
-    # Derive the encryption key using the password and salt
-    key = _derive_key(encryption_password, salt)
 
-    # Initialize the AES-GCM encryptor with the derived key and IV
-    encryptor = Cipher(
-        algorithms.AES(key),
-        modes.GCM(iv),
-        backend=default_backend()
-    ).encryptor()
+@lru_cache(maxsize=256)
+def _aead_for(key: bytes) -> 'AESGCM':
+    """
+    Return an AES-256-GCM cipher for decrypting with a derived key, reusing it while the key stays in use.
 
-    # Encrypt the data
-    ciphertext = encryptor.update(data_to_encrypt.encode()) + encryptor.finalize()
+    Together with the derived-key caches this makes a repeat decrypt a single AES-GCM call, with no key schedule
+    set-up. Encryption does not use it: every encrypt has a fresh salt, so its key never recurs. The cache is
+    cleared at exit so cipher objects do not outlive the work that needed them.
+    """
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    return AESGCM(key)
+
+
+atexit.register(_aead_for.cache_clear)
+
+
+def _encrypt_with_key(data_to_encrypt: str, salt: bytes, key: bytes) -> str:
+    """
+    Encrypts the provided data using AES-256-GCM with an already derived key.
+
+    Args:
+        data_to_encrypt (str): The plaintext data to encrypt.
+        salt (bytes): The salt the key was derived from; stored with the result.
+        key (bytes): The derived 256-bit key.
+
+    Returns:
+        str: The base64-encoded encrypted data, including the salt, IV, tag, and ciphertext.
+    """
+    return b64encode(_encrypt_bytes_with_key(data_to_encrypt.encode(), salt=salt, key=key)).decode('ascii')
+
+
+def _encrypt_bytes_with_key(data_to_encrypt: bytes, salt: bytes, key: bytes) -> bytes:
+    """
+    Bytes core of _encrypt_with_key: encrypts data with AES-256-GCM and frames the result.
 
-    # Concatenate the salt, IV, tag, and ciphertext, and base64-encode the result
-    encrypted_result = b64encode(salt + iv + encryptor.tag + ciphertext).decode('utf-8')
-    return encrypted_result
+    Args:
+        data_to_encrypt (bytes): The plaintext data to encrypt.
+        salt (bytes): The salt the key was derived from; stored with the result.
+        key (bytes): The derived 256-bit key.
+
+    Returns:
+        bytes: The salt, IV, tag, and ciphertext, concatenated.
+    """
+    # A fresh IV per value keeps GCM safe when one key encrypts several values
+    iv = os.urandom(12)
+
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    # Encrypt the data in one AEAD call; AESGCM returns the ciphertext with the tag appended
+    sealed = AESGCM(key).encrypt(iv, data_to_encrypt, None)
+
+    # Concatenate the salt, IV, tag, and ciphertext
+    return b''.join((salt, iv, sealed[-16:], sealed[:-16]))
 
 
 @log_call
-def _data_decrypt(encrypted_data: str, encryption_password: str) -> str:
+def _data_decrypt(encrypted_data: str, encryption_password: str, key_derivation=None) -> str:
     """
     Decrypts the provided encrypted data using AES-256-GCM.
 
     Args:
         encrypted_data (str): The base64-encoded encrypted data to decrypt.
         encryption_password (str): The password to derive the decryption key from.
+        key_derivation: The key derivation function; PBKDF2 (_derive_key) when not passed.
 
     Returns:
         str: The decrypted plaintext data.
     """
-    # Base64-decode the encrypted data to extract the salt, IV, tag, and ciphertext
-    encrypted_data_bytes = b64decode(encrypted_data.encode('utf-8'))
-    salt = encrypted_data_bytes[:16]
-    iv = encrypted_data_bytes[16:28]
-    tag = encrypted_data_bytes[28:44]
-    ciphertext = encrypted_data_bytes[44:]
+    # b64decode accepts the ASCII text directly, so there is no separate encode step
+    return _data_decrypt_bytes(b64decode(encrypted_data), encryption_password,
+                               key_derivation=key_derivation).decode('utf-8')
 
-    # Derive the decryption key using the password and salt
-    key = _derive_key(encryption_password, salt)
 
-    # Initialize the AES-GCM decryptor with the derived key, IV, and tag
-    decryptor = Cipher(
-        algorithms.AES(key),
-        modes.GCM(iv, tag),
-        backend=default_backend()
-    ).decryptor()
+def _data_decrypt_bytes(encrypted_data: bytes, encryption_password: str, key_derivation=None) -> bytes:
+    """
+    Bytes core of _data_decrypt: unframes and decrypts a salt + IV + tag + ciphertext blob.
 
-    # Decrypt the data
-    decrypted_data = decryptor.update(ciphertext) + decryptor.finalize()
+    Args:
+        encrypted_data (bytes): The salt, IV, tag, and ciphertext, concatenated.
+        encryption_password (str): The password to derive the decryption key from.
+        key_derivation: The key derivation function; PBKDF2 (_derive_key) when not passed.
+
+    Returns:
+        bytes: The decrypted plaintext data.
+    """
+    salt = encrypted_data[:16]
+    iv = encrypted_data[16:28]
+    tag = encrypted_data[28:44]
+    ciphertext = encrypted_data[44:]
+
+    # Derive the decryption key using the password and salt
+    key = (key_derivation or _derive_key)(encryption_password, salt)
+
+    # Decrypt and authenticate the data; AESGCM expects the tag after the ciphertext
+    return _aead_for(key).decrypt(iv, ciphertext + tag, None)
 
-    return decrypted_data.decode('utf-8')
 
+def __getattr__(name: str):
+    # MACHINE_ID is kept for older callers; it resolves through machine_id() on
+    # first use, so importing this module does not run the OS lookup.
+    if name == "MACHINE_ID":
+        return machine_id()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-MACHINE_ID = _system_id()
 
 if __name__ == "__main__":
     # Example data_encrypt()/data_decrypt() usage:
@@ -665,8 +665,12 @@ class OracContextManager:
             return []
 
         role_filter = "" if include_system else "and role <> 'system'"
+        binds: Dict[str, Any] = {"cid": cid}
 
         if limit and limit > 0:
+            # The row limit is bound rather than inlined, so every limit shares one
+            # cached statement instead of hard-parsing a new one per value.
+            binds["lim"] = int(limit)
             sql = f"""
                 select turn_index, role, content, tokens_used, meta, created_on
                   from (
@@ -675,7 +679,7 @@ class OracContextManager:
                      where conversation_id = :cid
                        {role_filter}
                      order by turn_index desc
-                     fetch first {int(limit)} rows only
+                     fetch first :lim rows only
                   )
                  order by turn_index
             """
@@ -687,7 +691,7 @@ class OracContextManager:
                    {role_filter}
                  order by turn_index
             """
-        rows = self.db.dict_sql_dataset(sql, {"cid": cid})
+        rows = self.db.dict_sql_dataset(sql, binds)
         # Ensure JSON comes back as Python objects
         for r in rows:
             # Depending on driver, JSON may already be dicts; be defensive:
@@ -735,23 +739,17 @@ class OracContextManager:
         if not cid:
             return 0
 
-        # find threshold turn_index
-        rows = self.db.fetch_as_lists(
-            f"select max(turn_index) from {self.messages_object} where conversation_id = :cid",
-            {"cid": cid}
-        )
-        max_ti = int(rows[0][0]) if rows and rows[0][0] is not None else 0
-        if max_ti <= keep_messages:
-            if archive_conversation:
-                self.archive_conversation(session_id)
-            return 0
-
-        cutoff = max_ti - keep_messages
+        # One server-side statement: the cutoff (max turn_index - keep) is worked out
+        # in the subquery, so there is no separate round trip to fetch it. When there
+        # are keep_messages or fewer turns the cutoff is <= 0 and nothing matches.
         with self.db.cursor() as cur:
             cur.execute(
                 f"delete from {self.messages_object} "
-                " where conversation_id = :cid and turn_index <= :cutoff",
-                {"cid": cid, "cutoff": cutoff}
+                " where conversation_id = :cid"
+                "   and turn_index <= ("
+                f"        select max(turn_index) - :keep from {self.messages_object}"
+                "          where conversation_id = :cid)",
+                {"cid": cid, "keep": keep_messages}
             )
             deleted = cur.rowcount or 0
             self.db.commit()
@@ -8,10 +8,16 @@
 from model.orac_abc import LLMConnectorABC, MODEL_SERVICE_DESCRIPTORS
 from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
+import asyncio
 from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, cast
-from lib.config_mgr import ConfigManager
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from lib.config_mgr import get_config_manager
 from lib.fsutils import project_home
 from lib.logutil import Logger
 
@@ -39,6 +45,11 @@ OLLAMA_GENERATION_KEYS = {
     "seed",
 }
 
+# Upper bound on prompts in flight for one send_prompts() batch.
+DEFAULT_BATCH_CONCURRENCY = 4
+# Upper bound on async requests in flight per connector.
+DEFAULT_MAX_INFLIGHT_REQUESTS = 4
+
 OPENAI_COMPATIBLE_GENERATION_MAP = {
     "temperature": "temperature",
     "top_p": "top_p",
@@ -46,6 +57,69 @@ OPENAI_COMPATIBLE_GENERATION_MAP = {
 }
 
 
+def _normalise_base_url(url: str) -> str:
+    """Return ``scheme://host[:port]`` for a configured service URL.
+
+    ``http://`` is assumed when no scheme is given, and any path, query or
+    fragment is dropped. Unlike ``urlparse``, ``localhost:1234`` is read as a
+    host and port rather than as a ``localhost:`` scheme.
+    """
+    url = url.strip()
+    if "://" not in url:
+        url = f"http://{url}"
+    authority_start = url.index("://") + 3
+    for index in range(authority_start, len(url)):
+        if url[index] in "/?#":
+            url = url[:index]
+            break
+    return url.rstrip("/")
+
+
+def _pooled_http_session() -> requests.Session:
+    """Return a requests session whose keep-alive pool is shared by REST probes."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across connectors, so model-list polling and Ollama chat/generate
+# calls reuse the TCP (and TLS) connection to the model service instead of
+# opening one per request.
+_HTTP = _pooled_http_session()
+
+
+@lru_cache(maxsize=None)
+def _openai_http_clients(
+    max_idle: int,
+    max_total: int,
+) -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Return the shared sync/async httpx clients for OpenAI-compatible sessions.
+
+    ChatOpenAI otherwise builds its own client per connector, so each new
+    connector pays a fresh TCP/TLS handshake. Clients are cached per pool
+    settings, which in practice means one pair per process. Timeouts are not
+    set here: the OpenAI SDK passes its own timeout with every request,
+    overriding the client's, so they go to ChatOpenAI instead.
+
+    Args:
+        max_idle: Keep-alive connections retained per client.
+        max_total: Upper bound on concurrent connections per client.
+
+    Returns:
+        tuple[httpx.Client, httpx.AsyncClient]: The sync and async clients.
+    """
+    limits = httpx.Limits(
+        max_keepalive_connections=max_idle,
+        max_connections=max_total,
+    )
+    return (
+        httpx.Client(limits=limits),
+        httpx.AsyncClient(limits=limits),
+    )
+
+
 @dataclass
 class LLMUsageMetadata:
     """Token usage metadata returned by an LLM backend."""
@@ -146,6 +220,12 @@ def provider_generation_options(
     return {}
 
 
+def _message_text(raw: Any) -> str:
+    """Return the text of a LangChain message (or any other reply) as ``str``."""
+    text = raw.content if hasattr(raw, "content") else raw
+    return text if isinstance(text, str) else str(text)
+
+
 def _usage_metadata_from_result(
     result: dict[str, Any],
 ) -> LLMUsageMetadata | None:
@@ -205,7 +285,9 @@ def _usage_metadata_from_ollama_response(
 
 class LLMConnector(LLMConnectorABC):
     def __init__(self, model_service_id: str):
-        self.config_mgr = ConfigManager(config_file_path=CONFIG_FILE_PATH)
+        # Connectors only read settings, so they share the process-wide
+        # manager rather than re-loading orac.ini for every instance.
+        self.config_mgr = get_config_manager(CONFIG_FILE_PATH)
         self.llm_service_id = self.config_mgr.config_value(
             section='service', key='llm_service_id'
         )
@@ -268,17 +350,132 @@ class LLMConnector(LLMConnectorABC):
             stream=stream,
             generation_options=generation_options,
         )
-        if hasattr(raw, "content"):
-            text = raw.content
-        else:
-            text = raw
         return {
-            "text": text if isinstance(text, str) else str(text),
+            "text": _message_text(raw),
             "prompt_tokens": 0,
             "completion_tokens": 0,
             "total_tokens": 0,
         }
 
+    def _inflight_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore capping this connector's async requests."""
+        semaphore = getattr(self, "_inflight", None)
+        if semaphore is None:
+            config_mgr = getattr(self, "config_mgr", None)
+            limit = (
+                config_mgr.int_config_value(
+                    "service",
+                    "max_inflight_requests",
+                    default=DEFAULT_MAX_INFLIGHT_REQUESTS,
+                )
+                if config_mgr is not None
+                else DEFAULT_MAX_INFLIGHT_REQUESTS
+            )
+            semaphore = self._inflight = asyncio.Semaphore(max(1, limit))
+        return semaphore
+
+    async def asend_prompt_with_meta(
+        self,
+        prompt_type: str,
+        prompt: str,
+        stream: bool = False,
+        generation_options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Await ``send_prompt_with_meta`` without blocking the event loop.
+
+        The blocking HTTP call runs in a worker thread, so the listener can
+        serve other clients meanwhile; at most ``max_inflight_requests``
+        calls per connector run at once.
+        """
+        async with self._inflight_semaphore():
+            return await asyncio.to_thread(
+                self.send_prompt_with_meta,
+                prompt_type=prompt_type,
+                prompt=prompt,
+                stream=stream,
+                generation_options=generation_options,
+            )
+
+    def _batch_concurrency(self, prompt_count: int) -> int:
+        """Return the worker count for a batch of ``prompt_count`` prompts."""
+        config_mgr = getattr(self, "config_mgr", None)
+        limit = (
+            config_mgr.int_config_value(
+                "service",
+                "batch_concurrency",
+                default=DEFAULT_BATCH_CONCURRENCY,
+            )
+            if config_mgr is not None
+            else DEFAULT_BATCH_CONCURRENCY
+        )
+        return max(1, min(limit, prompt_count))
+
+    def send_prompts(
+        self,
+        prompts: list[str],
+        generation_options: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """Send independent user prompts concurrently and return the responses.
+
+        The default fans ``send_prompt`` out over a bounded thread pool, so a
+        batch costs roughly one round trip per ``batch_concurrency`` prompts
+        rather than one per prompt. Responses keep the order of ``prompts``.
+
+        Args:
+            prompts: The prompt texts to send.
+            generation_options: Options applied to every prompt.
+
+        Returns:
+            list[str]: One response per prompt.
+        """
+        if not prompts:
+            return []
+
+        def _send(prompt: str) -> str:
+            return _message_text(
+                self.send_prompt(
+                    prompt_type="U",
+                    prompt=prompt,
+                    generation_options=generation_options,
+                )
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=self._batch_concurrency(len(prompts)),
+            thread_name_prefix="orac-batch",
+        ) as pool:
+            return list(pool.map(_send, prompts))
+
+    async def asend_prompts(
+        self,
+        prompts: list[str],
+        generation_options: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """Await a batch of independent prompts from the event loop.
+
+        Each prompt goes through ``asend_prompt_with_meta``, so the batch is
+        gathered under the same ``max_inflight_requests`` cap as other async
+        callers instead of opening a thread pool of its own.
+
+        Args:
+            prompts: The prompt texts to send.
+            generation_options: Options applied to every prompt.
+
+        Returns:
+            list[str]: One response per prompt, in the order of ``prompts``.
+        """
+        results = await asyncio.gather(
+            *(
+                self.asend_prompt_with_meta(
+                    prompt_type="U",
+                    prompt=prompt,
+                    generation_options=generation_options,
+                )
+                for prompt in prompts
+            )
+        )
+        return [_message_text(result.get("text", "")) for result in results]
+
     def stream_prompt_deltas(
         self,
         prompt_type: str,
@@ -306,7 +503,7 @@ class LLMConnector(LLMConnectorABC):
 
     def interface_name(self) -> str:
         """Return the backend name (e.g. 'LM Studio', 'Ollama', etc)."""
-        return MODEL_SERVICE_DESCRIPTORS[self.model_interface_id]
+        return self._interface_name
 
     def interface_id(self) -> str:
         """Return the backend ID (e.g. 'lmstudio', 'ollama')."""
@@ -319,14 +516,7 @@ class LMStudioConnector(LLMConnector):
         self.logger = Logger()
         # 🧹 Defensive strip
         self.model_name = model_name.strip()
-        clean_url = service_url.strip()
-
-        # 🧱 Normalize URL
-        parsed_url = urlparse(clean_url)
-        if not parsed_url.scheme:
-            clean_url = f"http://{clean_url}"
-            parsed_url = urlparse(clean_url)
-        clean_url = urlunparse(parsed_url._replace(path="")).rstrip("/")
+        clean_url = _normalise_base_url(service_url)
 
         self.logger.log_info(f"🔗 LMStudio base_url: '{clean_url}'")
         self.logger.log_info(f"📝 LMStudio model: '{self.model_name}'")
@@ -345,25 +535,45 @@ class LMStudioConnector(LLMConnector):
         )
         self._connect_timeout = 5
         self._read_timeout = max(30, req_to)
-        self.llm_session = ChatOpenAI(
+        self.llm_session = self._chat_session()
+
+    def _chat_session(self) -> ChatOpenAI:
+        """Build the ChatOpenAI session on the shared httpx clients.
+
+        The timeout is given to ChatOpenAI rather than the clients, since the
+        OpenAI SDK sends its own timeout with every request.
+        """
+        http_client, http_async_client = _openai_http_clients(
+            self.config_mgr.int_config_value("service", "pool_max_idle", default=32),
+            self.config_mgr.int_config_value("service", "pool_max_total", default=64),
+        )
+        return ChatOpenAI(
             base_url=self.service_url + "/v1",
             api_key=cast(SecretStr, "not-needed"),  # LM Studio ignores this
-            model=self.model_name
+            model=self.model_name,
+            http_client=http_client,
+            http_async_client=http_async_client,
+            timeout=httpx.Timeout(self._read_timeout, connect=self._connect_timeout),
+            stream_usage=True,
         )
 
+    def _session_for(self, generation_options: dict[str, Any] | None = None) -> Any:
+        """Return the LM Studio session bound to OpenAI-compatible options."""
+        request_options = provider_generation_options(
+            "lmstudio",
+            generation_options,
+        )
+        if request_options and hasattr(self.llm_session, "bind"):
+            return self.llm_session.bind(**request_options)
+        return self.llm_session
+
     def _invoke_with_generation_options(
         self,
         prompt: str,
         generation_options: dict[str, Any] | None = None,
     ) -> Any:
         """Invoke LM Studio with OpenAI-compatible options when available."""
-        request_options = provider_generation_options(
-            "lmstudio",
-            generation_options,
-        )
-        if request_options and hasattr(self.llm_session, "bind"):
-            return self.llm_session.bind(**request_options).invoke(prompt)
-        return self.llm_session.invoke(prompt)
+        return self._session_for(generation_options).invoke(prompt)
 
     def send_prompt(
         self,
@@ -372,9 +582,57 @@ class LMStudioConnector(LLMConnector):
         stream: bool = False,
         generation_options: dict[str, Any] | None = None,
     ) -> str:
-        """Send prompt to LM Studio."""
-        self.logger.log_info(f"📤 Sending prompt to LM Studio (stream={stream})...")
-        return self._invoke_with_generation_options(prompt, generation_options)
+        """Send prompt to LM Studio and return the reply text."""
+        self.logger.log_debug(f"📤 Sending prompt to LM Studio (stream={stream})...")
+        return _message_text(
+            self._invoke_with_generation_options(prompt, generation_options)
+        )
+
+    def send_prompts(
+        self,
+        prompts: list[str],
+        generation_options: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """Send several prompts to LM Studio through the session's batch path."""
+        if not prompts:
+            return []
+        self.logger.log_debug(f"📤 Sending {len(prompts)} prompts to LM Studio...")
+        responses = self._session_for(generation_options).batch(
+            prompts,
+            config={"max_concurrency": self._batch_concurrency(len(prompts))},
+        )
+        return [_message_text(raw) for raw in responses]
+
+    def stream_prompt_deltas(
+        self,
+        prompt_type: str,
+        prompt: str,
+        generation_options: dict[str, Any] | None = None,
+        on_usage_metadata: LLMUsageMetadataCallback | None = None,
+    ) -> Iterator[str]:
+        """Yield LM Studio response text deltas as the completion streams in.
+
+        Token usage arrives on the final chunk of the OpenAI-compatible
+        stream and is reported through ``on_usage_metadata``.
+        """
+        del prompt_type
+        self.logger.log_debug("📤 Streaming prompt to LM Studio...")
+        usage: dict[str, Any] = {}
+        for chunk in self._session_for(generation_options).stream(prompt):
+            usage = getattr(chunk, "usage_metadata", None) or usage
+            text = getattr(chunk, "content", chunk)
+            if text and isinstance(text, str):
+                yield text
+        if on_usage_metadata is not None:
+            metadata = _usage_metadata_from_result(
+                {
+                    "prompt_tokens": usage.get("input_tokens"),
+                    "completion_tokens": usage.get("output_tokens"),
+                    "total_tokens": usage.get("total_tokens"),
+                }
+            )
+            if metadata is not None:
+                on_usage_metadata(metadata)
 
     def send_prompt_with_meta(
         self,
@@ -384,9 +642,8 @@ class LMStudioConnector(LLMConnector):
         generation_options: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Send prompt to LM Studio and return text with token metadata when available."""
-        self.logger.log_info(f"📤 Sending prompt to LM Studio (stream={stream})...")
+        self.logger.log_debug(f"📤 Sending prompt to LM Studio (stream={stream})...")
         raw = self._invoke_with_generation_options(prompt, generation_options)
-        text = raw.content if hasattr(raw, "content") else raw
         usage = getattr(raw, "usage_metadata", None) or {}
         prompt_tokens = int(
             usage.get("input_tokens")
@@ -403,7 +660,7 @@ class LMStudioConnector(LLMConnector):
             or (prompt_tokens + completion_tokens)
         )
         return {
-            "text": text if isinstance(text, str) else str(text),
+            "text": _message_text(raw),
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
             "total_tokens": total_tokens,
@@ -411,7 +668,7 @@ class LMStudioConnector(LLMConnector):
 
     def list_models(self):
         """List available models from LM Studio."""
-        response = requests.get(
+        response = _HTTP.get(
             f"{self.service_url}/v1/models",
             timeout=(
                 getattr(self, "_connect_timeout", 5),
@@ -422,11 +679,18 @@ class LMStudioConnector(LLMConnector):
 
 
 import json
-import requests
 import re
 import time
 import math
-from urllib.parse import urlparse, urlunparse
+
+_THINK_BLOCK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+# /api/tags responses by service URL, as (monotonic fetch time, models).
+# Model inventory rarely changes, and list_models/list_model_details are
+# usually called back to back, so one fetch serves both.
+OLLAMA_TAGS_TTL_SECONDS = 5.0
+_OLLAMA_TAGS_CACHE: dict[str, tuple[float, list[Any]]] = {}
+
 
 class OllamaConnector(LLMConnector):
     def __init__(self, model_name: str, service_url: str):
@@ -434,12 +698,7 @@ class OllamaConnector(LLMConnector):
         self.logger = Logger()
         self.logger.log_info('OllamaConnector instantiated')
         self.model_name = model_name.strip()
-        clean_url = service_url.strip()
-        parsed_url = urlparse(clean_url)
-        if not parsed_url.scheme:
-            clean_url = f"http://{clean_url}"
-            parsed_url = urlparse(clean_url)
-        self.service_url = urlunparse(parsed_url._replace(path="")).rstrip("/")
+        self.service_url = _normalise_base_url(service_url)
 
         self.logger.log_info(f"🔗 Ollama base_url: '{self.service_url}'")
         self.logger.log_info(f"📝 Ollama model: '{self.model_name}'")
@@ -507,13 +766,15 @@ class OllamaConnector(LLMConnector):
         """Remove <think>…</think>; if closing tag missing, drop from <think> to end."""
         if not isinstance(text, str):
             return ""
-        if "<think>" in text and "</think>" not in text:  # dangling / truncated block
+        if "<think>" not in text:
+            return text.strip()
+        if "</think>" not in text:  # dangling / truncated block
             return text.split("<think>", 1)[0].strip()
-        return re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+        return _THINK_BLOCK_RE.sub("", text).strip()
 
     def _post_json(self, url: str, payload: dict) -> dict:
         t0 = time.perf_counter()
-        r = requests.post(url, json=payload, timeout=(self._connect_timeout, self._read_timeout))
+        r = _HTTP.post(url, json=payload, timeout=(self._connect_timeout, self._read_timeout))
         r.raise_for_status()
         data = r.json()
         dt = time.perf_counter() - t0
@@ -654,7 +915,7 @@ class OllamaConnector(LLMConnector):
             f"np={payload['options']['num_predict']} sys={use_system}"
         )
 
-        with requests.post(
+        with _HTTP.post(
             url,
             json=payload,
             stream=True,
@@ -725,29 +986,34 @@ class OllamaConnector(LLMConnector):
 
     # ---------- public API ----------
 
-    def list_models(self):
-        """List available models from Ollama."""
-        response = requests.get(
+    def _ollama_tags(self) -> list[Any]:
+        """Return the ``/api/tags`` model entries, fetched at most once per TTL."""
+        cached = _OLLAMA_TAGS_CACHE.get(self.service_url)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < OLLAMA_TAGS_TTL_SECONDS:
+            return cached[1]
+        response = _HTTP.get(
             f"{self.service_url}/api/tags",
             timeout=(self._connect_timeout, self._read_timeout),
         )
         response.raise_for_status()
+        models = response.json().get("models", [])
+        _OLLAMA_TAGS_CACHE[self.service_url] = (now, models)
+        return models
+
+    def list_models(self):
+        """List available models from Ollama."""
         return [
             model.get("name")
-            for model in response.json().get("models", [])
+            for model in self._ollama_tags()
             if isinstance(model.get("name"), str) and model.get("name").strip()
         ]
 
     def list_model_details(self) -> list[dict[str, Any]]:
         """List available Ollama models with backend size metadata."""
-        response = requests.get(
-            f"{self.service_url}/api/tags",
-            timeout=(self._connect_timeout, self._read_timeout),
-        )
-        response.raise_for_status()
         models: list[dict[str, Any]] = []
 
-        for item in response.json().get("models", []):
+        for item in self._ollama_tags():
             if not isinstance(item, dict):
                 continue
 
@@ -6,18 +6,37 @@
 
 import asyncio
 import json
+import socket
 from typing import Any
 
+from lib import event_loop
+from lib.frame_codec import FRAME_READ_LIMIT, FRAME_WRITE_HIGH_WATER, dumps_frame, loads_frame
+from lib.logutil import Logger
+
+
+# Kernel send/receive buffer size requested for client sockets, so a long
+# completion frame is not trickled out in default-sized windows.
+SOCKET_BUFFER_BYTES = 256 * 1024
+
 
 class OracListener:
-    def __init__(self, orchestrator: Any, host: str = "127.0.0.1", port: int = 8765):
+    def __init__(
+        self,
+        orchestrator: Any,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        logger: Logger | None = None,
+    ):
         self.orchestrator = orchestrator
+        self.logger = logger or Logger()
         self.host = host
         self.port = port
 
     async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         addr = writer.get_extra_info("peername")
-        print(f"🟢 Connection from {addr}")
+        self.logger.log_debug(f"🟢 Connection from {addr}")
+        _tune_socket(writer.get_extra_info("socket"))
+        writer.transport.set_write_buffer_limits(high=FRAME_WRITE_HIGH_WATER)
         voice_turns: set[tuple[str, str]] = set()
         try:
             while True:
@@ -25,22 +44,24 @@ class OracListener:
                 if not data:
                     break
                 incoming = data.decode("utf-8", errors="replace").rstrip("\r\n")
-                print(f"📥 Received frame: {_frame_log_summary(incoming)}")
-                self._remember_voice_turn(incoming, voice_turns)
+                # Decode once for both the log summary and voice-turn
+                # tracking; the orchestrator still parses the raw text.
+                envelope = _decode_frame(incoming)
+                if self.logger.is_enabled_for("DEBUG"):
+                    self.logger.log_debug(
+                        f"📥 Received frame: {_frame_log_summary(incoming, envelope)}"
+                    )
+                self._remember_voice_turn(envelope, voice_turns)
 
                 streamer = getattr(self.orchestrator, "handle_request_events", None)
                 if callable(streamer):
                     async for out in streamer(incoming):
-                        if not isinstance(out, str):
-                            out = json.dumps(out, ensure_ascii=False)
                         await self._write_frame(writer, out)
                 else:
                     out = await self.orchestrator.handle_request(incoming)
-                    if not isinstance(out, str):
-                        out = json.dumps(out, ensure_ascii=False)
                     await self._write_frame(writer, out)
         except Exception as e:
-            print(f"❌ Error: {e}")
+            self.logger.log_error(f"❌ Error: {e}")
         finally:
             self._cancel_voice_turns(voice_turns)
             try:
@@ -50,18 +71,18 @@ class OracListener:
                 except ConnectionResetError:
                     pass
             finally:
-                print(f"🔴 Connection closed: {addr}")
+                self.logger.log_debug(f"🔴 Connection closed: {addr}")
 
     def _remember_voice_turn(
         self,
-        incoming: str,
+        incoming: str | Any,
         voice_turns: set[tuple[str, str]],
     ) -> None:
-        """Remember a streamed voice prompt turn from one request frame."""
-        try:
-            env = json.loads(incoming)
-        except Exception:
-            return
+        """Remember a streamed voice prompt turn from one request frame.
+
+        ``incoming`` is the raw frame text or its already-decoded envelope.
+        """
+        env = _decode_frame(incoming) if isinstance(incoming, (str, bytes)) else incoming
         if not isinstance(env, dict):
             return
         if env.get("route") != "orac.prompt":
@@ -87,40 +108,102 @@ class OracListener:
         for session_id, turn_id in voice_turns:
             try:
                 discarded = canceller(session_id=session_id, turn_id=turn_id)
-                print(
+                self.logger.log_info(
                     f"🔇 Cancelled voice turn {session_id}/{turn_id}; "
                     f"discarded {discarded} queued chunk(s)"
                 )
             except Exception as exc:
-                print(
+                self.logger.log_warning(
                     f"⚠️ Voice cancellation failed for "
                     f"{session_id}/{turn_id}: {exc}"
                 )
 
     async def start_server(self):
-        server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        server = await asyncio.start_server(
+            self.handle_client,
+            self.host,
+            self.port,
+            limit=FRAME_READ_LIMIT,
+        )
+        # Accepted sockets inherit buffer sizes from the listening socket.
+        for listening_socket in server.sockets:
+            _tune_socket(listening_socket)
         addr = server.sockets[0].getsockname()
-        print(f"🚀 OracListener started on {addr}", flush=True)
+        self.logger.log_info(f"🚀 OracListener started on {addr}")
         async with server:
             await server.serve_forever()
 
     async def _write_frame(
         self,
         writer: asyncio.StreamWriter,
-        frame: str,
+        frame: str | Any,
     ) -> None:
-        """Write one NDJSON protocol frame to the client."""
-        print(f"📤 Sending frame: {_frame_log_summary(frame)}")
-        writer.write((frame + "\n").encode("utf-8"))
-        await writer.drain()
+        """Write one NDJSON protocol frame to the client.
+
+        ``frame`` is either pre-serialised text or an envelope object; an
+        object's own envelope feeds the debug summary, so it is never
+        decoded back from its own bytes.
+        """
+        data = frame.encode("utf-8") if isinstance(frame, str) else dumps_frame(frame)
+        if self.logger.is_enabled_for("DEBUG"):
+            envelope = _UNDECODED if isinstance(frame, str) else frame
+            self.logger.log_debug(f"📤 Sending frame: {_frame_log_summary(data, envelope)}")
+        # One buffered write per frame, without copying data to append the
+        # newline. drain() only has work to do above the high-water mark,
+        # or to surface a lost connection.
+        writer.writelines((data, b"\n"))
+        transport = writer.transport
+        if (
+            transport.is_closing()
+            or transport.get_write_buffer_size() > FRAME_WRITE_HIGH_WATER
+        ):
+            await writer.drain()
+
 
+_INVALID_FRAME = object()
+_UNDECODED = object()
 
-def _frame_log_summary(frame: str) -> str:
-    """Return non-content protocol metadata suitable for operational logs."""
-    frame_bytes = len(frame.encode("utf-8"))
+
+def _tune_socket(sock: Any) -> None:
+    """Disable Nagle and enlarge kernel buffers on a TCP socket.
+
+    Frames are small newline-terminated writes, so Nagle's algorithm would
+    hold them back waiting for ACKs. asyncio already sets ``TCP_NODELAY``
+    on its own stream transports; setting it here keeps other loops
+    (uvloop) and the listening sockets consistent. Options a platform
+    rejects are skipped.
+    """
+    if sock is None or sock.family not in (socket.AF_INET, socket.AF_INET6):
+        return
+    for level, option, value in (
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_BYTES),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_BYTES),
+    ):
+        try:
+            sock.setsockopt(level, option, value)
+        except OSError:
+            pass
+
+
+def _decode_frame(frame: str | bytes) -> Any:
+    """Decode a frame, returning ``_INVALID_FRAME`` when it is not JSON."""
     try:
-        envelope = json.loads(frame)
+        return loads_frame(frame)
     except (TypeError, ValueError):
+        return _INVALID_FRAME
+
+
+def _frame_log_summary(frame: str | bytes, envelope: Any = _UNDECODED) -> str:
+    """Return non-content protocol metadata suitable for operational logs.
+
+    Pass ``envelope`` when the frame has already been decoded, to avoid
+    parsing it again.
+    """
+    frame_bytes = len(frame.encode("utf-8")) if isinstance(frame, str) else len(frame)
+    if envelope is _UNDECODED:
+        envelope = _decode_frame(frame)
+    if envelope is _INVALID_FRAME:
         return f"invalid_json bytes={frame_bytes}"
     if not isinstance(envelope, dict):
         return f"non_object bytes={frame_bytes}"
@@ -148,4 +231,4 @@ if __name__ == "__main__":
             }, ensure_ascii=False)
 
     listener = OracListener(_EchoOrchestrator())
-    asyncio.run(listener.start_server())
+    event_loop.run(listener.start_server())
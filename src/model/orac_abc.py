@@ -1,16 +1,20 @@
 # llm/base_connector.py
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import Any
 
-MODEL_SERVICE_DESCRIPTORS = {
+# Read-only: service ids are fixed for the process lifetime.
+MODEL_SERVICE_DESCRIPTORS = MappingProxyType({
     "lmstudio": "LM Studio",
     "ollama": "Ollama",
     "openai": "OpenAI ChatGPT API"
-}
+})
 
 class LLMConnectorABC(ABC):
     def __init__(self, model_service_id:str):
         self.model_interface_id = model_service_id
+        # Fixed for the connector's lifetime, so resolve the display name once.
+        self._interface_name = MODEL_SERVICE_DESCRIPTORS.get(model_service_id, model_service_id)
 
     @abstractmethod
     def send_prompt(
@@ -36,6 +40,14 @@ class LLMConnectorABC(ABC):
     ) -> dict:
         """Send a prompt and return response text plus usage metadata."""
 
+    @abstractmethod
+    def send_prompts(
+        self,
+        prompts: list[str],
+        generation_options: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """Send several independent user prompts and return responses in order."""
+
     @abstractmethod
     def interface_name(self) -> str:
         """Return the backend name (e.g. 'LM Studio', 'Ollama', 'OpenAI ChatGPT API'...)."""
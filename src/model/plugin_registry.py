@@ -388,14 +388,11 @@ class PluginApexAppRegistryStore:
 
 def _default_session() -> Any:
     """Open the saved Orac runtime database connection."""
-    from lib.config_mgr import ConfigManager
-    from lib.fsutils import project_home
+    from lib.config_mgr import DEFAULT_CONFIG_PATH, get_config_manager
     from lib.session_manager import DBSession
     from lib.user_security import UserSecurity
 
-    config_mgr = ConfigManager(
-        config_file_path=project_home() / "resources" / "config" / "orac.ini"
-    )
+    config_mgr = get_config_manager(DEFAULT_CONFIG_PATH)
     project_identifier = config_mgr.config_value(
         section="global",
         key="project_identifier",
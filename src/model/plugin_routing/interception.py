@@ -8,6 +8,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 import re
 from types import MappingProxyType
@@ -38,6 +39,9 @@ _REGEX_LOOKBEHIND = re.compile(r"\(\?<(?:=|!)")
 _REGEX_NESTED_QUANTIFIER = re.compile(
     r"\((?:\\.|[^()])*?(?:\*|\+|\{\d*,?\d*\})(?:\\.|[^()])*?\)\s*(?:\*|\+|\{)"
 )
+# normalise_text runs for every user turn, so its patterns are compiled once.
+_SPOKEN_COMMAND_STRIP = re.compile(r"[^a-z0-9'_.%°\s-]")
+_WHITESPACE_RUN = re.compile(r"\s+")
 
 
 class PluginResourceReader(Protocol):
@@ -455,11 +459,17 @@ def normalise_text(value: Any, normalisation: InterceptNormalisation) -> str:
             f"Unsupported normalisation '{normalisation.mode}'."
         )
     text = str(value or "").casefold().strip()
-    text = re.sub(r"[^a-z0-9'_.%°\s-]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip(" .-?")
+    text = _SPOKEN_COMMAND_STRIP.sub(" ", text)
+    text = _WHITESPACE_RUN.sub(" ", text).strip(" .-?")
     for source, replacement in normalisation.replacements.items():
-        text = re.sub(rf"\b{re.escape(source)}\b", replacement, text)
-    return re.sub(r"\s+", " ", text).strip(" .-?")
+        text = _whole_word_pattern(source).sub(replacement, text)
+    return _WHITESPACE_RUN.sub(" ", text).strip(" .-?")
+
+
+@lru_cache(maxsize=1024)
+def _whole_word_pattern(source: str) -> Pattern[str]:
+    """Return a compiled whole-word pattern for a normalisation replacement."""
+    return re.compile(rf"\b{re.escape(source)}\b")
 
 
 def _parse_normalisation(raw: Mapping[str, Any]) -> InterceptNormalisation:
@@ -10,7 +10,7 @@ from pathlib import Path
 import re
 from typing import Iterable
 
-from lib.user_security import decrypted_user_credential
+from lib.user_security import decrypted_machine_credential
 from lib.user_security import encrypted_user_credential
 from model.plugin_routing.discovery import PluginDiscovery
 from model.plugin_routing.models import PluginManifest
@@ -101,11 +101,14 @@ class PluginPatVaultStore:
 
         encrypted_value = config.get(plugin, secret_key)
         try:
-            return decrypted_user_credential(encrypted_value)
+            secret_value, stale = decrypted_machine_credential(encrypted_value)
         except Exception as exc:
             raise PluginSecretVaultError(
                 f"Plugin secret '{secret_key}' for '{plugin}' could not be decrypted on this machine."
             ) from exc
+        if stale:
+            self.set_secret(plugin, secret_key, secret_value)
+        return secret_value
 
     def delete_key(self, plugin_id: str, key: str) -> bool:
         """Delete one plugin secret key if present."""
@@ -6,14 +6,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-import subprocess
+from types import MappingProxyType
 from typing import Any
 
 import requests
 
 from lib.icons import Icons
-from model.llm_connector import LMStudioConnector, OllamaConnector
+from model.llm_connector import LMStudioConnector, OllamaConnector, _normalise_base_url
+
+
+OLLAMA_LIST_TIMEOUT_SECONDS = 30.0
+# Connect timeout only: a non-streamed pull sends nothing until the
+# download completes, which may take many minutes.
+OLLAMA_PULL_TIMEOUT_SECONDS: tuple[float, None] = (10.0, None)
 
 
 @dataclass(frozen=True)
@@ -35,7 +42,7 @@ class ProviderCapabilities:
 class ProviderRegistry:
     """Factory and provider-owned behaviour registry for LLM connectors."""
 
-    _PROVIDERS: dict[str, tuple[type, ProviderCapabilities]] = {
+    _PROVIDERS: MappingProxyType[str, tuple[type, ProviderCapabilities]] = MappingProxyType({
         "ollama": (
             OllamaConnector,
             ProviderCapabilities(
@@ -56,20 +63,27 @@ class ProviderRegistry:
             ProviderCapabilities(
                 provider_id="lmstudio",
                 display_name="LM Studio",
-                supports_native_streaming=False,
-                uses_fallback_streaming=True,
+                supports_native_streaming=True,
+                uses_fallback_streaming=False,
                 supports_usage_metadata=True,
                 supports_model_listing=True,
                 supports_model_details=False,
                 supports_model_pull=False,
                 requires_loaded_model=True,
-                cancellation_semantics="fallback_non_streaming_call_cannot_be_cancelled_mid_generation",
+                cancellation_semantics="client_disconnect_stops_stream_consumer",
             ),
         ),
-    }
+    })
 
-    def __init__(self, *, logger: Any | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        logger: Any | None = None,
+        session: requests.Session | None = None,
+    ) -> None:
         self._logger = logger
+        # Keep-alive pool reused across repeated provider probes.
+        self._session = session or requests.Session()
 
     def provider_ids(self) -> tuple[str, ...]:
         """Return supported provider identifiers."""
@@ -112,7 +126,10 @@ class ProviderRegistry:
         """Validate the configured model and perform provider-owned preparation."""
         provider_key = self._normalise_provider_id(provider_id)
         if provider_key == "ollama":
-            self._validate_or_pull_ollama_model(model_name=model_name)
+            self._validate_or_pull_ollama_model(
+                service_url=service_url,
+                model_name=model_name,
+            )
             return
         if provider_key == "lmstudio":
             self._validate_lmstudio_model_loaded(
@@ -122,6 +139,25 @@ class ProviderRegistry:
             return
         raise RuntimeError(f"{Icons.error} Unknown LLM service: {provider_id}")
 
+    async def validate_or_prepare_model_async(
+        self,
+        *,
+        provider_id: str,
+        service_url: str,
+        model_name: str,
+    ) -> None:
+        """Event-loop friendly variant of ``validate_or_prepare_model``.
+
+        The HTTP probe and any model pull run in a worker thread, so the
+        caller's event loop is not blocked.
+        """
+        await asyncio.to_thread(
+            self.validate_or_prepare_model,
+            provider_id=provider_id,
+            service_url=service_url,
+            model_name=model_name,
+        )
+
     def model_lookup_candidates(
         self,
         *,
@@ -170,24 +206,63 @@ class ProviderRegistry:
             return True
         return model_norm == str(configured_model_name or "").strip()
 
-    def _validate_or_pull_ollama_model(self, *, model_name: str) -> None:
-        """Validate or pull an Ollama model using existing CLI behaviour."""
+    def _ollama_model_available(self, *, base_url: str, model_name: str) -> bool:
+        """Return whether Ollama's ``/api/tags`` lists the model.
+
+        The keep-alive session replaces spawning ``ollama list``; the
+        ``:latest`` alias is matched as the CLI output check did.
+        """
         try:
-            output = subprocess.check_output(["ollama", "list"], text=True)
-            if model_name not in output:
-                self._log_warning(
-                    f"{Icons.warn} Model '{model_name}' not found in Ollama. Pulling it now..."
-                )
-                subprocess.run(["ollama", "pull", model_name], check=True)
-                self._log_info(f"{Icons.tick} Model '{model_name}' pulled successfully.")
-            else:
-                self._log_info(f"{Icons.tick} Model '{model_name}' is already available in Ollama.")
-        except FileNotFoundError as exc:
-            self._log_error(f"{Icons.error} Ollama not installed or not in PATH: {exc}")
-            raise RuntimeError("Ollama is not installed or not in PATH.") from exc
-        except subprocess.CalledProcessError as exc:
+            response = self._session.get(
+                f"{base_url}/api/tags",
+                timeout=OLLAMA_LIST_TIMEOUT_SECONDS,
+            )
+            response.raise_for_status()
+            models = response.json().get("models", [])
+        except (requests.exceptions.RequestException, ValueError) as exc:
+            self._log_error(f"{Icons.error} Could not list Ollama models at {base_url}: {exc}")
+            raise RuntimeError(f"Could not list Ollama models at {base_url}.") from exc
+        names = {
+            str(model.get("name") or "").strip()
+            for model in models
+            if isinstance(model, dict)
+        }
+        return any(
+            candidate in names
+            for candidate in self.model_lookup_candidates(
+                provider_id="ollama",
+                model_name=model_name,
+            )
+        )
+
+    def _pull_ollama_model(self, *, base_url: str, model_name: str) -> None:
+        """Pull a model through ``/api/pull`` on the server that was probed."""
+        try:
+            response = self._session.post(
+                f"{base_url}/api/pull",
+                json={"model": model_name, "stream": False},
+                timeout=OLLAMA_PULL_TIMEOUT_SECONDS,
+            )
+            response.raise_for_status()
+            status = response.json().get("status")
+        except (requests.exceptions.RequestException, ValueError) as exc:
             self._log_error(f"{Icons.error} Failed to pull model '{model_name}': {exc}")
             raise RuntimeError(f"Failed to pull model '{model_name}': {exc}") from exc
+        if status != "success":
+            self._log_error(f"{Icons.error} Failed to pull model '{model_name}': {status}")
+            raise RuntimeError(f"Failed to pull model '{model_name}': {status}")
+
+    def _validate_or_pull_ollama_model(self, *, service_url: str, model_name: str) -> None:
+        """Validate an Ollama model over REST, pulling it from the same server if missing."""
+        base_url = _normalise_base_url(str(service_url or ""))
+        if self._ollama_model_available(base_url=base_url, model_name=model_name):
+            self._log_info(f"{Icons.tick} Model '{model_name}' is already available in Ollama.")
+            return
+        self._log_warning(
+            f"{Icons.warn} Model '{model_name}' not found in Ollama. Pulling it now..."
+        )
+        self._pull_ollama_model(base_url=base_url, model_name=model_name)
+        self._log_info(f"{Icons.tick} Model '{model_name}' pulled successfully.")
 
     def _validate_lmstudio_model_loaded(
         self,
@@ -197,7 +272,7 @@ class ProviderRegistry:
     ) -> None:
         """Validate that LM Studio has the configured model loaded."""
         try:
-            response = requests.get(f"{service_url}/v1/models", timeout=10)
+            response = self._session.get(f"{service_url}/v1/models", timeout=10)
             response.raise_for_status()
             models = response.json().get("data", [])
             available_models = [model["id"] for model in models]
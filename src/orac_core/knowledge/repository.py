@@ -9,17 +9,14 @@ from __future__ import annotations
 import json
 from typing import Any, Callable
 
-from lib.config_mgr import ConfigManager
-from lib.fsutils import project_home
+from lib.config_mgr import DEFAULT_CONFIG_PATH, get_config_manager
 from lib.session_manager import DBSession
 from lib.user_security import UserSecurity
 
 
 def default_orac_session() -> Any:
     """Open the saved Orac runtime database connection."""
-    config_mgr = ConfigManager(
-        config_file_path=project_home() / "resources" / "config" / "orac.ini"
-    )
+    config_mgr = get_config_manager(DEFAULT_CONFIG_PATH)
     project_identifier = config_mgr.config_value(
         "global", "project_identifier", default="Orac"
     )
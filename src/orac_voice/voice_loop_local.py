@@ -24,6 +24,7 @@ import uuid
 from loguru import logger
 
 from lib.config_mgr import ConfigManager
+from lib.frame_codec import FRAME_READ_LIMIT
 from orac_voice.activation import DEFAULT_ACTIVATION_MODE
 from orac_voice.activation import DEFAULT_WAKE_ENGINE
 from orac_voice.activation import DEFAULT_WAKE_PHRASE
@@ -948,7 +949,7 @@ async def _send_voice_cancel_request(
   reader: asyncio.StreamReader | None = None
   writer: asyncio.StreamWriter | None = None
   try:
-    reader, writer = await asyncio.open_connection(host, port)
+    reader, writer = await asyncio.open_connection(host, port, limit=FRAME_READ_LIMIT)
     req_env = slave_client.build_voice_cancel_request(
       session_id=session_id,
       turn_id=turn_id,
@@ -979,7 +980,7 @@ async def _stream_orac_prompt(
   display_sender: DisplayEventSender | None = None,
 ) -> int:
   """Submit recognised text to Orac using the same TCP prompt route as slave.py."""
-  reader, writer = await asyncio.open_connection(host, port)
+  reader, writer = await asyncio.open_connection(host, port, limit=FRAME_READ_LIMIT)
   try:
     return await _send_orac_prompt(
       reader=reader,
@@ -1160,7 +1161,9 @@ async def _voice_session_async(args: argparse.Namespace) -> int:
 
       try:
         if reader is None or writer is None:
-          reader, writer = await asyncio.open_connection(args.host, args.port)
+          reader, writer = await asyncio.open_connection(
+            args.host, args.port, limit=FRAME_READ_LIMIT
+          )
         status = await _send_orac_prompt(
           reader=reader,
           writer=writer,
@@ -6,6 +6,8 @@ import asyncio
 import textwrap
 import json
 import re
+from lib import event_loop
+from lib.frame_codec import FRAME_READ_LIMIT, loads_frame
 from lib.icons import Icons
 import os
 
@@ -20,6 +22,8 @@ WRAP_WIDTH = 100
 # Toggle to show or strip <think>...</think> tags
 SHOW_REASONING = False
 
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+
 
 def strip_reasoning_tags(text: str) -> str:
     """
@@ -27,7 +31,9 @@ def strip_reasoning_tags(text: str) -> str:
     """
     if SHOW_REASONING:
         return text
-    return re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+    if "<think>" not in text:
+        return text.strip()
+    return _THINK_RE.sub("", text).strip()
 
 
 async def tcp_client(host=DEFAULT_HOST, port=DEFAULT_PORT):
@@ -35,7 +41,7 @@ async def tcp_client(host=DEFAULT_HOST, port=DEFAULT_PORT):
     logger.log_info(f"{Icons.rocket} Connecting to Orac at {host}:{port} ...")
 
     try:
-        reader, writer = await asyncio.open_connection(host, port)
+        reader, writer = await asyncio.open_connection(host, port, limit=FRAME_READ_LIMIT)
 
         # User-facing message (clean console)
         print(f"{Icons.robot} Connected. Type 'exit' or 'quit', to quit.\n")
@@ -65,7 +71,7 @@ async def tcp_client(host=DEFAULT_HOST, port=DEFAULT_PORT):
 
             # 👇 Attempt JSON decoding
             try:
-                data = json.loads(response_text)
+                data = loads_frame(response)
                 message = data.get("response", response_text)
             except json.JSONDecodeError:
                 # Fallback: treat as plain text
@@ -99,4 +105,4 @@ async def tcp_client(host=DEFAULT_HOST, port=DEFAULT_PORT):
 
 if __name__ == "__main__":
     # Initialise logger at startup
-    asyncio.run(tcp_client())
+    event_loop.run(tcp_client())
@@ -27,8 +27,10 @@ try:
 except ImportError:  # pragma: no cover - platform-dependent availability
     readline = None
 
+from lib import event_loop
 from lib.fsutils import project_home
-from lib.config_mgr import ConfigManager
+from lib.frame_codec import FRAME_READ_LIMIT
+from lib.config_mgr import get_config_manager
 from lib.protocol_validation import disabled_protocol_validator
 # Icons / logging
 from lib.icons import Icons
@@ -36,12 +38,12 @@ import shutil
 
 os.environ["LOGURU_AUTOINIT"] = "0"  # must be set before importing our logger
 from lib.logutil import Logger
-LOG_DIR = project_home() / 'logs'
 
 PROG_NAME = Path(__file__).name
 APP_HOME = project_home()
+LOG_DIR = APP_HOME / 'logs'
 CONFIG_FILE_PATH = APP_HOME / 'resources' / 'config' / 'orac.ini'
-conf_manager = ConfigManager(config_file_path=CONFIG_FILE_PATH)
+conf_manager = get_config_manager(CONFIG_FILE_PATH)
 LOG_LEVEL = conf_manager.config_value(section="logging", key="log_level", default='INFO')
 logger = Logger(log_file=LOG_DIR / 'local_client.log', log_level=LOG_LEVEL, inc_std_err=False)
 
@@ -206,7 +208,9 @@ def strip_reasoning_tags(text: str) -> str:
     """Remove <think>…</think> content unless SHOW_REASONING is True."""
     if SHOW_REASONING:
         return text
-    return re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+    if "<think>" not in text:
+        return text.strip()
+    return _STREAM_THINK_RE.sub("", text).strip()
 
 
 def strip_reasoning_tags_from_delta(text: str) -> str:
@@ -377,7 +381,7 @@ async def tcp_client(host=DEFAULT_HOST, port=DEFAULT_PORT):
     load_input_history()
 
     try:
-        reader, writer = await asyncio.open_connection(host, port)
+        reader, writer = await asyncio.open_connection(host, port, limit=FRAME_READ_LIMIT)
         print(f"{Icons.robot} Connected. Type 'exit' or 'quit' to quit.\n")
         logger.log_info(f"{Icons.robot} Connected.")
         anonymous_notice_shown = False
@@ -465,19 +469,14 @@ async def tcp_client(host=DEFAULT_HOST, port=DEFAULT_PORT):
                         print(f"{ts_prefix()}{Icons.robot} Orac: ", end="", flush=True)
                         stream_rendered = True
                     elif frame_type == "text_delta":
+                        delta = strip_reasoning_tags_from_delta(
+                            str(payload.get("delta", ""))
+                        )
                         if not stream_rendered:
-                            print(
-                                f"{ts_prefix()}{Icons.robot} Orac: ",
-                                end="",
-                                flush=True,
-                            )
+                            # Prefix and first delta go out in one write.
+                            delta = f"{ts_prefix()}{Icons.robot} Orac: {delta}"
                             stream_rendered = True
-                        delta = payload.get("delta", "")
-                        print(
-                            strip_reasoning_tags_from_delta(str(delta)),
-                            end="",
-                            flush=True,
-                        )
+                        print(delta, end="", flush=True)
                     elif frame_type == "text_chunk":
                         logger.log_debug(
                             f"Speech text chunk received: {payload.get('chunk', '')!r}"
@@ -533,16 +532,8 @@ async def tcp_client(host=DEFAULT_HOST, port=DEFAULT_PORT):
                 clean = strip_reasoning_tags(content)
                 width = get_wrap_width(WRAP_WIDTH)
                 rendered = render_for_console(clean, width)
-                first_prefix = f"{ts_prefix()}{Icons.robot} Orac: "
-                lines = rendered.splitlines(True)
-                if lines:
-                    print(first_prefix + lines[0], end="")
-                    for ln in lines[1:]:
-                        print(ln, end="")
-                    print()
-                    print()
-                else:
-                    print(first_prefix + "\n")
+                # The whole reply and its trailing blank line in one write.
+                print(f"{ts_prefix()}{Icons.robot} Orac: {rendered}\n")
                 break
 
 # --- Main ---
@@ -574,4 +565,4 @@ async def tcp_client(host=DEFAULT_HOST, port=DEFAULT_PORT):
             logger.log_warning("Writer was not created; skipping close.")
 
 if __name__ == "__main__":
-    asyncio.run(tcp_client())
+    event_loop.run(tcp_client())
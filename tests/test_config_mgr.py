@@ -0,0 +1,183 @@
+"""Tests for the Orac INI configuration manager."""
+# Author: Clive Bostock
+# Date: 2026-10-16
+# Description: Verifies ConfigManager loading, overrides, and shared instances.
+
+from __future__ import annotations
+
+from configparser import ExtendedInterpolation
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from lib.config_mgr import ConfigManager, clear_config_managers, get_config_manager
+
+
+def _write_ini(directory: str, text: str) -> Path:
+    """Write an INI file into a temporary directory and return its path."""
+    path = Path(directory) / "orac.ini"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class ConfigManagerTests(unittest.TestCase):
+    """Tests for ConfigManager behaviour."""
+
+    def test_get_config_manager_shares_one_instance_per_path(self) -> None:
+        """Repeated lookups for the same file return the same manager."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_ini(tmp, "[global]\nproject_identifier = Orac\n")
+
+            first = get_config_manager(path)
+            second = get_config_manager(str(path))
+
+            self.assertIs(first, second)
+            self.assertIsInstance(first, ConfigManager)
+            self.assertEqual(first.config_value("global", "project_identifier"), "Orac")
+
+    def test_clear_config_managers_rereads_shared_instances(self) -> None:
+        """Clearing the shared managers picks up an edited file on next lookup."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_ini(tmp, "[service]\nllm_service_id = ollama\n")
+            first = get_config_manager(path)
+            _write_ini(tmp, "[service]\nllm_service_id = lmstudio\n")
+
+            self.assertIs(get_config_manager(path), first)
+            clear_config_managers()
+            refreshed = get_config_manager(path)
+
+            self.assertIsNot(refreshed, first)
+            self.assertEqual(first.config_value("service", "llm_service_id"), "ollama")
+            self.assertEqual(refreshed.config_value("service", "llm_service_id"), "lmstudio")
+
+    def test_instances_from_cached_text_do_not_share_state(self) -> None:
+        """Instances built from cached INI text stay independent of each other."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_ini(tmp, "[service]\nmodel = alpha\n")
+
+            first = ConfigManager(config_file_path=path)
+            first.apply_db_overrides([("service", "model", "beta")])
+            second = ConfigManager(config_file_path=path)
+
+            self.assertEqual(first.config_value("service", "model"), "beta")
+            self.assertEqual(second.config_value("service", "model"), "alpha")
+
+    def test_unchanged_file_is_read_once(self) -> None:
+        """An unchanged INI file is parsed per instance but read from disk once."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_ini(tmp, "[service]\nmodel = alpha\n")
+            ConfigManager(config_file_path=path)
+
+            with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+                config = ConfigManager(config_file_path=path)
+
+            self.assertEqual(config.config_value("service", "model"), "alpha")
+
+    def test_changed_file_is_reparsed(self) -> None:
+        """A modified INI file invalidates the cached text."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_ini(tmp, "[service]\nmodel = alpha\n")
+            ConfigManager(config_file_path=path)
+
+            _write_ini(tmp, "[service]\nmodel = gamma-model\n")
+
+            self.assertEqual(
+                ConfigManager(config_file_path=path).config_value("service", "model"),
+                "gamma-model",
+            )
+
+    def test_typed_getters_coerce_values_and_apply_defaults(self) -> None:
+        """Typed getters convert present values and fall back for absent ones."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_ini(
+                tmp,
+                "[voice]\nenabled = yes\nrate = 16000\ngain = 0.5\n",
+            )
+            config = ConfigManager(config_file_path=path)
+
+            self.assertTrue(config.bool_config_value("voice", "enabled"))
+            self.assertEqual(config.int_config_value("voice", "rate"), 16000)
+            self.assertEqual(config.float_config_value("voice", "gain"), 0.5)
+            self.assertEqual(config.int_config_value("voice", "absent", default=3), 3)
+            self.assertFalse(config.bool_config_value("nosuch", "flag", default=False))
+            with self.assertRaises(KeyError):
+                config.config_value("nosuch", "key")
+            with self.assertRaises(ValueError):
+                config.bool_config_value("voice", "rate")
+
+    def test_typed_values_are_memoised_and_refreshed_by_db_overrides(self) -> None:
+        """Getters coerce on first use, and db overrides clear the memo."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_ini(tmp, "[voice]\nRate = 16000\n")
+            config = ConfigManager(config_file_path=path)
+
+            self.assertEqual(config._typed_memo, {})
+            self.assertEqual(config.int_config_value("voice", "RATE"), 16000)
+            self.assertEqual(config._typed_memo, {("int", "voice", "rate"): 16000})
+            with patch.object(config, "_raw_value", side_effect=AssertionError("re-read")):
+                self.assertEqual(config.int_config_value("voice", "rate"), 16000)
+
+            config.apply_db_overrides([("voice", "rate", 8000)])
+
+            self.assertEqual(config.int_config_value("voice", "rate"), 8000)
+            self.assertEqual(config.float_config_value("voice", "rate"), 8000.0)
+
+    def test_config_dictionary_flattens_sections_last_one_wins(self) -> None:
+        """The flattened view follows section order and tracks db overrides."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_ini(tmp, "[a]\nname = first\n[b]\nname = second\nport = 1\n")
+            config = ConfigManager(config_file_path=path)
+
+            self.assertEqual(config.config_dictionary()["name"], "second")
+
+            config.apply_db_overrides([("b", "port", 2)])
+
+            self.assertEqual(config.config_dictionary()["port"], "2")
+
+    def test_env_overrides_apply_prefixed_keys_only(self) -> None:
+        """ORAC__SECTION__KEY variables override INI values; others are ignored."""
+        env = {
+            "ORAC__SERVICE__MODEL": "from-env",
+            "ORAC__NEW_SECTION__FLAG": "true",
+            "ORAC__MALFORMED": "ignored",
+            "OTHER__SERVICE__MODEL": "ignored",
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_ini(tmp, "[service]\nmodel = alpha\n")
+            with patch.dict("os.environ", env):
+                config = ConfigManager(config_file_path=path)
+
+            self.assertEqual(config.config_value("service", "model"), "from-env")
+            self.assertTrue(config.bool_config_value("new_section", "flag"))
+            self.assertNotIn("malformed", config.config_dictionary())
+
+    def test_interpolation_only_installed_when_dollar_present(self) -> None:
+        """Plain files skip interpolation; ${...} in file or env still expands."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_ini(tmp, "[paths]\nlogs = /var/log/orac\n")
+            with patch.dict("os.environ", {"ORAC_HOME": "/opt/orac"}):
+                plain = ConfigManager(config_file_path=path)
+                with patch.dict("os.environ", {"ORAC__PATHS__DATA": "${ORAC_HOME}/data"}):
+                    from_env = ConfigManager(config_file_path=path)
+
+            self.assertNotIsInstance(plain.config._interpolation, ExtendedInterpolation)
+            self.assertEqual(plain.config_value("paths", "logs"), "/var/log/orac")
+            self.assertEqual(from_env.config_value("paths", "data"), "/opt/orac/data")
+
+            path = _write_ini(tmp, "[paths]\nlogs = ${ORAC_HOME}/logs\n")
+            with patch.dict("os.environ", {"ORAC_HOME": "/opt/orac"}):
+                interpolated = ConfigManager(config_file_path=path)
+
+            self.assertEqual(interpolated.config_value("paths", "logs"), "/opt/orac/logs")
+
+
+if __name__ == "__main__":
+    unittest.main()
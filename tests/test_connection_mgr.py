@@ -0,0 +1,218 @@
+"""Tests for the saved-connection manager."""
+# Author: Clive Bostock
+# Date: 2026-10-16
+# Description: Verifies ConnectMgr credential file caching and persistence.
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import MagicMock, patch
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from lib import connection_mgr
+from lib.connection_mgr import ConnectMgr
+
+
+class ConnectMgrCacheTests(unittest.TestCase):
+    """Tests for ConnectMgr's parsed credential file cache."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        home = Path(self._tmp.name)
+        for target, value in (
+            (patch.object(connection_mgr.Path, "home"), home),
+            (patch.object(connection_mgr.UserSecurity, "get"), MagicMock()),
+        ):
+            target.start().return_value = value
+            self.addCleanup(target.stop)
+        self.ini_path = home / ".orac" / "dsn_credentials.ini"
+        self.ini_path.parent.mkdir(parents=True)
+        self.ini_path.write_text("[orac]\nresource_id = db:1521/svc\n", encoding="utf-8")
+        ConnectMgr.invalidate_cache()
+        self.addCleanup(ConnectMgr.invalidate_cache)
+
+    def _manager(self) -> ConnectMgr:
+        return ConnectMgr(project_identifier="orac", resource_type="dsn")
+
+    def test_unchanged_file_is_parsed_once(self) -> None:
+        """Repeated managers for an unchanged file share one parse."""
+        with patch.object(connection_mgr.fast_ini, "load", wraps=connection_mgr.fast_ini.load) as load:
+            first = self._manager()
+            second = self._manager()
+
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(second._sections, {"orac": {"resource_id": "db:1521/svc"}})
+        first._sections["orac"]["resource_id"] = "changed"
+        self.assertEqual(second._sections["orac"]["resource_id"], "db:1521/svc")
+
+    def test_external_change_is_reparsed(self) -> None:
+        """A file rewritten by another writer invalidates the cached parse."""
+        self._manager()
+        self.ini_path.write_text("[orac]\nresource_id = other-host:1521/svc\n", encoding="utf-8")
+
+        self.assertEqual(
+            self._manager()._sections["orac"]["resource_id"],
+            "other-host:1521/svc",
+        )
+
+    def test_save_refreshes_cache(self) -> None:
+        """Saving updates the cache, so the next manager sees the write without re-parsing."""
+        manager = self._manager()
+        manager._sections["backup"] = {"resource_id": "db2:1521/svc"}
+        manager._save_config()
+
+        with patch.object(connection_mgr.fast_ini, "load") as load:
+            reloaded = self._manager()
+
+        load.assert_not_called()
+        self.assertIn("backup", reloaded._sections)
+        self.assertIn("[backup]", self.ini_path.read_text(encoding="utf-8"))
+
+    def test_batch_defers_saves_to_a_single_write(self) -> None:
+        """Mutations inside batch() flush once when the block exits."""
+        manager = self._manager()
+
+        with patch.object(connection_mgr.fast_ini, "dump", wraps=connection_mgr.fast_ini.dump) as dump:
+            with manager.batch():
+                for name in ("one", "two", "three"):
+                    manager._sections[name] = {"resource_id": name}
+                    manager._save_config()
+                self.assertNotIn("[one]", self.ini_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(dump.call_count, 1)
+        self.assertIn("[three]", self.ini_path.read_text(encoding="utf-8"))
+
+    def test_save_replaces_file_atomically_and_keeps_mode(self) -> None:
+        """The rewrite goes through a temporary file and keeps permissions."""
+        self.ini_path.chmod(0o640)
+        manager = self._manager()
+        manager._sections["backup"] = {"resource_id": "db2:1521/svc"}
+
+        manager._save_config()
+
+        self.assertEqual(self.ini_path.stat().st_mode & 0o777, 0o640)
+        self.assertEqual(list(self.ini_path.parent.iterdir()), [self.ini_path])
+
+    def test_list_connections_writes_listing_in_one_call(self) -> None:
+        """The DSN listing shows every connection and is written once."""
+        self.ini_path.write_text(
+            "[orac]\nresource_id = db:1521/svc\nwallet_zip_path = /w.zip\n\n[spare]\n",
+            encoding="utf-8",
+        )
+        stdout = io.StringIO()
+
+        with patch.object(connection_mgr.sys, "stdout", stdout), \
+                patch.object(stdout, "write", wraps=stdout.write) as write:
+            self._manager().list_connections()
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(lines[0], "Database connections:")
+        self.assertEqual(lines[3], f"  1 {'orac':<20}  {'db:1521/svc':<50}  /w.zip")
+        self.assertEqual(lines[4], f"  2 {'spare':<20}  {'No dsn provided':<50}  No wallet")
+
+    def test_list_connections_with_creds_decrypts_from_parsed_section(self) -> None:
+        """Credential listing decrypts the loaded values without re-reading the file."""
+        self.ini_path.write_text(
+            "[orac]\nusername = enc-user\npassword = enc-pass\nresource_id = db:1521/svc\n",
+            encoding="utf-8",
+        )
+        manager = self._manager()
+        manager.user_security.decrypted_user_credential.side_effect = (
+            lambda encrypted_credential: encrypted_credential.replace("enc-", "")
+        )
+        stdout = io.StringIO()
+
+        with patch.object(connection_mgr.sys, "stdout", stdout):
+            manager.list_connections(inc_creds=True)
+
+        manager.user_security.user_credential.assert_not_called()
+        self.assertIn(f"  1 {'orac':<20}  db:1521/svc [user / pass]", stdout.getvalue())
+
+    def test_export_all_credentials_derives_the_key_once(self) -> None:
+        """Exporting every connection runs the KDF once and round-trips values."""
+        self.ini_path.write_text(
+            "[a]\nusername = enc-ua\npassword = enc-pa\nresource_id = db-a\n\n"
+            "[b]\nusername = enc-ub\npassword = enc-pb\nresource_id = db-b\n",
+            encoding="utf-8",
+        )
+        manager = self._manager()
+        manager.user_security.decrypted_user_credential.side_effect = (
+            lambda encrypted_credential: encrypted_credential.replace("enc-", "")
+        )
+        user_security = connection_mgr.user_security
+
+        with patch.object(user_security, "_derive_key", wraps=user_security._derive_key) as derive:
+            exported = manager.get_connection_credentials("*", encryption_key="export-pw")
+
+        self.assertEqual(derive.call_count, 1)
+        manager.user_security.named_connection_creds.assert_not_called()
+        self.assertEqual([row["resource_id"] for row in exported], ["db-a", "db-b"])
+        self.assertEqual(
+            [
+                user_security.decrypted_user_credential(row["password"], "export-pw")
+                for row in exported
+            ],
+            ["pa", "pb"],
+        )
+
+    def test_export_streams_json_into_zip_member(self) -> None:
+        """The export ZIP holds one indented JSON document named after the file."""
+        manager = self._manager()
+        manager.get_connection_credentials = MagicMock(
+            return_value=[{"connection_name": "orac", "resource_id": "db:1521/svc"}]
+        )
+        manager.user_security.connection_property.return_value = "/w.zip"
+        zip_path = Path(self._tmp.name) / "orac_export.zip"
+
+        with patch.object(connection_mgr.sys, "stdout", io.StringIO()):
+            manager.export("dsn", "orac", "orac", zip_path, zip_password="unused")
+
+        with zipfile.ZipFile(zip_path) as archive:
+            self.assertEqual(archive.namelist(), ["orac_export.json"])
+            text = archive.read("orac_export.json").decode("utf-8")
+        exported = json.loads(text)
+        self.assertIn('\n    "header": {', text)
+        self.assertEqual(exported["header"]["wallet_zip_path"], "/w.zip")
+        self.assertEqual(exported["connections"][0]["resource_id"], "db:1521/svc")
+
+    def test_missing_credentials_file_is_created_owner_only(self) -> None:
+        """A first run creates an empty 0600 credentials file without reading it back."""
+        self.ini_path.unlink()
+        self.ini_path.parent.rmdir()
+
+        with patch.object(connection_mgr.sys, "stdout", io.StringIO()), \
+                patch.object(connection_mgr.fast_ini, "load") as load:
+            manager = self._manager()
+
+        load.assert_not_called()
+        self.assertEqual(manager._sections, {})
+        self.assertEqual(self.ini_path.stat().st_mode & 0o777, 0o600)
+
+    def test_validate_wallet_path_checks_suffix_then_existence(self) -> None:
+        """Non-ZIP names are rejected without a filesystem lookup; ZIPs must exist."""
+        wallet = Path(self._tmp.name) / "Wallet_Orac.ZIP"
+        wallet.write_bytes(b"")
+
+        with patch.object(connection_mgr.sys, "stdout", io.StringIO()):
+            with patch.object(connection_mgr.Path, "resolve") as resolve:
+                self.assertEqual(ConnectMgr._validate_wallet_path("/tmp/wallet.tar"), "")
+            resolve.assert_not_called()
+            self.assertEqual(ConnectMgr._validate_wallet_path(str(wallet.with_name("gone.zip"))), "")
+            self.assertEqual(ConnectMgr._validate_wallet_path(str(wallet)), str(wallet.resolve()))
+
+
+if __name__ == "__main__":
+    unittest.main()
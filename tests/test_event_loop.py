@@ -0,0 +1,52 @@
+"""Tests for the event loop factory."""
+# Author: Clive Bostock
+# Date: 2026-10-16
+# Description: Verifies uvloop is preferred when present and skipped otherwise.
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from lib import event_loop
+
+
+class EventLoopTests(unittest.TestCase):
+    """Tests for lib.event_loop."""
+
+    def test_uses_uvloop_when_installed(self) -> None:
+        fake_uvloop = MagicMock()
+        fake_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+
+        with patch.object(event_loop, "uvloop", fake_uvloop), \
+                patch.object(event_loop.sys, "platform", "linux"):
+            self.assertEqual(event_loop.run(asyncio.sleep(0, result="done")), "done")
+
+        fake_uvloop.new_event_loop.assert_called_once_with()
+
+    def test_falls_back_without_uvloop_or_on_windows(self) -> None:
+        fake_uvloop = MagicMock()
+
+        with patch.object(event_loop, "uvloop", None):
+            loop = event_loop.new_event_loop()
+            loop.close()
+        with patch.object(event_loop, "uvloop", fake_uvloop), \
+                patch.object(event_loop.sys, "platform", "win32"):
+            loop = event_loop.new_event_loop()
+            loop.close()
+
+        self.assertIsInstance(loop, asyncio.AbstractEventLoop)
+        fake_uvloop.new_event_loop.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for the minimal credential INI reader/writer."""
+# Author: Clive Bostock
+# Date: 2026-10-16
+# Description: Verifies fast_ini parity with configparser for credential files.
+
+from __future__ import annotations
+
+import configparser
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from lib import fast_ini
+
+
+CREDENTIALS_INI = """\
+[orac]
+username = gAAAAABlc2VyPQ==
+Password = secret:with=delimiters
+; a comment
+# another comment
+resource_id = dbhost:1521/orac_svc
+wallet_zip_path =
+
+[website]
+resource_id: https://example.test/
+"""
+
+
+class FastIniTests(unittest.TestCase):
+    """Tests for fast_ini parsing and rendering."""
+
+    def test_loads_matches_configparser(self) -> None:
+        """Sections, lower-cased keys and delimiter-bearing values match configparser."""
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read_string(CREDENTIALS_INI)
+        expected = {section: dict(parser[section]) for section in parser.sections()}
+
+        self.assertEqual(fast_ini.loads(CREDENTIALS_INI), expected)
+
+    def test_dump_round_trips_through_configparser(self) -> None:
+        """Written files are byte-identical to configparser output and reload cleanly."""
+        sections = fast_ini.loads(CREDENTIALS_INI)
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read_dict(sections)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "dsn_credentials.ini"
+            fast_ini.dump(sections, path)
+            with (Path(tmp) / "reference.ini").open("w", encoding="utf-8") as handle:
+                parser.write(handle)
+
+            self.assertEqual(
+                path.read_text(encoding="utf-8"),
+                (Path(tmp) / "reference.ini").read_text(encoding="utf-8"),
+            )
+            self.assertEqual(fast_ini.load(path), sections)
+
+    def test_empty_file_has_no_sections(self) -> None:
+        """A freshly touched credentials file parses to an empty mapping."""
+        self.assertEqual(fast_ini.loads(""), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
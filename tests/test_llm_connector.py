@@ -8,12 +8,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
 import json
 import sys
 import types
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+
+import requests
+from unittest.mock import MagicMock, patch
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -48,6 +52,21 @@ from model.llm_connector import (
 from model.provider_registry import ProviderRegistry
 
 
+def _installed_chat_openai():
+    """Return the real langchain_openai.ChatOpenAI, or None when only the stub above is usable."""
+    module = sys.modules.get("langchain_openai")
+    if getattr(module, "__file__", None):
+        return module.ChatOpenAI
+    sys.modules.pop("langchain_openai", None)
+    try:
+        return importlib.import_module("langchain_openai").ChatOpenAI
+    except ImportError:
+        return None
+    finally:
+        if module is not None:
+            sys.modules["langchain_openai"] = module
+
+
 class _FakeLogger:
     """Capture connector log messages for assertions."""
 
@@ -57,6 +76,9 @@ class _FakeLogger:
     def log_info(self, message: str) -> None:
         self.messages.append(message)
 
+    def log_debug(self, message: str) -> None:
+        self.messages.append(message)
+
     def log_warning(self, message: str) -> None:
         self.messages.append(message)
 
@@ -203,8 +225,8 @@ class OllamaConnectorRetryTests(unittest.TestCase):
     def test_lmstudio_capabilities_are_explicit(self) -> None:
         capabilities = ProviderRegistry().capabilities("lmstudio")
 
-        self.assertFalse(capabilities.supports_native_streaming)
-        self.assertTrue(capabilities.uses_fallback_streaming)
+        self.assertTrue(capabilities.supports_native_streaming)
+        self.assertFalse(capabilities.uses_fallback_streaming)
         self.assertTrue(capabilities.supports_usage_metadata)
         self.assertTrue(capabilities.supports_model_listing)
         self.assertFalse(capabilities.supports_model_details)
@@ -236,37 +258,119 @@ class OllamaConnectorRetryTests(unittest.TestCase):
             ["loaded-model"],
         )
 
+    @staticmethod
+    def _tags_session(*names: str) -> MagicMock:
+        session = MagicMock()
+        session.get.return_value.json.return_value = {
+            "models": [{"name": name} for name in names]
+        }
+        return session
+
     def test_registry_validates_or_pulls_ollama_model_with_existing_behaviour(self) -> None:
         logger = _FakeLogger()
-        registry = ProviderRegistry(logger=logger)
+        session = self._tags_session("llama3.2:latest")
+        registry = ProviderRegistry(logger=logger, session=session)
 
-        with patch(
-            "model.provider_registry.subprocess.check_output",
-            return_value="NAME ID SIZE\nllama3.2:latest abc 1GB\n",
-        ) as check_output, patch("model.provider_registry.subprocess.run") as run:
+        registry.validate_or_prepare_model(
+            provider_id="ollama",
+            service_url="http://127.0.0.1:11434",
+            model_name="llama3.2",
+        )
+
+        session.get.assert_called_once_with(
+            "http://127.0.0.1:11434/api/tags",
+            timeout=30.0,
+        )
+        session.post.assert_not_called()
+
+    def test_registry_pulls_missing_ollama_model_from_the_probed_server(self) -> None:
+        session = self._tags_session("other:latest")
+        session.post.return_value.json.return_value = {"status": "success"}
+        registry = ProviderRegistry(logger=_FakeLogger(), session=session)
+
+        registry.validate_or_prepare_model(
+            provider_id="ollama",
+            service_url=" 127.0.0.1:11434/ ",
+            model_name="llama3.2",
+        )
+
+        session.get.assert_called_once_with(
+            "http://127.0.0.1:11434/api/tags",
+            timeout=30.0,
+        )
+        session.post.assert_called_once_with(
+            "http://127.0.0.1:11434/api/pull",
+            json={"model": "llama3.2", "stream": False},
+            timeout=(10.0, None),
+        )
+
+    def test_registry_reports_unreachable_ollama_service(self) -> None:
+        session = MagicMock()
+        session.get.side_effect = requests.exceptions.ConnectionError("refused")
+        registry = ProviderRegistry(logger=_FakeLogger(), session=session)
+
+        with self.assertRaisesRegex(RuntimeError, "Could not list Ollama models"):
             registry.validate_or_prepare_model(
                 provider_id="ollama",
                 service_url="http://127.0.0.1:11434",
-                model_name="llama3.2:latest",
+                model_name="llama3.2",
             )
 
-        check_output.assert_called_once_with(["ollama", "list"], text=True)
-        run.assert_not_called()
-
-    def test_registry_pulls_missing_ollama_model(self) -> None:
-        registry = ProviderRegistry(logger=_FakeLogger())
+    def test_registry_reports_malformed_ollama_tags_response(self) -> None:
+        session = MagicMock()
+        session.get.return_value.json.side_effect = ValueError("not JSON")
+        registry = ProviderRegistry(logger=_FakeLogger(), session=session)
 
-        with patch(
-            "model.provider_registry.subprocess.check_output",
-            return_value="NAME ID SIZE\nother:latest abc 1GB\n",
-        ), patch("model.provider_registry.subprocess.run") as run:
+        with self.assertRaisesRegex(RuntimeError, "Could not list Ollama models"):
             registry.validate_or_prepare_model(
                 provider_id="ollama",
                 service_url="http://127.0.0.1:11434",
                 model_name="llama3.2",
             )
 
-        run.assert_called_once_with(["ollama", "pull", "llama3.2"], check=True)
+    def test_registry_async_validation_pulls_missing_ollama_model(self) -> None:
+        session = self._tags_session("other:latest")
+        session.post.return_value.json.return_value = {"status": "success"}
+        registry = ProviderRegistry(logger=_FakeLogger(), session=session)
+
+        asyncio.run(
+            registry.validate_or_prepare_model_async(
+                provider_id="ollama",
+                service_url="http://127.0.0.1:11434",
+                model_name="llama3.2",
+            )
+        )
+
+        session.post.assert_called_once()
+        self.assertEqual(session.post.call_args.args, ("http://127.0.0.1:11434/api/pull",))
+
+    def test_registry_async_validation_reports_failed_ollama_pull(self) -> None:
+        session = self._tags_session("other:latest")
+        session.post.return_value.raise_for_status.side_effect = (
+            requests.exceptions.HTTPError("500 Server Error")
+        )
+        registry = ProviderRegistry(logger=_FakeLogger(), session=session)
+
+        with self.assertRaisesRegex(RuntimeError, "Failed to pull model 'llama3.2'"):
+            asyncio.run(
+                registry.validate_or_prepare_model_async(
+                    provider_id="ollama",
+                    service_url="http://127.0.0.1:11434",
+                    model_name="llama3.2",
+                )
+            )
+
+    def test_registry_reports_unsuccessful_ollama_pull_status(self) -> None:
+        session = self._tags_session("other:latest")
+        session.post.return_value.json.return_value = {"status": "pulling manifest"}
+        registry = ProviderRegistry(logger=_FakeLogger(), session=session)
+
+        with self.assertRaisesRegex(RuntimeError, "pulling manifest"):
+            registry.validate_or_prepare_model(
+                provider_id="ollama",
+                service_url="http://127.0.0.1:11434",
+                model_name="llama3.2",
+            )
 
     def test_registry_validates_lmstudio_loaded_model_with_existing_behaviour(self) -> None:
         response = type(
@@ -277,16 +381,23 @@ class OllamaConnectorRetryTests(unittest.TestCase):
                 "raise_for_status": lambda self: None,
             },
         )()
-        registry = ProviderRegistry(logger=_FakeLogger())
-
-        with patch("model.provider_registry.requests.get", return_value=response) as get:
-            registry.validate_or_prepare_model(
-                provider_id="lmstudio",
-                service_url="http://127.0.0.1:1234",
-                model_name="loaded-model",
-            )
+        session = MagicMock()
+        session.get.return_value = response
+        registry = ProviderRegistry(logger=_FakeLogger(), session=session)
+
+        registry.validate_or_prepare_model(
+            provider_id="lmstudio",
+            service_url="http://127.0.0.1:1234",
+            model_name="loaded-model",
+        )
+        registry.validate_or_prepare_model(
+            provider_id="lmstudio",
+            service_url="http://127.0.0.1:1234",
+            model_name="loaded-model",
+        )
 
-        get.assert_called_once_with(
+        self.assertEqual(session.get.call_count, 2)
+        session.get.assert_called_with(
             "http://127.0.0.1:1234/v1/models",
             timeout=10,
         )
@@ -412,7 +523,7 @@ class OllamaConnectorRetryTests(unittest.TestCase):
         ]
 
         with patch(
-            "model.llm_connector.requests.post",
+            "model.llm_connector._HTTP.post",
             return_value=_FakeStreamResponse(frames),
         ):
             deltas = list(
@@ -443,7 +554,7 @@ class OllamaConnectorRetryTests(unittest.TestCase):
         ]
 
         with patch(
-            "model.llm_connector.requests.post",
+            "model.llm_connector._HTTP.post",
             return_value=_FakeStreamResponse(frames),
         ):
             deltas = list(
@@ -495,7 +606,7 @@ class OllamaConnectorRetryTests(unittest.TestCase):
         connector._read_timeout = 30
 
         with patch(
-            "model.llm_connector.requests.post",
+            "model.llm_connector._HTTP.post",
             side_effect=RuntimeError("backend down"),
         ):
             with self.assertRaisesRegex(RuntimeError, "backend down"):
@@ -517,7 +628,7 @@ class OllamaConnectorRetryTests(unittest.TestCase):
             {"json": lambda self: {"data": [{"id": "loaded-model"}]}},
         )()
 
-        with patch("model.llm_connector.requests.get", return_value=response) as get:
+        with patch("model.llm_connector._HTTP.get", return_value=response) as get:
             models = connector.list_models()
 
         self.assertEqual(models, ["loaded-model"])
@@ -526,6 +637,249 @@ class OllamaConnectorRetryTests(unittest.TestCase):
             timeout=(5, 45),
         )
 
+    def test_ollama_listing_shares_one_tags_fetch(self) -> None:
+        connector = _StubOllamaConnector(chat_results=[])
+        connector.service_url = "http://tags.test:11434"
+        connector._connect_timeout = 5
+        connector._read_timeout = 30
+        response = MagicMock()
+        response.json.return_value = {
+            "models": [{"name": "llama3.2:latest", "size": 2 * 1024 * 1024}]
+        }
+
+        with patch("model.llm_connector._HTTP.get", return_value=response) as get:
+            names = connector.list_models()
+            details = connector.list_model_details()
+
+        get.assert_called_once_with("http://tags.test:11434/api/tags", timeout=(5, 30))
+        self.assertEqual(names, ["llama3.2:latest"])
+        self.assertEqual(details[0]["size_mb"], 2)
+
+    def test_service_urls_normalise_to_scheme_and_authority(self) -> None:
+        from model.llm_connector import _normalise_base_url
+
+        cases = {
+            " 127.0.0.1:1234 ": "http://127.0.0.1:1234",
+            "localhost:11434": "http://localhost:11434",
+            "http://localhost:1234/v1/": "http://localhost:1234",
+            "https://models.test/": "https://models.test",
+            "models.test?debug=1": "http://models.test",
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(_normalise_base_url(raw), expected)
+
+    def test_rest_probes_share_one_pooled_session(self) -> None:
+        import model.llm_connector as llm_connector
+
+        adapter = llm_connector._HTTP.get_adapter("http://127.0.0.1:1234/v1/models")
+
+        self.assertIsInstance(llm_connector._HTTP, llm_connector.requests.Session)
+        self.assertIs(adapter, llm_connector._HTTP.get_adapter("https://example.test/"))
+        self.assertEqual(adapter._pool_maxsize, 16)
+
+    def test_send_prompts_fans_out_and_keeps_order(self) -> None:
+        connector = _FallbackStreamingConnector({"text": "unused"})
+        connector.send_prompt = MagicMock(side_effect=lambda **kwargs: kwargs["prompt"].upper())
+
+        responses = connector.send_prompts(["a", "b", "c"], generation_options={"seed": 1})
+
+        self.assertEqual(responses, ["A", "B", "C"])
+        self.assertEqual(connector.send_prompt.call_count, 3)
+        self.assertEqual(connector._batch_concurrency(10), 4)
+        self.assertEqual(connector.send_prompts([]), [])
+
+    def test_interface_name_is_resolved_at_construction(self) -> None:
+        with patch("model.llm_connector.ChatOpenAI"):
+            connector = LMStudioConnector("model-a", "127.0.0.1:1234")
+
+        self.assertEqual(connector.interface_name(), "LM Studio")
+        self.assertEqual(connector.interface_id(), "lmstudio")
+
+    def test_async_send_caps_inflight_requests_per_connector(self) -> None:
+        import threading
+
+        connector = _FallbackStreamingConnector({"text": "done"})
+        connector.config_mgr = MagicMock()
+        connector.config_mgr.int_config_value.return_value = 2
+        lock = threading.Lock()
+        # Each admitted call waits for a partner, so two are always in flight
+        # together however late the worker threads start.
+        barrier = threading.Barrier(2)
+        active = peak = 0
+
+        def _slow_send(**kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            barrier.wait(timeout=5)
+            with lock:
+                active -= 1
+            return {"text": kwargs["prompt"]}
+
+        connector.send_prompt_with_meta = _slow_send
+
+        async def scenario():
+            return await asyncio.gather(
+                *(connector.asend_prompt_with_meta("U", str(index)) for index in range(4))
+            )
+
+        results = asyncio.run(scenario())
+
+        self.assertEqual([result["text"] for result in results], ["0", "1", "2", "3"])
+        self.assertEqual(peak, 2)
+
+    def test_async_batch_is_gathered_under_the_inflight_cap(self) -> None:
+        import threading
+
+        connector = _FallbackStreamingConnector({"text": "unused"})
+        connector.config_mgr = MagicMock()
+        connector.config_mgr.int_config_value.return_value = 2
+        lock = threading.Lock()
+        barrier = threading.Barrier(2)
+        active = peak = 0
+
+        def _slow_send(**kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            barrier.wait(timeout=5)
+            with lock:
+                active -= 1
+            return {"text": kwargs["prompt"].upper()}
+
+        connector.send_prompt_with_meta = _slow_send
+
+        responses = asyncio.run(connector.asend_prompts(["a", "b", "c", "d"]))
+
+        self.assertEqual(responses, ["A", "B", "C", "D"])
+        self.assertEqual(peak, 2)
+        self.assertEqual(asyncio.run(connector.asend_prompts([])), [])
+
+    def test_lmstudio_send_prompts_uses_session_batch(self) -> None:
+        connector = LMStudioConnector.__new__(LMStudioConnector)
+        connector.logger = _FakeLogger()
+        connector.config_mgr = MagicMock()
+        connector.config_mgr.int_config_value.return_value = 2
+        bound = MagicMock()
+        bound.batch.return_value = [
+            types.SimpleNamespace(content="one"),
+            types.SimpleNamespace(content="two"),
+        ]
+        connector.llm_session = MagicMock()
+        connector.llm_session.bind.return_value = bound
+
+        responses = connector.send_prompts(["p1", "p2"], generation_options={"temperature": 0.2})
+
+        self.assertEqual(responses, ["one", "two"])
+        connector.llm_session.bind.assert_called_once_with(temperature=0.2)
+        bound.batch.assert_called_once_with(["p1", "p2"], config={"max_concurrency": 2})
+
+    def test_lmstudio_send_prompt_returns_text_not_message(self) -> None:
+        connector = LMStudioConnector.__new__(LMStudioConnector)
+        connector.logger = _FakeLogger()
+        connector.llm_session = MagicMock()
+        connector.llm_session.invoke.return_value = types.SimpleNamespace(content="Hello")
+
+        response = connector.send_prompt(prompt_type="U", prompt="Hi")
+
+        self.assertEqual(response, "Hello")
+        self.assertIsInstance(response, str)
+
+    def test_strip_visible_think_skips_regex_when_no_tag(self) -> None:
+        connector = _StubOllamaConnector(chat_results=[])
+
+        with patch("model.llm_connector._THINK_BLOCK_RE") as think_re:
+            self.assertEqual(connector._strip_visible_think("  plain answer "), "plain answer")
+        think_re.sub.assert_not_called()
+        self.assertEqual(connector._strip_visible_think("<think>x</think> hi"), "hi")
+        self.assertEqual(connector._strip_visible_think("ok <think>cut"), "ok")
+
+    def test_lmstudio_streams_deltas_and_reports_final_usage(self) -> None:
+        connector = LMStudioConnector.__new__(LMStudioConnector)
+        connector.logger = _FakeLogger()
+        connector.llm_session = MagicMock()
+        connector.llm_session.stream.return_value = iter(
+            [
+                types.SimpleNamespace(content="Hel", usage_metadata=None),
+                types.SimpleNamespace(content="lo", usage_metadata=None),
+                types.SimpleNamespace(
+                    content="",
+                    usage_metadata={"input_tokens": 5, "output_tokens": 2, "total_tokens": 7},
+                ),
+            ]
+        )
+        usage: list[LLMUsageMetadata] = []
+
+        deltas = list(
+            connector.stream_prompt_deltas(
+                prompt_type="U",
+                prompt="Hi",
+                on_usage_metadata=usage.append,
+            )
+        )
+
+        self.assertEqual(deltas, ["Hel", "lo"])
+        connector.llm_session.stream.assert_called_once_with("Hi")
+        self.assertEqual(
+            (usage[0].prompt_tokens, usage[0].completion_tokens, usage[0].total_tokens),
+            (5, 2, 7),
+        )
+
+    def test_lmstudio_sessions_share_pooled_httpx_clients(self) -> None:
+        with patch("model.llm_connector.ChatOpenAI") as chat_openai:
+            connector = LMStudioConnector("model-a", "127.0.0.1:1234")
+            LMStudioConnector("model-b", "http://remote.test:1234")
+
+        first_kwargs, second_kwargs = (
+            call.kwargs for call in chat_openai.call_args_list
+        )
+        self.assertIs(first_kwargs["http_client"], second_kwargs["http_client"])
+        self.assertIs(first_kwargs["http_async_client"], second_kwargs["http_async_client"])
+        pool = first_kwargs["http_client"]._transport._pool
+        self.assertEqual(pool._max_keepalive_connections, 32)
+        self.assertEqual(pool._max_connections, 64)
+        self.assertEqual(first_kwargs["timeout"].read, connector._read_timeout)
+        self.assertEqual(first_kwargs["timeout"].connect, 5)
+
+    def test_lmstudio_session_times_out_a_slow_response(self) -> None:
+        import http.server
+        import threading
+        import time
+
+        import openai
+
+        chat_openai = _installed_chat_openai()
+        if chat_openai is None:
+            self.skipTest("langchain_openai is not installed")
+        release = threading.Event()
+
+        class _SlowHandler(http.server.BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                release.wait(10)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(release.set)
+
+        with patch("model.llm_connector.ChatOpenAI", chat_openai):
+            connector = LMStudioConnector("model-a", f"127.0.0.1:{server.server_port}")
+            connector._read_timeout = 0.2
+            session = connector._chat_session()
+
+        started = time.monotonic()
+        with self.assertRaises(openai.APITimeoutError):
+            session.invoke("hello")
+        self.assertLess(time.monotonic() - started, 10)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,8 @@
 """Tests for Orac logging utility helpers."""
 # Author: Clive Bostock
 # Date: 2026-06-05
-# Description: Verifies duplicate log sink prevention helpers.
+# Description: Verifies duplicate log sink prevention, log stamping and
+#   call tracing helpers.
 
 from __future__ import annotations
 
@@ -10,6 +11,7 @@ import os
 import sys
 import tempfile
 import unittest
+from unittest.mock import patch
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -17,7 +19,8 @@ SRC_ROOT = PROJECT_ROOT / "src"
 if str(SRC_ROOT) not in sys.path:
     sys.path.insert(0, str(SRC_ROOT))
 
-from lib.logutil import _fd_targets_path
+import lib.logutil as logutil
+from lib.logutil import _fd_targets_path, log_call, log_stamp, set_log_stamping
 
 
 class LogutilTests(unittest.TestCase):
@@ -38,6 +41,84 @@ class LogutilTests(unittest.TestCase):
             os.close(read_fd)
             os.close(write_fd)
 
+    def test_log_stamp_follows_cached_setting(self) -> None:
+        """log_stamp uses the import-time flag, which set_log_stamping overrides."""
+        original = logutil._LOG_STAMPING
+        self.addCleanup(set_log_stamping, original)
+
+        set_log_stamping(False)
+        self.assertEqual(log_stamp(), "")
+
+        set_log_stamping(True)
+        self.assertRegex(log_stamp(), r"^\d{13}_$")
+        self.assertRegex(log_stamp(post_underscore=False, pref_underscore=True), r"^_\d{13}$")
+
+    def test_log_call_only_traces_when_a_sink_accepts_trace(self) -> None:
+        """The decorator skips timing and logging unless TRACE is enabled."""
+        @log_call
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        with patch.object(logutil, "_log_trace") as trace, \
+                patch.object(logutil, "_trace_enabled", return_value=False):
+            self.assertEqual(add(1, 2), 3)
+        trace.assert_not_called()
+
+        with patch.object(logutil, "_log_trace") as trace, \
+                patch.object(logutil, "_trace_enabled", return_value=True):
+            self.assertEqual(add(2, 3), 5)
+        trace.assert_called_once()
+        self.assertIn("Call: add", trace.call_args.args[0])
+
+    def test_trace_enabled_tracks_sink_levels(self) -> None:
+        """_trace_enabled follows sinks being added and removed."""
+        sink_id = logutil.logr.add(lambda message: None, level="TRACE")
+        try:
+            self.assertTrue(logutil._trace_enabled())
+        finally:
+            logutil.logr.remove(sink_id)
+
+    def test_logger_wrappers_prefix_icon_and_skip_disabled_levels(self) -> None:
+        """Level wrappers add the level icon and drop levels no sink accepts."""
+        records: list[tuple[str, str, str]] = []
+        sink_id = logutil.logr.add(
+            lambda message: records.append(
+                (
+                    message.record["level"].name,
+                    message.record["message"],
+                    message.record["function"],
+                )
+            ),
+            level="INFO",
+        )
+        wrapper = logutil.Logger.__new__(logutil.Logger)
+        try:
+            with patch.object(logutil.logr._core, "min_level", logutil.logr.level("INFO").no):
+                wrapper.log_debug("hidden {braces}")
+                wrapper.log_warning("shown {braces}")
+        finally:
+            logutil.logr.remove(sink_id)
+
+        self.assertEqual(
+            records,
+            [
+                (
+                    "WARNING",
+                    f"{logutil.Icons.warn} shown {{braces}}",
+                    "test_logger_wrappers_prefix_icon_and_skip_disabled_levels",
+                )
+            ],
+        )
+
+    def test_is_enabled_for_follows_minimum_sink_level(self) -> None:
+        """is_enabled_for reports whether a level would reach any sink."""
+        wrapper = logutil.Logger.__new__(logutil.Logger)
+
+        with patch.object(logutil.logr._core, "min_level", logutil.logr.level("INFO").no):
+            self.assertFalse(wrapper.is_enabled_for("DEBUG"))
+            self.assertTrue(wrapper.is_enabled_for("INFO"))
+            self.assertTrue(wrapper.is_enabled_for("ERROR"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,143 @@
+"""Tests for OracListener NDJSON framing over a loopback socket."""
+# Author: Clive Bostock
+# Date: 2026-10-16
+# Description: Verifies the listener reads and writes frames beyond asyncio's default limit.
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import json
+from pathlib import Path
+import socket
+import sys
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from lib import frame_codec
+from lib.frame_codec import FRAME_READ_LIMIT, FRAME_WRITE_HIGH_WATER, dumps_frame, loads_frame
+from model import network
+from model.network import OracListener
+
+
+class _EchoOrchestrator:
+    """Orchestrator double that echoes each request frame's payload."""
+
+    async def handle_request(self, message: str) -> dict:
+        return {"type": "response", "payload": json.loads(message)["payload"]}
+
+
+class OracListenerFramingTests(unittest.TestCase):
+    """Tests for frame size handling on a live listener."""
+
+    def _round_trip(self, frame: str) -> bytes:
+        async def scenario() -> bytes:
+            started: asyncio.Future = asyncio.get_running_loop().create_future()
+            real_start_server = asyncio.start_server
+
+            async def _start_server(*args, **kwargs):
+                server = await real_start_server(*args, **kwargs)
+                started.set_result(server)
+                return server
+
+            listener = OracListener(_EchoOrchestrator(), port=0)
+            with patch.object(network.asyncio, "start_server", _start_server):
+                serving = asyncio.create_task(listener.start_server())
+                server = await started
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", port, limit=FRAME_READ_LIMIT
+            )
+            writer.write(frame.encode("utf-8") + b"\n")
+            await writer.drain()
+            response = await reader.readline()
+            writer.close()
+            await writer.wait_closed()
+            serving.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await serving
+            return response
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            return asyncio.run(scenario())
+
+    def test_frames_larger_than_default_stream_limit_round_trip(self) -> None:
+        content = "x" * (256 * 1024)
+        frame = json.dumps({"type": "request", "payload": {"content": content}})
+
+        response = self._round_trip(frame)
+
+        self.assertTrue(response.endswith(b"\n"))
+        self.assertEqual(json.loads(response)["payload"]["content"], content)
+
+
+class WriteFrameTests(unittest.TestCase):
+    """Tests for how OracListener hands frames to the transport."""
+
+    def _write(self, frame, buffered: int, closing: bool = False) -> MagicMock:
+        logger = MagicMock()
+        logger.is_enabled_for.return_value = False
+        writer = MagicMock()
+        writer.drain = AsyncMock()
+        writer.transport.is_closing.return_value = closing
+        writer.transport.get_write_buffer_size.return_value = buffered
+        asyncio.run(OracListener(None, logger=logger)._write_frame(writer, frame))
+        return writer
+
+    def test_frame_is_written_once_with_its_newline(self) -> None:
+        writer = self._write('{"type": "response"}', buffered=0)
+
+        writer.writelines.assert_called_once_with((b'{"type": "response"}', b"\n"))
+        writer.write.assert_not_called()
+        writer.drain.assert_not_awaited()
+
+    def test_drains_only_above_high_water_or_when_closing(self) -> None:
+        backlogged = self._write({"type": "response"}, buffered=FRAME_WRITE_HIGH_WATER + 1)
+        closing = self._write({"type": "response"}, buffered=0, closing=True)
+
+        backlogged.drain.assert_awaited_once()
+        closing.drain.assert_awaited_once()
+
+
+class SocketTuningTests(unittest.TestCase):
+    """Tests for the listener's TCP socket options."""
+
+    def test_tune_socket_disables_nagle_and_tolerates_rejected_options(self) -> None:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            network._tune_socket(sock)
+            self.assertTrue(sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+
+        rejecting = MagicMock(family=socket.AF_INET)
+        rejecting.setsockopt.side_effect = OSError("unsupported")
+        network._tune_socket(rejecting)
+        network._tune_socket(None)
+
+        self.assertEqual(rejecting.setsockopt.call_count, 3)
+
+
+class FrameCodecTests(unittest.TestCase):
+    """Tests for frame encoding parity with the standard library."""
+
+    def test_dumps_frame_emits_utf8_bytes_that_round_trip(self) -> None:
+        envelope = {"type": "response", "payload": {"content": "naïve café ☕", "n": 2}}
+
+        encoded = dumps_frame(envelope)
+        with patch.object(frame_codec, "orjson", None):
+            fallback = dumps_frame(envelope)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertIn("café ☕".encode("utf-8"), encoded)
+        self.assertEqual(loads_frame(encoded), envelope)
+        self.assertEqual(json.loads(fallback), envelope)
+        self.assertEqual(json.loads(dumps_frame({"n": 2**70})), {"n": 2**70})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,17 +6,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 import sys
 import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SRC_ROOT = PROJECT_ROOT / "src"
 if str(SRC_ROOT) not in sys.path:
     sys.path.insert(0, str(SRC_ROOT))
 
-from model.network import _frame_log_summary
+from model.network import OracListener, _frame_log_summary
 
 
 class NetworkLoggingTests(unittest.TestCase):
@@ -46,6 +48,35 @@ class NetworkLoggingTests(unittest.TestCase):
 
         self.assertEqual(summary, "invalid_json bytes=24")
 
+    def test_decoded_envelope_is_summarised_without_reparsing(self) -> None:
+        frame = b'{"type": "response", "id": "res_1"}'
+
+        with patch("model.network.loads_frame") as loads:
+            summary = _frame_log_summary(frame, {"type": "response", "id": "res_1"})
+
+        loads.assert_not_called()
+        self.assertEqual(
+            summary,
+            f"type=response route=unknown id=res_1 reply_to=- bytes={len(frame)}",
+        )
+
+    def test_write_frame_skips_summary_when_debug_is_disabled(self) -> None:
+        logger = MagicMock()
+        logger.is_enabled_for.return_value = False
+        listener = OracListener(orchestrator=None, logger=logger)
+        writer = MagicMock()
+        writer.drain = AsyncMock()
+        writer.transport.is_closing.return_value = False
+        writer.transport.get_write_buffer_size.return_value = 0
+
+        with patch("model.network._frame_log_summary") as summarise:
+            asyncio.run(listener._write_frame(writer, {"type": "response"}))
+
+        summarise.assert_not_called()
+        logger.log_debug.assert_not_called()
+        logger.is_enabled_for.assert_called_once_with("DEBUG")
+        writer.writelines.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -894,12 +894,12 @@ class _FakeDBSession:
         ]
 
     def dict_sql_dataset(self, sql: str, params: dict) -> list[dict]:
-        del params
-        if "order by turn_index desc" in sql and "fetch first 2 rows only" in sql:
-            picked = list(reversed(self.rows))[:2]
+        limit = params.get("lim")
+        if "order by turn_index desc" in sql and "fetch first :lim rows only" in sql:
+            picked = list(reversed(self.rows))[:limit]
             return sorted(picked, key=lambda row: row["TURN_INDEX"])
-        if "fetch first 2 rows only" in sql:
-            return self.rows[:2]
+        if "fetch first :lim rows only" in sql:
+            return self.rows[:limit]
         return list(self.rows)
 
 
@@ -920,6 +920,24 @@ class _SyncCursor:
         self.statements.append((sql, params))
 
 
+class _PruneDBSession:
+    """DB stub recording prune statements; any query would be an extra round trip."""
+
+    def __init__(self, rowcount: int) -> None:
+        self.cursor_obj = _SyncCursor()
+        self.cursor_obj.rowcount = rowcount
+        self.committed = False
+
+    def fetch_as_lists(self, sql: str, params: dict) -> list[list]:
+        raise AssertionError(f"unexpected query: {sql}")
+
+    def cursor(self) -> _SyncCursor:
+        return self.cursor_obj
+
+    def commit(self) -> None:
+        self.committed = True
+
+
 class _SyncDBSession:
     """DB stub for llm registry sync tests."""
 
@@ -1418,6 +1436,24 @@ class OracContextHistoryTests(unittest.IsolatedAsyncioTestCase):
         self.assertIn("Session timezone preference: Europe/Paris.", prompt)
         self.assertIn("answer with the exact HH:MM value", prompt)
 
+    async def test_invalid_frame_is_rejected_before_llm_call(self) -> None:
+        """Frames failing protocol validation never reach the LLM."""
+        orchestrator = self._make_orac_stub(llm_responses=["unused"])
+
+        def reject(env: dict) -> None:
+            raise ValueError("Protocol validation failed: payload: bad shape")
+
+        orac_module.validate_frame = reject
+
+        wire = await orchestrator.handle_request(
+            self._request("Hello", req_id="req-invalid")
+        )
+        response = json.loads(wire)
+
+        self.assertEqual(response["error"]["code"], "INVALID_FRAME")
+        self.assertEqual(response["reply_to"], "req-invalid")
+        self.assertEqual(orchestrator.llm.prompts, [])
+
     async def test_direct_time_query_bypasses_llm(self) -> None:
         """Direct local time questions should be answered from runtime clock data."""
         orchestrator = self._make_orac_stub(
@@ -1573,6 +1609,21 @@ class OracContextHistoryTests(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn("hidden reasoning", content)
         self.assertNotIn("<think>", content)
 
+    def test_strip_reasoning_tags_handles_closed_dangling_and_plain_text(self) -> None:
+        """Closed blocks are removed and a dangling <think> drops the remainder."""
+        orchestrator = Orac.__new__(Orac)
+
+        self.assertEqual(
+            orchestrator._strip_reasoning_tags("A <think>x\ny</think>B "),
+            "A B",
+        )
+        self.assertEqual(
+            orchestrator._strip_reasoning_tags("Answer <THINK>unfinished"),
+            "Answer",
+        )
+        self.assertEqual(orchestrator._strip_reasoning_tags("  plain  "), "plain")
+        self.assertEqual(orchestrator._strip_reasoning_tags(None), "")
+
     async def test_streaming_reasoning_stripping_is_chunk_boundary_safe(self) -> None:
         """Streaming removal should handle split <think> tags safely."""
         context_manager = _MemoryContextManager()
@@ -3921,6 +3972,31 @@ class OracContextManagerLoadTests(unittest.TestCase):
         self.assertEqual([row["TURN_INDEX"] for row in rows], [4, 5])
         self.assertEqual([row["CONTENT"]["text"] for row in rows], ["four", "five"])
 
+    def test_load_context_binds_the_row_limit(self) -> None:
+        db = _FakeDBSession()
+        manager = OracContextManager(db=db, logger=_FakeLogger())
+        manager._conversation_id = lambda session_id: 1  # type: ignore[method-assign]
+
+        with patch.object(db, "dict_sql_dataset", wraps=db.dict_sql_dataset) as query:
+            manager.load_context(session_id="clive", limit=3)
+
+        sql, params = query.call_args.args
+        self.assertIn("fetch first :lim rows only", sql)
+        self.assertEqual(params, {"cid": 1, "lim": 3})
+
+    def test_prune_context_deletes_in_a_single_statement(self) -> None:
+        db = _PruneDBSession(rowcount=7)
+        manager = OracContextManager(db=db, logger=_FakeLogger())
+        manager._conversation_id = lambda session_id: 1  # type: ignore[method-assign]
+
+        deleted = manager.prune_context("clive", keep_messages=20)
+
+        self.assertEqual(deleted, 7)
+        self.assertTrue(db.committed)
+        ((sql, params),) = db.cursor_obj.statements
+        self.assertIn("select max(turn_index) - :keep", sql)
+        self.assertEqual(params, {"cid": 1, "keep": 20})
+
     def test_timeout_reuses_recent_open_conversation(self) -> None:
         recent_ts = datetime.now(timezone.utc) - timedelta(seconds=30)
         manager = OracContextManager(db=_TimeoutDBSession(recent_ts), logger=_FakeLogger())
@@ -23,14 +23,17 @@ from model.plugin_resources import PluginResourceError, resource_reader_for_mani
 from model.plugin_router import PluginRouter
 import model.plugin_router as plugin_router_module
 from model.plugin_routing.interception import (
+    InterceptNormalisation,
     InterceptRule,
     MAX_INTERCEPT_INPUT_CHARS,
     PluginDialogInterceptor,
     PluginInterceptionMetadataError,
     freeze_mapping,
     mutable_mapping,
+    normalise_text,
     route_candidate_from_intercept,
 )
+import model.plugin_routing.interception as interception_module
 from model.plugin_routing.models import (
     PluginExecutionPolicy,
     PluginManifest,
@@ -227,6 +230,18 @@ class PluginDialogInterceptionTests(unittest.TestCase):
             interceptor.intercept("a" * (MAX_INTERCEPT_INPUT_CHARS + 1))
         )
 
+    def test_normalisation_replacements_are_compiled_once(self) -> None:
+        normalisation = InterceptNormalisation(replacements={"lounge": "living room"})
+        pattern_cache = interception_module._whole_word_pattern
+        pattern_cache.cache_clear()
+
+        first = normalise_text("Turn on the LOUNGE lights!", normalisation)
+        second = normalise_text("lounge, loungers", normalisation)
+
+        self.assertEqual(first, "turn on the living room lights")
+        self.assertEqual(second, "living room loungers")
+        self.assertEqual(pattern_cache.cache_info().misses, 1)
+
     def test_capability_and_intent_are_derived_from_manifest(self) -> None:
         manifest = _manifest(capability_id="alpha.changed_capability")
         interceptor = _ExampleInterceptor(
@@ -461,6 +461,46 @@ class ProtocolContractTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             validate_frame(frame)
 
+    def test_date_time_format_is_annotation_only(self) -> None:
+        """The compiled validator keeps jsonschema's non-asserting format default."""
+        frame = {
+            "v": 1,
+            "type": "text_delta",
+            "id": "evt-loose-ts",
+            "reply_to": "req-contract",
+            "ts": "not-a-timestamp",
+            "route": "orac.prompt",
+            "meta": {"status": "ok", "model": "test-model"},
+            "payload": {"delta": "Hel"},
+            "error": None,
+        }
+
+        validate_frame(frame)
+
+    def test_fallback_validator_resolves_refs_through_shared_registry(self) -> None:
+        """Without the compiled validator, jsonschema uses the shared registry."""
+        from orac_protocol import validator
+
+        frame = {
+            "v": 1,
+            "type": "text_delta",
+            "id": "evt-fallback",
+            "reply_to": "req-contract",
+            "ts": "2026-05-24T10:00:00Z",
+            "route": "orac.prompt",
+            "meta": {"status": "ok", "model": "test-model"},
+            "payload": {"delta": "Hel"},
+            "error": None,
+        }
+        schema_id = validator._get_schema()["$id"]
+
+        with patch.object(validator, "_get_fast_validator", lambda: None):
+            validate_frame(frame)
+            with self.assertRaises(ValueError):
+                validate_frame({**frame, "type": "not-a-frame-type"})
+
+        self.assertIn(schema_id, validator._get_registry())
+
 
 if __name__ == "__main__":
     unittest.main()
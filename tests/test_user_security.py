@@ -0,0 +1,385 @@
+"""Tests for Orac credential encryption helpers."""
+# Author: Clive Bostock
+# Date: 2026-10-16
+# Description: Verifies machine-id caching and credential encryption round trips.
+
+from __future__ import annotations
+
+from base64 import b64decode, b64encode
+from concurrent.futures import ThreadPoolExecutor
+import configparser
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers import aead as aead_module
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+import lib.user_security as user_security
+
+
+class SystemIdTests(unittest.TestCase):
+    """Tests for the cached machine identifier."""
+
+    def setUp(self) -> None:
+        user_security._system_id.cache_clear()
+        self.addCleanup(user_security._system_id.cache_clear)
+
+    def test_system_id_is_looked_up_once(self) -> None:
+        """Repeated calls, and MACHINE_ID, reuse the first lookup."""
+        with patch.object(user_security.platform, "system", return_value="Linux"), \
+                patch.object(user_security.Path, "read_text", return_value="0123456789abcdef\n") as read, \
+                patch.object(user_security.subprocess, "run") as run:
+            first = user_security._system_id()
+            second = user_security._system_id()
+            machine_id = user_security.MACHINE_ID
+
+        self.assertEqual(read.call_count, 1)
+        run.assert_not_called()
+        self.assertEqual(first, "0123456789abcdef\n")
+        self.assertEqual(second, first)
+        self.assertEqual(machine_id, first)
+
+    def test_macos_uuid_is_parsed_from_ioreg_output(self) -> None:
+        """The IOPlatformUUID is extracted in-process from a single ioreg call."""
+        ioreg_output = (
+            b'+-o J316sAP  <class IOPlatformExpertDevice>\n'
+            b'    "IOPlatformSerialNumber" = "C02XYZ"\n'
+            b'    "IOPlatformUUID" = "6A1B2C3D-0000-1111-2222-333344445555"\n'
+        )
+        with patch.object(user_security.platform, "system", return_value="Darwin"), \
+                patch.object(user_security.subprocess, "run") as run:
+            run.return_value.stdout = ioreg_output
+            system_id = user_security._system_id()
+
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(system_id, "6A1B2C3D-0000-1111-2222-333344445555")
+
+    def test_unsupported_platform_is_rejected(self) -> None:
+        """Platforms without a reader raise UnsupportedPlatform."""
+        with patch.object(user_security.platform, "system", return_value="Plan9"):
+            with self.assertRaises(user_security.UnsupportedPlatform):
+                user_security._system_id()
+
+    def test_windows_reads_the_smbios_uuid(self) -> None:
+        """The Windows reader strips the PowerShell output."""
+        with patch.object(user_security.subprocess, "run") as run:
+            run.return_value.stdout = "4C4C4544-0042-3510-8052-B4C04F4E4D32\r\n"
+
+            self.assertEqual(user_security._system_id_windows(), "4C4C4544-0042-3510-8052-B4C04F4E4D32")
+
+    def test_import_defers_cryptography(self) -> None:
+        """Importing the module loads neither cryptography nor the machine id."""
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1]); import lib.user_security as us; "
+            "print(any(name.startswith('cryptography') for name in sys.modules), us._system_id.cache_info().currsize)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, str(SRC_ROOT)], capture_output=True, text=True, check=True
+        )
+
+        self.assertEqual(result.stdout.split(), ["False", "0"])
+
+    def test_default_password_round_trip_uses_machine_id(self) -> None:
+        """Credentials encrypted with the default key decrypt with it too."""
+        encrypted = user_security.encrypted_user_credential("orac-user")
+
+        self.assertNotEqual(encrypted, "orac-user")
+        self.assertEqual(user_security.decrypted_user_credential(encrypted), "orac-user")
+
+
+    def test_secrets_match_compares_in_constant_time(self) -> None:
+        """secrets_match defers to hmac.compare_digest and handles non-ASCII secrets."""
+        with patch.object(user_security.hmac, "compare_digest", wraps=user_security.hmac.compare_digest) as compare:
+            self.assertTrue(user_security.secrets_match("pässword", "pässword"))
+            self.assertFalse(user_security.secrets_match("pässword", "password"))
+
+        self.assertEqual(compare.call_count, 2)
+
+
+class KeyDerivationCacheTests(unittest.TestCase):
+    """Tests for the memoised PBKDF2 key derivation."""
+
+    def setUp(self) -> None:
+        user_security._derive_key.__wrapped__.cache_clear()
+        self.addCleanup(user_security._derive_key.__wrapped__.cache_clear)
+
+    def test_repeated_decrypt_derives_key_once(self) -> None:
+        """Decrypting the same credential twice runs PBKDF2 only once."""
+        encrypted = user_security.encrypted_user_credential("orac-pass", "pw")
+        user_security._derive_key.__wrapped__.cache_clear()
+
+        with patch.object(user_security.hashlib, "pbkdf2_hmac", wraps=user_security.hashlib.pbkdf2_hmac) as kdf:
+            for _ in range(3):
+                self.assertEqual(user_security.decrypted_user_credential(encrypted, "pw"), "orac-pass")
+
+        self.assertEqual(kdf.call_count, 1)
+
+    def test_repeated_decrypt_reuses_the_cipher(self) -> None:
+        """The AES-GCM object for a derived key is built once and reused."""
+        encrypted = user_security.encrypted_user_credential("orac-pass", "pw")
+        user_security._aead_for.cache_clear()
+
+        with patch.object(aead_module, "AESGCM", wraps=aead_module.AESGCM) as aead:
+            for _ in range(3):
+                self.assertEqual(user_security.decrypted_user_credential(encrypted, "pw"), "orac-pass")
+
+        self.assertEqual(aead.call_count, 1)
+
+    def test_encrypting_does_not_fill_the_cipher_cache(self) -> None:
+        """Encryption keys are salted afresh each time, so their ciphers are not cached."""
+        user_security._aead_for.cache_clear()
+
+        for _ in range(3):
+            user_security.encrypted_user_credential("orac-pass", "pw")
+
+        self.assertEqual(user_security._aead_for.cache_info().currsize, 0)
+
+    def test_pbkdf2_key_matches_the_hazmat_derivation(self) -> None:
+        """The native hashlib derivation reproduces keys from the original hazmat KDF."""
+        salt = bytes(range(16))
+        reference = PBKDF2HMAC(
+            algorithm=hashes.SHA256(), length=32, salt=salt, iterations=100000
+        ).derive(b"orac-password")
+
+        self.assertEqual(user_security._derive_key("orac-password", salt), reference)
+
+    def test_machine_keyed_credentials_use_hkdf_and_legacy_ones_still_decrypt(self) -> None:
+        """Default-key values are tagged and skip PBKDF2; untagged values keep working."""
+        machine_id = user_security._system_id()
+        legacy = user_security._data_encrypt("old-secret", machine_id)
+
+        with patch.object(user_security.hashlib, "pbkdf2_hmac", wraps=user_security.hashlib.pbkdf2_hmac) as kdf:
+            encrypted = user_security.encrypted_user_credential("new-secret")
+            self.assertEqual(user_security.decrypted_user_credential(encrypted), "new-secret")
+
+        kdf.assert_not_called()
+        self.assertTrue(encrypted.startswith(user_security._MACHINE_KEY_TAG))
+        self.assertEqual(user_security.decrypted_user_credential(legacy), "old-secret")
+        self.assertFalse(user_security.encrypted_user_credential("x", "pw").startswith("v2:"))
+
+    def test_machine_master_key_is_extracted_once(self) -> None:
+        """Per-credential machine keys expand one cached master key and differ by salt."""
+        for cached in (user_security._machine_master_key, user_security._derive_machine_key.__wrapped__):
+            cached.cache_clear()
+            self.addCleanup(cached.cache_clear)
+
+        with patch.object(user_security.hmac, "new", wraps=user_security.hmac.new) as extract:
+            first = user_security._derive_machine_key("machine", bytes(16))
+            second = user_security._derive_machine_key("machine", bytes(range(16)))
+
+        self.assertEqual(extract.call_count, 1)
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(first), 32)
+
+    def test_instance_cache_is_keyed_by_password(self) -> None:
+        """A cached plaintext is not returned for a different password."""
+        security = user_security.UserSecurity.__new__(user_security.UserSecurity)
+        security._decrypt_cached = user_security.lru_cache(maxsize=128)(user_security.decrypted_user_credential)
+        encrypted = user_security.encrypted_user_credential("orac-pass", "pw")
+
+        self.assertEqual(security.decrypted_user_credential(encrypted, "pw"), "orac-pass")
+        with self.assertRaises(InvalidTag):
+            security.decrypted_user_credential(encrypted, "wrong-pw")
+
+
+
+class CredentialFramingTests(unittest.TestCase):
+    """Tests for the stored salt/IV/tag/ciphertext layout."""
+
+    def test_values_from_the_cipher_api_still_decrypt(self) -> None:
+        """Blobs framed salt + IV + tag + ciphertext by the old Cipher code still read back."""
+        salt, iv = bytes(16), bytes(range(12))
+        key = user_security._derive_key("pw", salt)
+        encryptor = Cipher(algorithms.AES(key), modes.GCM(iv)).encryptor()
+        ciphertext = encryptor.update(b"orac-secret") + encryptor.finalize()
+        legacy = b64encode(salt + iv + encryptor.tag + ciphertext).decode("utf-8")
+
+        self.assertEqual(user_security._data_decrypt(legacy, "pw"), "orac-secret")
+        self.assertEqual(
+            b64decode(user_security._encrypt_with_key("orac-secret", salt, key))[:16], salt
+        )
+
+
+
+class LegacyDarwinCredentialTests(unittest.TestCase):
+    """Tests for macOS credentials saved under the old, empty machine id."""
+
+    MAC_UUID = "6A1B2C3D-0000-1111-2222-333344445555"
+
+    def setUp(self) -> None:
+        for patcher in (
+            patch.object(user_security.platform, "system", return_value="Darwin"),
+            patch.object(user_security, "machine_id", return_value=self.MAC_UUID),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_value_encrypted_with_empty_id_still_decrypts(self) -> None:
+        """An untagged value encrypted with '' reads back and is flagged for re-encryption."""
+        legacy = user_security._data_encrypt("old-secret", "")
+
+        self.assertEqual(user_security.decrypted_user_credential(legacy), "old-secret")
+        self.assertEqual(user_security.decrypted_machine_credential(legacy), ("old-secret", True))
+        current = user_security.encrypted_user_credential("new-secret")
+        self.assertEqual(user_security.decrypted_machine_credential(current), ("new-secret", False))
+
+    def test_empty_id_fallback_is_macos_only(self) -> None:
+        """Other platforms never encrypted with '', so a mismatch still fails."""
+        legacy = user_security._data_encrypt("old-secret", "")
+
+        with patch.object(user_security.platform, "system", return_value="Linux"):
+            with self.assertRaises(InvalidTag):
+                user_security.decrypted_user_credential(legacy)
+
+    def test_stored_credential_is_re_encrypted_under_the_machine_id(self) -> None:
+        """Reading a legacy value through UserSecurity rewrites it in the new format."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with patch.dict(os.environ, {"HOME": tmp.name}):
+            security = user_security.UserSecurity(project_identifier="orac", resource_type="dsn")
+        legacy = user_security._data_encrypt("orac-pass", "")
+        security.user_config_file_path.write_text(f"[orac]\npassword = {legacy}\n", encoding="utf-8")
+
+        self.assertEqual(security.decrypted_password("orac"), "orac-pass")
+
+        stored = security._user_credential_value("orac", "password")
+        self.assertTrue(stored.startswith(user_security._MACHINE_KEY_TAG))
+        self.assertEqual(user_security.decrypted_machine_credential(stored), ("orac-pass", False))
+        self.assertEqual(security.decrypted_password("orac"), "orac-pass")
+
+
+class CredentialFileCacheTests(unittest.TestCase):
+    """Tests for UserSecurity's cached parse of the credentials file."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        home = patch.dict(os.environ, {"HOME": tmp.name})
+        home.start()
+        self.addCleanup(home.stop)
+        self.security = user_security.UserSecurity(project_identifier="orac", resource_type="dsn")
+        self.path = self.security.user_config_file_path
+        self.path.write_text("[orac]\nresource_id = db:1521/svc\n", encoding="utf-8")
+
+    def test_unchanged_file_is_read_once(self) -> None:
+        """Repeated lookups reuse the parse until the file changes."""
+        with patch.object(user_security.fast_ini, "load", wraps=user_security.fast_ini.load) as read:
+            self.assertEqual(self.security.connection_property("orac", "resource_id"), "db:1521/svc")
+            self.assertEqual(self.security._user_credential_value("orac", "resource_id"), "db:1521/svc")
+            self.assertEqual(read.call_count, 1)
+
+            self.path.write_text("[orac]\nresource_id = other-host:1521/svc\n", encoding="utf-8")
+            self.assertEqual(
+                self.security.connection_property("orac", "resource_id"), "other-host:1521/svc"
+            )
+            self.assertEqual(read.call_count, 2)
+
+    def test_writes_refresh_the_cached_parse(self) -> None:
+        """An entry written through the instance is visible without re-reading the file."""
+        with patch("builtins.print"):
+            self.security._update_credential_entry("orac", "wallet_zip_path", "/w.zip")
+
+        with patch.object(user_security.fast_ini, "load") as read:
+            self.assertEqual(self.security.connection_property("orac", "wallet_zip_path"), "/w.zip")
+
+        read.assert_not_called()
+        self.assertIn("wallet_zip_path = /w.zip", self.path.read_text(encoding="utf-8"))
+
+    def test_update_named_connection_writes_the_file_once(self) -> None:
+        """All entries of a saved connection land in a single write."""
+        with patch("builtins.print"), \
+                patch.object(self.security, "_save_sections", wraps=self.security._save_sections) as write:
+            self.security.update_named_connection({
+                "resource_type": "dsn",
+                "connection_name": "spare",
+                "username": "scott",
+                "password": "tiger",
+                "resource_id": "db2:1521/svc",
+                "wallet_zip_path": "/w.zip",
+            })
+
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(self.security.named_connection_creds("spare"), ("scott", "tiger", "db2:1521/svc"))
+        self.assertEqual(self.security.connection_property("spare", "wallet_zip_path"), "/w.zip")
+
+    def test_write_replaces_file_atomically_and_keeps_mode(self) -> None:
+        """Writes go through a synced temporary file and keep the file's permissions."""
+        self.path.chmod(0o640)
+
+        with patch("builtins.print"), \
+                patch.object(user_security.fast_ini.os, "fsync", wraps=user_security.fast_ini.os.fsync) as fsync:
+            self.security._update_credential_entry("orac", "wallet_zip_path", "/w.zip")
+
+        fsync.assert_called_once()
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o640)
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+    def test_written_file_stays_readable_by_configparser(self) -> None:
+        """Files saved through fast_ini keep configparser's layout and key casing."""
+        with patch("builtins.print"):
+            self.security._write_entries("spare", {"Resource_ID": "db2:1521/svc", "wallet_zip_path": "/w%20.zip"})
+
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read(self.path, encoding="utf-8")
+        self.assertEqual(parser.sections(), ["orac", "spare"])
+        self.assertEqual(parser.get("spare", "resource_id"), "db2:1521/svc")
+        self.assertEqual(self.security.connection_property("spare", "RESOURCE_ID"), "db2:1521/svc")
+        self.assertEqual(self.security.connection_property("spare", "wallet_zip_path"), "/w%20.zip")
+
+    def test_decryption_cache_is_bounded_and_clearable(self) -> None:
+        """Decrypted values are cached up to a limit and dropped by clear_cache()."""
+        encrypted = user_security.encrypted_user_credential("orac-pass", "pw")
+
+        self.assertEqual(self.security.decrypted_user_credential(encrypted, "pw"), "orac-pass")
+        self.assertEqual(self.security.decrypted_user_credential(encrypted, "pw"), "orac-pass")
+        info = self.security._decrypt_cached.cache_info()
+        self.assertEqual((info.hits, info.currsize, info.maxsize), (1, 1, 128))
+
+        self.security.clear_cache()
+
+        self.assertEqual(self.security._decrypt_cached.cache_info().currsize, 0)
+
+    def test_deleted_file_is_reported_without_extra_checks(self) -> None:
+        """Lookups that need the file still raise once it has been removed."""
+        self.security.connection_property("orac", "resource_id")
+        self.path.unlink()
+
+        self.assertIsNone(self.security.connection_property("orac", "resource_id"))
+        with self.assertRaises(FileNotFoundError):
+            self.security._user_credential_value("orac", "resource_id")
+        with self.assertRaises(FileNotFoundError):
+            self.security.named_connection_creds("orac")
+
+    def test_concurrent_get_shares_one_instance(self) -> None:
+        """Threads racing on first use of get() all receive the same instance."""
+        key = ("orac-threads", "dsn")
+        self.addCleanup(user_security.UserSecurity._instances.pop, key, None)
+        barrier = threading.Barrier(8)
+
+        def fetch() -> user_security.UserSecurity:
+            barrier.wait()
+            return user_security.UserSecurity.get(*key)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(lambda _: fetch(), range(8)))
+
+        self.assertEqual(len({id(instance) for instance in instances}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()